@@ -1,5 +1,8 @@
 from argparse import ArgumentParser, HelpFormatter
-from contextlib import contextmanager
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager, nullcontext
+from hashlib import sha256
 from cryptography.hazmat.primitives import serialization
 from importlib.util import module_from_spec, spec_from_file_location
 from json import loads as json_loads
@@ -9,14 +12,41 @@ from os import environ, getcwd
 from pathlib import Path
 from snowflake.connector import connect
 from string import ascii_uppercase, digits
+from threading import Lock
 from time import perf_counter
 from traceback import TracebackException
-
-from snowddl.blueprint import Ident, ObjectType
+from pydantic import BaseModel
+from typing import Optional, Set
+
+from snowddl.blueprint import (
+    AbstractIdent,
+    AccountGrant,
+    DatabaseBlueprint,
+    DatabaseIdent,
+    FutureGrant,
+    Grant,
+    Ident,
+    ObjectType,
+)
+from snowddl.cache import ConfigCache
 from snowddl.config import SnowDDLConfig
 from snowddl.engine import SnowDDLEngine
-from snowddl.parser import default_parse_sequence, DirectoryScanner, PermissionModelParser, PlaceholderParser
-from snowddl.resolver import default_resolve_sequence, default_destroy_sequence
+from snowddl.parser import (
+    default_parse_sequence,
+    default_parse_object_types,
+    default_parse_dependencies,
+    cross_database_object_types,
+    DirectoryScanner,
+    PermissionModelParser,
+    PlaceholderParser,
+)
+from snowddl.parser._yaml import fernet_wrapper
+from snowddl.resolver import (
+    default_resolve_sequence,
+    default_destroy_sequence,
+    default_resolve_dependencies,
+    default_destroy_dependencies,
+)
 from snowddl.settings import SnowDDLSettings
 from snowddl.validator import default_validate_sequence
 from snowddl.version import __version__
@@ -31,8 +61,19 @@ class BaseApp:
     resolve_sequence = default_resolve_sequence
     destroy_sequence = default_destroy_sequence
 
+    parse_object_types = default_parse_object_types
+    parse_dependencies = default_parse_dependencies
+
+    resolve_dependencies = default_resolve_dependencies
+    destroy_dependencies = default_destroy_dependencies
+
+    # Blueprints cannot be changed after config was loaded, helps to detect accidental changes in custom resolvers
+    freeze_blueprints = False
+
     def __init__(self):
         self.elapsed_timers = {}
+        self._elapsed_timers_lock = Lock()
+        self.critical_path = None
 
         self.arg_parser = self.init_arguments_parser()
         self.args = self.init_arguments()
@@ -44,6 +85,9 @@ class BaseApp:
             self.config = self.init_config()
             self.settings = self.init_settings()
 
+            if self.freeze_blueprints or self.args.get("freeze_blueprints"):
+                self.config.freeze_blueprints()
+
     def init_arguments_parser(self):
         formatter = lambda prog: HelpFormatter(prog, max_help_position=36)
 
@@ -129,6 +173,42 @@ class BaseApp:
         parser.add_argument(
             "--max-workers", help="Maximum number of workers to resolve objects in parallel", default=None, type=int
         )
+        parser.add_argument(
+            "--max-connections",
+            help="Maximum number of Snowflake sessions shared by workers (default: 1)",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--max-async-queries",
+            help="Maximum number of GRANT and COMMENT queries executed asynchronously at the same time (default: 0, disabled)",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--max-statements-per-request",
+            help="Maximum number of GRANT and COMMENT queries joined into a single multi-statement request (default: 1, disabled)",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--max-concurrent-resolvers",
+            help="Maximum number of independent resolvers executed at the same time (default: 1, disabled)",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--max-parse-processes",
+            help="Maximum number of processes to parse config files in parallel (default: 1, disabled)",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--freeze-blueprints",
+            help="Reject changes of blueprints after config was loaded, helps to detect accidental changes in custom resolvers",
+            default=False,
+            action="store_true",
+        )
         parser.add_argument(
             "--query-tag",
             help="Add QUERY_TAG to all queries produced by SnowDDL",
@@ -158,6 +238,12 @@ class BaseApp:
         parser.add_argument(
             "--placeholder-values", help="Environment-specific placeholder values in JSON format", default=None, metavar=""
         )
+        parser.add_argument(
+            "--config-cache-path",
+            help="Path to private directory with cache of parsed config, config is parsed again only if files were changed",
+            default=None,
+            metavar="",
+        )
 
         # Object types
         parser.add_argument(
@@ -169,6 +255,38 @@ class BaseApp:
             default=None,
             metavar="",
         )
+        parser.add_argument(
+            "--include-databases",
+            help="Comma-separated list of databases TO resolve, schema objects of other databases are parsed only if referenced",
+            default=None,
+            metavar="",
+        )
+
+        # Metadata
+        parser.add_argument(
+            "--bulk-metadata",
+            help="Retrieve existing schema objects with one SHOW command per database instead of one command per schema",
+            default=False,
+            action="store_true",
+        )
+        parser.add_argument(
+            "--bulk-grants",
+            help="Retrieve grants of all roles from ACCOUNT_USAGE instead of SHOW GRANTS for each role, requires warehouse, "
+            "plan only: ACCOUNT_USAGE may lag behind by up to 2 hours, so recent grant changes might be missing",
+            default=False,
+            action="store_true",
+        )
+        parser.add_argument(
+            "--snapshot-path",
+            help="Directory for local snapshot of existing objects, which is reused while probe detects no changes in database",
+            default=None,
+        )
+        parser.add_argument(
+            "--snapshot-ttl",
+            help="Maximum age of local snapshot of existing objects in seconds (default: 3600)",
+            default=None,
+            type=int,
+        )
 
         # Apply even more unsafe changes
         parser.add_argument(
@@ -255,6 +373,21 @@ class BaseApp:
             action="store_true",
         )
 
+        # Role hierarchy
+        parser.add_argument(
+            "--analyze-role-graph",
+            help="Report grants already implied through inherited roles and size of role graph",
+            default=False,
+            action="store_true",
+        )
+        parser.add_argument(
+            "--minimize-role-grants",
+            help="Do not create new grants already implied through inherited roles, existing grants are never revoked, "
+            "implies --analyze-role-graph",
+            default=False,
+            action="store_true",
+        )
+
         # Cloning
         parser.add_argument(
             "--clone-table",
@@ -359,41 +492,45 @@ class BaseApp:
         return config_path.resolve()
 
     def init_config(self):
-        config = SnowDDLConfig(self.env_prefix)
-        scanner = DirectoryScanner(self.config_path)
+        parse_sequence = self.get_scoped_parse_sequence()
+        parse_databases = self.get_scoped_parse_databases()
 
-        parser_error_count = 0
-        validator_error_count = 0
+        scanner = self.init_scanner(parse_databases)
 
-        # Placeholders
         placeholder_path = self.get_placeholder_path()
         placeholder_values = self.get_placeholder_values()
 
-        parser = PlaceholderParser(config, scanner)
-        parser.load_placeholders(placeholder_path, placeholder_values, self.args)
+        # Fully built config is reused if config files, placeholders and SnowDDL version did not change
+        config_cache = self.get_config_cache(scanner, placeholder_path, placeholder_values, parse_sequence, parse_databases)
 
-        if parser.errors:
-            self.logger.error(f"Execution halted due to [{len(parser.errors)}] error(s) in placeholders parser")
-            exit(1)
+        if config_cache:
+            cached = config_cache.load()
 
-        # Permission models
-        parser = PermissionModelParser(config, scanner)
-        parser.load_permission_models()
+            if cached:
+                config, unused_file_paths = cached
 
-        if parser.errors:
-            self.logger.error(f"Execution halted due to [{len(parser.errors)}] error(s) in permission models parser")
-            exit(1)
+                if self.args.get("show_unused_files"):
+                    self.output_unused_file_warnings(unused_file_paths)
 
-        # All blueprints
-        for parser_cls in self.parse_sequence:
-            parser = parser_cls(config, scanner)
-            parser.load_blueprints()
+                return config
 
-            parser_error_count += len(parser.errors)
+        config = self.parse_blueprints(scanner, parse_sequence, placeholder_path, placeholder_values)
 
-        if parser_error_count:
-            self.logger.error(f"Execution halted due to [{parser_error_count}] error(s) in config parsers")
-            exit(1)
+        # Objects in other databases referenced by scoped objects (e.g. views, streams, tasks) are parsed as well
+        while parse_databases is not None:
+            referenced_databases = self.get_referenced_databases(config, parse_databases)
+
+            if not referenced_databases:
+                break
+
+            self.logger.info(f"Schema objects of referenced databases {sorted(referenced_databases)} are parsed as well")
+
+            parse_databases = parse_databases + sorted(referenced_databases)
+            scanner = self.init_scanner(parse_databases)
+
+            config = self.parse_blueprints(scanner, parse_sequence, placeholder_path, placeholder_values)
+
+        validator_error_count = 0
 
         # Custom programmatically generated blueprints and config adjustments
         for module_path in sorted(self.config_path.glob("__custom/*.py")):
@@ -423,8 +560,201 @@ class BaseApp:
         if self.args.get("show_unused_files"):
             self.output_unused_file_warnings(scanner.get_unused_file_paths())
 
+        if config_cache:
+            config_cache.save(config, scanner.get_unused_file_paths())
+
         return config
 
+    def init_scanner(self, parse_databases: Optional[list]):
+        return DirectoryScanner(self.config_path, parse_databases, cross_database_object_types)
+
+    def parse_blueprints(
+        self,
+        scanner: DirectoryScanner,
+        parse_sequence: list,
+        placeholder_path: Optional[Path],
+        placeholder_values: Optional[dict],
+    ):
+        config = SnowDDLConfig(self.env_prefix)
+        parser_error_count = 0
+
+        # Placeholders
+        parser = PlaceholderParser(config, scanner)
+        parser.load_placeholders(placeholder_path, placeholder_values, self.args)
+
+        if parser.errors:
+            self.logger.error(f"Execution halted due to [{len(parser.errors)}] error(s) in placeholders parser")
+            exit(1)
+
+        # Permission models
+        parser = PermissionModelParser(config, scanner)
+        parser.load_permission_models()
+
+        if parser.errors:
+            self.logger.error(f"Execution halted due to [{len(parser.errors)}] error(s) in permission models parser")
+            exit(1)
+
+        # All blueprints
+        with self.get_parse_executor() as executor:
+            for parser_cls in parse_sequence:
+                parser = parser_cls(config, scanner, executor)
+                parser.load_blueprints()
+
+                parser_error_count += len(parser.errors)
+
+        if parser_error_count:
+            self.logger.error(f"Execution halted due to [{parser_error_count}] error(s) in config parsers")
+            exit(1)
+
+        return config
+
+    def get_referenced_databases(self, config: SnowDDLConfig, parse_databases: list) -> Set[str]:
+        parse_database_keys = {d.lower() for d in parse_databases}
+        referenced_databases = set()
+
+        for blueprints in config.blueprints.values():
+            for bp in blueprints.values():
+                # Database and schema params of other databases are always parsed, but they do not extend the scope
+                if getattr(bp.full_name, "database", None) and bp.full_name.database.lower() not in parse_database_keys:
+                    continue
+
+                self.collect_referenced_databases(bp, referenced_databases)
+
+        # Databases which do not exist in config (e.g. SNOWFLAKE) cannot be parsed
+        config_database_keys = {bp.full_name.database.lower() for bp in config.get_blueprints_by_type(DatabaseBlueprint).values()}
+
+        return {d for d in referenced_databases if d.lower() in config_database_keys and d.lower() not in parse_database_keys}
+
+    def collect_referenced_databases(self, value, referenced_databases: Set[str]):
+        if isinstance(value, AbstractIdent):
+            if getattr(value, "database", None):
+                referenced_databases.add(value.database)
+        elif isinstance(value, (Grant, FutureGrant, AccountGrant)):
+            # Grants are built only for parsed objects, objects in other databases are never required for grants
+            return
+        elif isinstance(value, BaseModel):
+            for field_name in value.__class__.model_fields:
+                self.collect_referenced_databases(getattr(value, field_name), referenced_databases)
+        elif isinstance(value, dict):
+            for k, v in value.items():
+                self.collect_referenced_databases(k, referenced_databases)
+                self.collect_referenced_databases(v, referenced_databases)
+        elif isinstance(value, (list, tuple, set)):
+            for v in value:
+                self.collect_referenced_databases(v, referenced_databases)
+
+    def get_config_cache(
+        self,
+        scanner: DirectoryScanner,
+        placeholder_path: Optional[Path],
+        placeholder_values: Optional[dict],
+        parse_sequence: list,
+        parse_databases: Optional[list],
+    ):
+        if not self.args.get("config_cache_path"):
+            return None
+
+        config_cache_path = Path(self.args.get("config_cache_path"))
+
+        # Config with decrypted values is never written to disk, cache file written by previous versions is removed
+        if scanner.has_encrypted_values() or (placeholder_path and b"!decrypt" in placeholder_path.read_bytes()):
+            ConfigCache(config_cache_path, self.config_path, {}).clear()
+            self.logger.info("Config cache is disabled, config contains encrypted values")
+
+            return None
+
+        # Programmatic config may depend on anything (e.g. environment variables), which is not a part of cache key
+        if any(self.config_path.glob("__custom/*.py")):
+            self.logger.info("Config cache is disabled, config contains __custom modules")
+
+            return None
+
+        key_parts = {
+            "snowddl_version": __version__,
+            "env_prefix": self.env_prefix,
+            "target_db": self.args.get("target_db"),
+            "placeholder_file": placeholder_path.read_text(encoding="utf-8") if placeholder_path else None,
+            "placeholder_values": placeholder_values,
+            "parse_sequence": [f"{cls.__module__}.{cls.__qualname__}" for cls in parse_sequence],
+            "parse_databases": parse_databases,
+            "validate_sequence": [f"{cls.__module__}.{cls.__qualname__}" for cls in self.validate_sequence],
+            "manifest": scanner.get_manifest(),
+            "encryption_keys": sha256(",".join(fernet_wrapper.key_sequence).encode("utf-8")).hexdigest(),
+        }
+
+        config_cache = ConfigCache(config_cache_path, self.config_path, key_parts)
+
+        if not config_cache.is_private():
+            self.logger.warning(
+                f"Config cache is disabled, cache path [{config_cache_path}] must be owned by current user "
+                f"and must not be writable by other users"
+            )
+
+            return None
+
+        return config_cache
+
+    def get_scoped_parse_sequence(self):
+        # Parsers producing blueprints for resolved object types and all parsers required by them
+        required_parsers = set()
+        pending_parsers = self.get_primary_parsers()
+
+        while pending_parsers:
+            parser_cls = pending_parsers.pop()
+
+            if parser_cls in required_parsers:
+                continue
+
+            required_parsers.add(parser_cls)
+            pending_parsers.extend(self.parse_dependencies.get(parser_cls, []))
+
+        return [parser_cls for parser_cls in self.parse_sequence if parser_cls in required_parsers]
+
+    def get_scoped_parse_databases(self):
+        if not self.args.get("include_databases"):
+            return None
+
+        return [d.strip() for d in str(self.args.get("include_databases")).split(",")]
+
+    def get_primary_parsers(self):
+        exclude_object_types = self.get_object_types_arg("exclude_object_types")
+        include_object_types = self.get_object_types_arg("include_object_types")
+
+        primary_parsers = []
+
+        for parser_cls in self.parse_sequence:
+            # Parsers with unknown object types are never skipped
+            if parser_cls not in self.parse_object_types:
+                primary_parsers.append(parser_cls)
+                continue
+
+            for object_type in self.parse_object_types[parser_cls]:
+                if object_type in exclude_object_types:
+                    continue
+
+                if include_object_types and object_type not in include_object_types:
+                    continue
+
+                primary_parsers.append(parser_cls)
+                break
+
+        return primary_parsers
+
+    def get_object_types_arg(self, arg_name):
+        if not self.args.get(arg_name):
+            return []
+
+        try:
+            return [ObjectType[t.strip().upper()] for t in str(self.args.get(arg_name)).split(",")]
+        except KeyError as e:
+            raise ValueError(f"Invalid object type [{str(e)}]")
+
+    def get_parse_executor(self):
+        if self.args.get("max_parse_processes") and self.args.get("max_parse_processes") > 1:
+            return ProcessPoolExecutor(self.args.get("max_parse_processes"))
+
+        return nullcontext()
+
     def init_settings(self):
         settings = SnowDDLSettings()
 
@@ -488,6 +818,13 @@ class BaseApp:
         if self.args.get("refresh_secrets"):
             settings.refresh_secrets = True
 
+        if self.args.get("analyze_role_graph"):
+            settings.analyze_role_graph = True
+
+        if self.args.get("minimize_role_grants"):
+            settings.analyze_role_graph = True
+            settings.minimize_role_grants = True
+
         if self.args.get("clone_table"):
             if self.args.get("action") != "apply":
                 raise ValueError("Argument --clone-table requires action [apply]")
@@ -501,29 +838,54 @@ class BaseApp:
             settings.env_admin_role = Ident(self.args.get("env_admin_role"))
 
         if self.args.get("exclude_object_types"):
-            try:
-                settings.exclude_object_types = [
-                    ObjectType[t.strip().upper()] for t in str(self.args.get("exclude_object_types")).split(",")
-                ]
-            except KeyError as e:
-                raise ValueError(f"Invalid object type [{str(e)}]")
+            settings.exclude_object_types = self.get_object_types_arg("exclude_object_types")
 
         if self.args.get("include_object_types"):
-            try:
-                settings.include_object_types = [
-                    ObjectType[t.strip().upper()] for t in str(self.args.get("include_object_types")).split(",")
-                ]
-            except KeyError as e:
-                raise ValueError(f"Invalid object type [{str(e)}]")
+            settings.include_object_types = self.get_object_types_arg("include_object_types")
+
+        if self.args.get("include_databases"):
+            settings.include_databases = [
+                DatabaseIdent(self.config.env_prefix, d.strip()) for d in str(self.args.get("include_databases")).split(",")
+            ]
+
+        if self.args.get("bulk_metadata"):
+            settings.bulk_metadata = True
+
+        if self.args.get("bulk_grants"):
+            # Stale grants from ACCOUNT_USAGE are acceptable for review, but not for DDL which is actually executed
+            if settings.execute_safe_ddl:
+                self.logger.warning(
+                    "Bulk grants are disabled for [apply] and [destroy], ACCOUNT_USAGE may lag behind by up to 2 hours"
+                )
+            else:
+                settings.bulk_grants = True
+
+        if self.args.get("snapshot_path"):
+            settings.snapshot_path = self.args.get("snapshot_path")
+
+        if self.args.get("snapshot_ttl"):
+            settings.snapshot_ttl = int(self.args.get("snapshot_ttl"))
 
         if self.args.get("max_workers"):
             settings.max_workers = int(self.args.get("max_workers"))
 
+        if self.args.get("max_connections"):
+            settings.max_connections = int(self.args.get("max_connections"))
+
+        if self.args.get("max_async_queries"):
+            settings.max_async_queries = int(self.args.get("max_async_queries"))
+
+        if self.args.get("max_statements_per_request"):
+            settings.max_statements_per_request = int(self.args.get("max_statements_per_request"))
+
+        if self.args.get("max_concurrent_resolvers"):
+            settings.max_concurrent_resolvers = int(self.args.get("max_concurrent_resolvers"))
+
         return settings
 
     def get_engine(self):
         with self.measure_elapsed_time("GetEngine"):
-            engine = SnowDDLEngine(self.get_connection(), self.config, self.settings)
+            engine = SnowDDLEngine(self.get_connection(), self.config, self.settings, self.get_connection)
 
         return engine
 
@@ -602,27 +964,20 @@ class BaseApp:
                 if not self.args.get("env_prefix") and not self.args.get("destroy_without_prefix"):
                     raise ValueError("Argument --env-prefix is required for [destroy] action")
 
-                for resolver_cls in self.destroy_sequence:
-                    with self.measure_elapsed_time(resolver_cls.__name__):
-                        resolver = resolver_cls(engine)
-                        resolver.destroy()
-
-                    total_error_count += len(resolver.errors)
+                total_error_count += self.execute_resolvers(engine, self.destroy_sequence, self.destroy_dependencies, "destroy")
 
                 engine.context.destroy_role_with_prefix()
             else:
-                for resolver_cls in self.resolve_sequence:
-                    with self.measure_elapsed_time(resolver_cls.__name__):
-                        resolver = resolver_cls(engine)
-                        resolver.resolve()
-
-                    total_error_count += len(resolver.errors)
+                total_error_count += self.execute_resolvers(engine, self.resolve_sequence, self.resolve_dependencies, "resolve")
 
             engine.connection.close()
 
             self.output_engine_stats(engine)
             self.output_engine_warnings(engine)
 
+            if self.settings.analyze_role_graph:
+                self.output_role_graph_stats(engine)
+
             if self.args.get("show_timers"):
                 self.output_app_timers()
 
@@ -634,6 +989,105 @@ class BaseApp:
             if total_error_count > 0:
                 exit(8)
 
+    def execute_resolvers(self, engine: SnowDDLEngine, resolver_sequence, resolver_dependencies, action):
+        dependencies = self.get_resolver_dependencies(resolver_sequence, resolver_dependencies)
+
+        pending_counters = {resolver_cls: len(dependencies[resolver_cls]) for resolver_cls in resolver_sequence}
+        dependents = defaultdict(list)
+
+        for resolver_cls in resolver_sequence:
+            for dependency_cls in dependencies[resolver_cls]:
+                dependents[dependency_cls].append(resolver_cls)
+
+        ready = [resolver_cls for resolver_cls in resolver_sequence if pending_counters[resolver_cls] == 0]
+        futures = {}
+        error_count = 0
+
+        def run_resolver(resolver_cls):
+            with self.measure_elapsed_time(resolver_cls.__name__):
+                resolver = resolver_cls(engine)
+                getattr(resolver, action)()
+
+            # Resolver threads are reused, remaining DDL is flushed before thread is given to the next resolver
+            engine.flush_thread_buffers()
+
+            return resolver
+
+        # Resolvers have their own executor, engine executor is used by resolvers to process objects
+        with ThreadPoolExecutor(max_workers=self.settings.max_concurrent_resolvers, thread_name_prefix="SnowDDLResolver") as executor:
+            while ready or futures:
+                # Ready resolvers are started in order of sequence
+                while ready and len(futures) < self.settings.max_concurrent_resolvers:
+                    resolver_cls = ready.pop(0)
+                    futures[executor.submit(run_resolver, resolver_cls)] = resolver_cls
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                for f in done:
+                    resolver_cls = futures.pop(f)
+                    error_count += len(f.result().errors)
+
+                    for dependent_cls in dependents[resolver_cls]:
+                        pending_counters[dependent_cls] -= 1
+
+                        if pending_counters[dependent_cls] == 0:
+                            ready.append(dependent_cls)
+
+                ready.sort(key=resolver_sequence.index)
+
+        self.critical_path = self.get_resolver_critical_path(resolver_sequence, dependencies)
+
+        return error_count
+
+    def get_resolver_dependencies(self, resolver_sequence, resolver_dependencies):
+        # Resolvers with unknown dependencies are executed strictly one by one
+        if any(resolver_cls not in resolver_dependencies for resolver_cls in resolver_sequence):
+            return {resolver_cls: set(resolver_sequence[:idx][-1:]) for idx, resolver_cls in enumerate(resolver_sequence)}
+
+        dependencies = {}
+
+        for resolver_cls in resolver_sequence:
+            dependencies[resolver_cls] = set()
+            remaining_dependencies = list(resolver_dependencies[resolver_cls])
+
+            while remaining_dependencies:
+                dependency_cls = remaining_dependencies.pop()
+
+                # Resolvers missing in sequence are replaced with their own dependencies
+                if dependency_cls in resolver_sequence:
+                    dependencies[resolver_cls].add(dependency_cls)
+                else:
+                    remaining_dependencies.extend(resolver_dependencies.get(dependency_cls, []))
+
+        return dependencies
+
+    def get_resolver_critical_path(self, resolver_sequence, dependencies):
+        finish_times = {}
+        previous_resolvers = {}
+
+        # Dependencies are always placed earlier in sequence
+        for resolver_cls in resolver_sequence:
+            previous_cls = max(dependencies[resolver_cls], key=lambda d: finish_times[d], default=None)
+
+            finish_times[resolver_cls] = self.elapsed_timers[resolver_cls.__name__]
+            previous_resolvers[resolver_cls] = previous_cls
+
+            if previous_cls:
+                finish_times[resolver_cls] += finish_times[previous_cls]
+
+        if not finish_times:
+            return None
+
+        resolver_cls = max(finish_times, key=lambda r: finish_times[r])
+        path_elapsed_time = finish_times[resolver_cls]
+        path = []
+
+        while resolver_cls:
+            path.insert(0, resolver_cls.__name__)
+            resolver_cls = previous_resolvers[resolver_cls]
+
+        return path, path_elapsed_time
+
     def output_engine_context(self, engine: SnowDDLEngine):
         roles = []
 
@@ -696,6 +1150,18 @@ class BaseApp:
     def output_engine_stats(self, engine: SnowDDLEngine):
         self.logger.info(f"Executed {len(engine.executed_ddl)} DDL queries, Suggested {len(engine.suggested_ddl)} DDL queries")
 
+    def output_role_graph_stats(self, engine: SnowDDLEngine):
+        stats = engine.role_graph_cache.get_stats()
+
+        self.logger.info(
+            f"Role graph: {stats['roles']} roles, {stats['role_grants']} role grants, {stats['object_grants']} object grants, "
+            f"{stats['future_grants']} future grants, {stats['account_grants']} account grants, max depth {stats['max_depth']}"
+        )
+        self.logger.info(
+            f"Role graph: {stats['effective_grants']} effective grants, {stats['redundant_grants']} redundant grants, "
+            f"{stats['skipped_grants']} skipped grants"
+        )
+
     def output_engine_warnings(self, engine: SnowDDLEngine):
         for object_type, object_names in engine.intention_cache.invalid_name_warning.items():
             for name in object_names:
@@ -712,6 +1178,10 @@ class BaseApp:
         for timer_name, timer_value in self.elapsed_timers.items():
             self.logger.info(f"Timer [{timer_name}] elapsed time is {timer_value:.3f}s")
 
+        if self.critical_path:
+            path, path_elapsed_time = self.critical_path
+            self.logger.info(f"Critical path [{' -> '.join(path)}] elapsed time is {path_elapsed_time:.3f}s")
+
     def output_suggested_ddl(self, engine: SnowDDLEngine):
         if engine.suggested_ddl:
             print("--- Suggested DDL ---\n")
@@ -733,7 +1203,9 @@ class BaseApp:
         try:
             yield
         finally:
-            self.elapsed_timers[timer_name] = perf_counter() - start_counter
+            # Resolvers may be executed concurrently, each in its own thread
+            with self._elapsed_timers_lock:
+                self.elapsed_timers[timer_name] = perf_counter() - start_counter
 
 
 def entry_point():
@@ -14,7 +14,7 @@ from snowddl.blueprint import (
     SchemaObjectBlueprint,
 )
 from snowddl.config import SnowDDLConfig
-from snowddl.parser import singledb_parse_sequence
+from snowddl.parser import cross_database_object_types, singledb_parse_sequence, DirectoryScanner
 from snowddl.resolver import singledb_resolve_sequence, singledb_destroy_sequence
 
 
@@ -121,6 +121,42 @@ class SingleDbApp(BaseApp):
         parser.add_argument(
             "--max-workers", help="Maximum number of workers to resolve objects in parallel", default=None, type=int
         )
+        parser.add_argument(
+            "--max-connections",
+            help="Maximum number of Snowflake sessions shared by workers (default: 1)",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--max-async-queries",
+            help="Maximum number of GRANT and COMMENT queries executed asynchronously at the same time (default: 0, disabled)",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--max-statements-per-request",
+            help="Maximum number of GRANT and COMMENT queries joined into a single multi-statement request (default: 1, disabled)",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--max-concurrent-resolvers",
+            help="Maximum number of independent resolvers executed at the same time (default: 1, disabled)",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--max-parse-processes",
+            help="Maximum number of processes to parse config files in parallel (default: 1, disabled)",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--freeze-blueprints",
+            help="Reject changes of blueprints after config was loaded, helps to detect accidental changes in custom resolvers",
+            default=False,
+            action="store_true",
+        )
 
         # Logging
         parser.add_argument(
@@ -145,6 +181,12 @@ class SingleDbApp(BaseApp):
         parser.add_argument(
             "--placeholder-values", help="Environment-specific placeholder values in JSON format", default=None, metavar=""
         )
+        parser.add_argument(
+            "--config-cache-path",
+            help="Path to private directory with cache of parsed config, config is parsed again only if files were changed",
+            default=None,
+            metavar="",
+        )
 
         # Object types
         parser.add_argument(
@@ -157,6 +199,25 @@ class SingleDbApp(BaseApp):
             metavar="",
         )
 
+        # Metadata
+        parser.add_argument(
+            "--bulk-metadata",
+            help="Retrieve existing schema objects with one SHOW command per database instead of one command per schema",
+            default=False,
+            action="store_true",
+        )
+        parser.add_argument(
+            "--snapshot-path",
+            help="Directory for local snapshot of existing objects, which is reused while probe detects no changes in database",
+            default=None,
+        )
+        parser.add_argument(
+            "--snapshot-ttl",
+            help="Maximum age of local snapshot of existing objects in seconds (default: 3600)",
+            default=None,
+            type=int,
+        )
+
         # Apply even more unsafe changes
         parser.add_argument(
             "--apply-unsafe",
@@ -231,21 +292,13 @@ class SingleDbApp(BaseApp):
         return parser
 
     def init_config(self):
-        config = super().init_config()
-
-        # Init Source DB
-        if self.args.get("config_db"):
-            self.config_db = DatabaseIdent(config.env_prefix, self.args.get("config_db"))
+        # Only source database is parsed
+        self.config_db = self.init_config_db()
 
-            if str(self.config_db) not in config.get_blueprints_by_type(DatabaseBlueprint):
-                raise ValueError(f"Source database [{self.config_db}] does not exist in config")
-        else:
-            if len(config.get_blueprints_by_type(DatabaseBlueprint)) > 1:
-                raise ValueError(
-                    "More than one source database exist in config, please choose a specific database using --source-db argument"
-                )
+        config = super().init_config()
 
-            self.config_db = next(iter(config.get_blueprints_by_type(DatabaseBlueprint).values())).full_name
+        if str(self.config_db) not in config.get_blueprints_by_type(DatabaseBlueprint):
+            raise ValueError(f"Source database [{self.config_db}] does not exist in config")
 
         # Init Target DB
         if self.args.get("target_db"):
@@ -255,6 +308,33 @@ class SingleDbApp(BaseApp):
 
         return self.convert_config(config)
 
+    def init_config_db(self):
+        if self.args.get("config_db"):
+            return DatabaseIdent(self.env_prefix, self.args.get("config_db"))
+
+        database_names = [p.name for p in sorted(self.config_path.iterdir()) if p.is_dir() and not p.name.startswith("__")]
+
+        if len(database_names) > 1:
+            raise ValueError(
+                "More than one source database exist in config, please choose a specific database using --source-db argument"
+            )
+
+        if not database_names:
+            raise ValueError("Source database does not exist in config")
+
+        return DatabaseIdent(self.env_prefix, database_names[0])
+
+    def init_scanner(self, parse_databases: Optional[list]):
+        # Policies of other databases are still parsed, since they might be referenced by objects in source database
+        return DirectoryScanner(self.config_path, parse_databases, cross_database_object_types, include_database_params=False)
+
+    def get_scoped_parse_databases(self):
+        return [self.config_db.database]
+
+    def get_referenced_databases(self, config: SnowDDLConfig, parse_databases: list):
+        # Only source database is converted, references to other databases are kept as is
+        return set()
+
     def convert_config(self, original_config: SnowDDLConfig):
         singledb_config = SnowDDLConfig(self.env_prefix)
 
@@ -269,28 +349,44 @@ class SingleDbApp(BaseApp):
         return singledb_config
 
     def convert_blueprint(self, bp: AbstractBlueprint):
-        converted_bp = bp.model_copy(deep=True)
+        if self.target_db == self.config_db:
+            return bp
 
-        for field_name, field_value in converted_bp:
-            self.convert_object_recursive(getattr(converted_bp, field_name))
-
-        return converted_bp
+        return self.convert_object_recursive(bp)
 
     def convert_object_recursive(self, obj):
+        # Objects are copied only if they contain idents to rebind, freshly parsed blueprints are not modified
         if isinstance(obj, BaseModel):
+            updates = {}
+
             for field_name, field_value in obj:
-                self.convert_object_recursive(getattr(obj, field_name))
+                converted_value = self.convert_object_recursive(field_value)
+
+                if converted_value is not field_value:
+                    updates[field_name] = converted_value
+
+            return obj.model_copy(update=updates) if updates else obj
 
         if isinstance(obj, list):
-            for item in obj:
-                self.convert_object_recursive(item)
+            converted_list = [self.convert_object_recursive(item) for item in obj]
+
+            if any(converted_item is not item for converted_item, item in zip(converted_list, obj)):
+                return converted_list
+
+        if isinstance(obj, set):
+            converted_pairs = [(self.convert_object_recursive(item), item) for item in obj]
+
+            if any(converted_item is not item for converted_item, item in converted_pairs):
+                return {converted_item for converted_item, item in converted_pairs}
 
         if isinstance(obj, dict):
-            for item in obj.values():
-                self.convert_object_recursive(item)
+            converted_dict = {key: self.convert_object_recursive(item) for key, item in obj.items()}
 
-        if isinstance(obj, (DatabaseIdent, SchemaIdent, SchemaObjectIdent)):
-            obj.database = self.target_db.database
+            if any(converted_dict[key] is not item for key, item in obj.items()):
+                return converted_dict
+
+        if isinstance(obj, (DatabaseIdent, SchemaIdent, SchemaObjectIdent)) and obj.database != self.target_db.database:
+            return obj.replace(database=self.target_db.database)
 
         return obj
 
@@ -311,20 +407,10 @@ class SingleDbApp(BaseApp):
             self.output_engine_context(engine)
 
             if self.args.get("action") == "destroy":
-                for resolver_cls in self.destroy_sequence:
-                    with self.measure_elapsed_time(resolver_cls.__name__):
-                        resolver = resolver_cls(engine)
-                        resolver.destroy()
-
-                    error_count += len(resolver.errors)
+                error_count += self.execute_resolvers(engine, self.destroy_sequence, self.destroy_dependencies, "destroy")
 
             else:
-                for resolver_cls in self.resolve_sequence:
-                    with self.measure_elapsed_time(resolver_cls.__name__):
-                        resolver = resolver_cls(engine)
-                        resolver.resolve()
-
-                    error_count += len(resolver.errors)
+                error_count += self.execute_resolvers(engine, self.resolve_sequence, self.resolve_dependencies, "resolve")
 
             engine.connection.close()
 
@@ -85,7 +85,7 @@ from .ident_builder import (
     build_default_namespace_ident,
     build_share_read_ident,
 )
-from .ident_pattern import IdentPattern
+from .ident_pattern import IdentPattern, IdentPatternIndex
 
 from .object_type import ObjectType
 from .permission_model import PermissionModel, PermissionModelCreateGrant, PermissionModelFutureGrant, PermissionModelRuleset
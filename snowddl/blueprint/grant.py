@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Tuple, Union
 
 from .ident import AbstractIdent, AbstractIdentWithPrefix, DatabaseIdent, SchemaIdent
 from .ident_pattern import IdentPattern
@@ -26,10 +26,17 @@ class Grant(BaseModelWithConfig):
 
         return True
 
+    def key(self) -> Tuple[str, ObjectType, str]:
+        # Hashable representation, grants on different object types never share a key
+        return self.privilege, self.on, str(self.name)
+
 
 class AccountGrant(BaseModelWithConfig):
     privilege: str
 
+    def key(self) -> Tuple[str]:
+        return (self.privilege,)
+
 
 class FutureGrant(BaseModelWithConfig):
     privilege: str
@@ -37,6 +44,9 @@ class FutureGrant(BaseModelWithConfig):
     in_parent: ObjectType
     name: Union[DatabaseIdent, SchemaIdent]
 
+    def key(self) -> Tuple[str, ObjectType, ObjectType, str]:
+        return self.privilege, self.on_future, self.in_parent, str(self.name)
+
 
 class GrantPattern(BaseModelWithConfig):
     privilege: str
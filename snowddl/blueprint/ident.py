@@ -1,13 +1,53 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from string import ascii_letters, digits
+from sys import intern
 from typing import List, Optional, Tuple
 
 from .data_type import BaseDataType
 
 
+allowed_ident_chars = frozenset(ascii_letters + digits + "_$")
+
+
+# Same parts are validated many times, results are cached
+@lru_cache(maxsize=65536)
+def validate_part(val: str):
+    if not val:
+        raise ValueError("Identifier cannot be empty")
+
+    for char in val:
+        if char not in allowed_ident_chars:
+            raise ValueError(
+                f"Character [{char}] is not allowed in identifier [{val}], only ASCII letters, digits and single underscores are accepted"
+            )
+
+    return intern(val.upper())
+
+
+@lru_cache(maxsize=1024)
+def validate_env_prefix(val: str):
+    for char in val:
+        if char not in allowed_ident_chars:
+            raise ValueError(
+                f"Character [{char}] is not allowed in env prefix [{val}], only ASCII letters, digits and single underscores are accepted"
+            )
+
+    if val and not val.endswith(("__", "_", "$")):
+        raise ValueError(
+            f"Env prefix [{val}] in identifier must end with valid separator like [__] double underscore, [_] single underscore or [$] dollar"
+        )
+
+    return intern(val.upper())
+
+
 class AbstractIdent(ABC):
-    allowed_chars = set(ascii_letters + digits + "_$")
+    # Idents must not be changed after creation, since string representation is built only once
+    # Use .replace() to get a modified copy of ident
+    __slots__ = ("_str",)
+
+    allowed_chars = allowed_ident_chars
 
     @abstractmethod
     def __init__(self):
@@ -17,13 +57,38 @@ class AbstractIdent(ABC):
     def parts_for_format(self) -> Tuple[List[str], Optional[List[str]]]:
         pass
 
+    def replace(self, **changes):
+        # Returns a copy of ident with some parts replaced, values of parts must be already validated
+        obj = self.__class__.__new__(self.__class__)
+
+        for slot_name in self._get_part_names():
+            setattr(obj, slot_name, changes.pop(slot_name, getattr(self, slot_name)))
+
+        if changes:
+            raise ValueError(f"Unknown parts {sorted(changes)} for {self.__class__.__name__}")
+
+        return obj
+
+    @classmethod
+    def _get_part_names(cls):
+        return [slot_name for c in reversed(cls.__mro__) for slot_name in c.__dict__.get("__slots__", ()) if slot_name != "_str"]
+
     def __str__(self):
+        try:
+            return self._str
+        except AttributeError:
+            pass
+
         core_parts, argument_parts = self.parts_for_format()
 
         if argument_parts is not None:
-            return f"{'.'.join(core_parts)}({','.join(argument_parts)})"
+            val = f"{'.'.join(core_parts)}({','.join(argument_parts)})"
+        else:
+            val = ".".join(core_parts)
 
-        return ".".join(core_parts)
+        self._str = intern(val)
+
+        return self._str
 
     def __hash__(self):
         return hash(str(self))
@@ -44,42 +109,22 @@ class AbstractIdent(ABC):
         raise NotImplementedError
 
     def _validate_part(self, val):
-        val = str(val)
-
-        if not val:
-            raise ValueError("Identifier cannot be empty")
-
-        for char in val:
-            if char not in self.allowed_chars:
-                raise ValueError(
-                    f"Character [{char}] is not allowed in identifier [{val}], only ASCII letters, digits and single underscores are accepted"
-                )
-
-        return val.upper()
+        return validate_part(str(val))
 
 
 class AbstractIdentWithPrefix(AbstractIdent, ABC):
+    __slots__ = ("env_prefix",)
+
     def __init__(self, env_prefix):
         self.env_prefix = self._validate_env_prefix(env_prefix)
 
     def _validate_env_prefix(self, val):
-        val = str(val)
-
-        for char in val:
-            if char not in self.allowed_chars:
-                raise ValueError(
-                    f"Character [{char}] is not allowed in env prefix [{val}], only ASCII letters, digits and single underscores are accepted"
-                )
-
-        if val and not val.endswith(("__", "_", "$")):
-            raise ValueError(
-                f"Env prefix [{val}] in identifier must end with valid separator like [__] double underscore, [_] single underscore or [$] dollar"
-            )
-
-        return val.upper()
+        return validate_env_prefix(str(val))
 
 
 class Ident(AbstractIdent):
+    __slots__ = ("name",)
+
     def __init__(self, name):
         self.name = self._validate_part(name)
 
@@ -88,6 +133,8 @@ class Ident(AbstractIdent):
 
 
 class AccountIdent(AbstractIdent):
+    __slots__ = ("organization", "account")
+
     def __init__(self, organization, account):
         self.organization = self._validate_part(organization)
         self.account = self._validate_part(account)
@@ -97,6 +144,8 @@ class AccountIdent(AbstractIdent):
 
 
 class AccountObjectIdent(AbstractIdentWithPrefix):
+    __slots__ = ("name",)
+
     def __init__(self, env_prefix, name):
         super().__init__(env_prefix)
 
@@ -107,6 +156,8 @@ class AccountObjectIdent(AbstractIdentWithPrefix):
 
 
 class DatabaseIdent(AbstractIdentWithPrefix):
+    __slots__ = ("database",)
+
     def __init__(self, env_prefix, database):
         super().__init__(env_prefix)
 
@@ -117,6 +168,8 @@ class DatabaseIdent(AbstractIdentWithPrefix):
 
 
 class DatabaseRoleIdent(AbstractIdentWithPrefix):
+    __slots__ = ("database", "name")
+
     def __init__(self, env_prefix, database, name):
         super().__init__(env_prefix)
 
@@ -132,6 +185,8 @@ class DatabaseRoleIdent(AbstractIdentWithPrefix):
 
 
 class OutboundShareIdent(AbstractIdentWithPrefix):
+    __slots__ = ("share",)
+
     def __init__(self, env_prefix, share):
         super().__init__(env_prefix)
 
@@ -142,6 +197,8 @@ class OutboundShareIdent(AbstractIdentWithPrefix):
 
 
 class SchemaIdent(AbstractIdentWithPrefix):
+    __slots__ = ("database", "schema")
+
     def __init__(self, env_prefix, database, schema):
         super().__init__(env_prefix)
 
@@ -157,6 +214,8 @@ class SchemaIdent(AbstractIdentWithPrefix):
 
 
 class SchemaObjectIdent(AbstractIdentWithPrefix):
+    __slots__ = ("database", "schema", "name")
+
     def __init__(self, env_prefix, database, schema, name):
         super().__init__(env_prefix)
 
@@ -177,6 +236,8 @@ class SchemaObjectIdent(AbstractIdentWithPrefix):
 
 
 class SchemaObjectIdentWithArgs(SchemaObjectIdent):
+    __slots__ = ("data_types",)
+
     def __init__(self, env_prefix, database, schema, name, data_types: List[BaseDataType]):
         super().__init__(env_prefix, database, schema, name)
 
@@ -187,6 +248,8 @@ class SchemaObjectIdentWithArgs(SchemaObjectIdent):
 
 
 class StageFileIdent(SchemaObjectIdent):
+    __slots__ = ("path",)
+
     def __init__(self, env_prefix, database, schema, name, path: Path):
         super().__init__(env_prefix, database, schema, name)
 
@@ -201,6 +264,8 @@ class StageFileIdent(SchemaObjectIdent):
 
 
 class TableConstraintIdent(SchemaObjectIdent):
+    __slots__ = ("columns",)
+
     def __init__(self, env_prefix, database, schema, name, columns: List[Ident]):
         super().__init__(env_prefix, database, schema, name)
 
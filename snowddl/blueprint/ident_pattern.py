@@ -1,7 +1,8 @@
+from bisect import bisect_left
 from fnmatch import translate
 from re import compile
 from string import ascii_letters, digits
-from typing import List, Pattern
+from typing import Dict, List, Pattern
 
 from snowddl.blueprint.ident import AbstractIdentWithPrefix
 
@@ -9,6 +10,7 @@ from snowddl.blueprint.ident import AbstractIdentWithPrefix
 class IdentPattern:
     allowed_chars_pattern = set(ascii_letters + digits + "_$()." + "|!*?[]")
     special_chars_complex_pattern = set("|!*?[]")
+    special_chars_sub_pattern = set("*?[")
 
     def __init__(self, pattern):
         self.pattern = self._validate_pattern(pattern)
@@ -17,6 +19,9 @@ class IdentPattern:
         self.include_regexp: List[Pattern] = []
         self.exclude_regexp: List[Pattern] = []
 
+        # Literal prefixes of positive sub-patterns, used to narrow down candidates in IdentPatternIndex
+        self.include_prefixes: List[str] = []
+
         if self.is_complex_pattern:
             for sub_pattern in self.pattern.split("|"):
                 is_exclude = False
@@ -34,6 +39,7 @@ class IdentPattern:
                     self.exclude_regexp.append(compiled_regexp)
                 else:
                     self.include_regexp.append(compiled_regexp)
+                    self.include_prefixes.append(self._get_literal_prefix(sub_pattern))
 
             if not self.include_regexp:
                 raise ValueError(f"Identifier pattern [{self.pattern}] does not contain any positive sub-patterns")
@@ -43,8 +49,9 @@ class IdentPattern:
         return cls(cls._get_str_ident_without_prefix(ident))
 
     def is_match_ident(self, ident: AbstractIdentWithPrefix) -> bool:
-        str_ident_without_prefix = self._get_str_ident_without_prefix(ident)
+        return self.is_match_str_ident_without_prefix(self._get_str_ident_without_prefix(ident))
 
+    def is_match_str_ident_without_prefix(self, str_ident_without_prefix: str) -> bool:
         if self.is_complex_pattern:
             is_match_include = any(regexp.match(str_ident_without_prefix) for regexp in self.include_regexp)
             is_match_exclude = any(regexp.match(str_ident_without_prefix) for regexp in self.exclude_regexp)
@@ -62,6 +69,13 @@ class IdentPattern:
     def _is_complex_pattern(self, val):
         return any(char in self.special_chars_complex_pattern for char in val)
 
+    def _get_literal_prefix(self, sub_pattern):
+        for i, char in enumerate(sub_pattern):
+            if char in self.special_chars_sub_pattern:
+                return sub_pattern[:i]
+
+        return sub_pattern
+
     @classmethod
     def _get_str_ident_without_prefix(cls, ident: AbstractIdentWithPrefix):
         return str(ident).removeprefix(ident.env_prefix)
@@ -80,3 +94,47 @@ class IdentPattern:
                 )
 
         return val.upper()
+
+
+class IdentPatternIndex:
+    # Index of blueprints by identifier without env prefix, results are cached by pattern
+    # Must be rebuilt when blueprints are added or removed
+    def __init__(self, blueprints: Dict[str, object]):
+        self.blueprints = blueprints
+
+        self.full_names_by_name: Dict[str, List[str]] = {}
+        self.positions: Dict[str, int] = {}
+
+        for position, (full_name, bp) in enumerate(blueprints.items()):
+            name = IdentPattern._get_str_ident_without_prefix(bp.full_name)
+
+            self.full_names_by_name.setdefault(name, []).append(full_name)
+            self.positions[full_name] = position
+
+        self.sorted_names = sorted(self.full_names_by_name)
+        self.matched_full_names: Dict[str, List[str]] = {}
+
+    def get_blueprints_by_pattern(self, pattern: IdentPattern):
+        if pattern.pattern not in self.matched_full_names:
+            self.matched_full_names[pattern.pattern] = self._find_full_names(pattern)
+
+        return {full_name: self.blueprints[full_name] for full_name in self.matched_full_names[pattern.pattern]}
+
+    def _find_full_names(self, pattern: IdentPattern):
+        if not pattern.is_complex_pattern:
+            return self.full_names_by_name.get(pattern.pattern, [])
+
+        matched_full_names = set()
+
+        for prefix in pattern.include_prefixes:
+            for i in range(bisect_left(self.sorted_names, prefix), len(self.sorted_names)):
+                name = self.sorted_names[i]
+
+                if not name.startswith(prefix):
+                    break
+
+                if pattern.is_match_str_ident_without_prefix(name):
+                    matched_full_names.update(self.full_names_by_name[name])
+
+        # Keep original order of blueprints
+        return sorted(matched_full_names, key=self.positions.__getitem__)
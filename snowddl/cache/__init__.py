@@ -1,2 +1,7 @@
+from .config_cache import ConfigCache
 from .intention_cache import IntentionCache
+from .metadata_cache import MetadataCache
+from .role_cache import RoleCache
+from .role_graph_cache import RoleGraphCache
 from .schema_cache import SchemaCache
+from .snapshot_cache import SnapshotCache
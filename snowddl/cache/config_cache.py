@@ -0,0 +1,69 @@
+from hashlib import sha256
+from json import dumps
+from os import fdopen, getuid, open as os_open, replace, O_CREAT, O_TRUNC, O_WRONLY
+from pathlib import Path
+from pickle import dump, load, HIGHEST_PROTOCOL
+from stat import S_IWGRP, S_IWOTH
+from typing import Dict, Optional, Tuple
+
+from snowddl.config import SnowDDLConfig
+
+
+class ConfigCache:
+    cache_version = 4
+
+    def __init__(self, cache_path: Path, config_path: Path, key_parts: Dict):
+        # Each config directory has one cache file, which is overwritten on any change
+        path_hash = sha256(str(config_path).encode("utf-8")).hexdigest()[:16]
+
+        self.cache_file = Path(cache_path) / f"snowddl_config_{path_hash}.pickle"
+        self.key = sha256(dumps(key_parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def is_private(self) -> bool:
+        # Unpickling may execute arbitrary code, so cache must not be writable by other users
+        for path in (self.cache_file.parent, self.cache_file):
+            if not path.exists():
+                continue
+
+            stat = path.stat()
+
+            if stat.st_uid != getuid() or stat.st_mode & (S_IWGRP | S_IWOTH):
+                return False
+
+        return True
+
+    def load(self) -> Optional[Tuple[SnowDDLConfig, Dict[str, Path]]]:
+        if not self.cache_file.is_file() or not self.is_private():
+            return None
+
+        try:
+            with open(self.cache_file, "rb") as f:
+                data = load(f)
+        except Exception:
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != self.cache_version or data.get("key") != self.key:
+            return None
+
+        return data["config"], data["unused_file_paths"]
+
+    def clear(self):
+        self.cache_file.unlink(missing_ok=True)
+
+    def save(self, config: SnowDDLConfig, unused_file_paths: Dict[str, Path]):
+        self.cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(".tmp")
+
+        with fdopen(os_open(tmp_file, O_WRONLY | O_CREAT | O_TRUNC, 0o600), "wb") as f:
+            dump(
+                {
+                    "version": self.cache_version,
+                    "key": self.key,
+                    "config": config,
+                    "unused_file_paths": unused_file_paths,
+                },
+                f,
+                protocol=HIGHEST_PROTOCOL,
+            )
+
+        replace(tmp_file, self.cache_file)
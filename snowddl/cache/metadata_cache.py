@@ -0,0 +1,197 @@
+from collections import defaultdict
+from threading import Lock
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from snowddl.blueprint import ObjectType
+from snowddl.error import SnowDDLExecuteError
+
+if TYPE_CHECKING:
+    from snowddl.engine import SnowDDLEngine
+
+
+class MetadataCache:
+    # SHOW commands return at most 10000 rows, larger results are truncated
+    show_row_limit = 10000
+
+    # Special table types are also returned by SHOW TABLES with corresponding flag
+    table_type_flags = {
+        ObjectType.DYNAMIC_TABLE.plural: "is_dynamic",
+        ObjectType.EVENT_TABLE.plural: "is_event",
+        ObjectType.HYBRID_TABLE.plural: "is_hybrid",
+        ObjectType.ICEBERG_TABLE.plural: "is_iceberg",
+    }
+
+    def __init__(self, engine: "SnowDDLEngine"):
+        self.engine = engine
+
+        self.schema_rows: Dict[Tuple[str, str, str], List[Dict]] = {}
+        self.database_rows: Dict[Tuple[str, str], Optional[Dict[str, List[Dict]]]] = {}
+        self.column_rows: Dict[str, Optional[Dict[str, List[Dict]]]] = {}
+
+        # Object types created, replaced or dropped during current run
+        self.changed_plurals: Dict[Tuple[str, str], set] = defaultdict(set)
+        self.stale_plurals: Dict[Tuple[str, str], set] = defaultdict(set)
+
+        self._lock = Lock()
+        self._key_locks: Dict[Tuple, Lock] = defaultdict(Lock)
+
+    def show_objects_in_schema(self, object_type_plural: str, database: str, schema: str, schema_column="schema_name"):
+        # SHOW <TYPE> TABLES can be skipped if SHOW TABLES was already called for schema and returned no such tables
+        if object_type_plural in self.table_type_flags and not self._has_tables_of_type(object_type_plural, database, schema):
+            return []
+
+        with self._lock:
+            if object_type_plural in self.stale_plurals[(database, schema)]:
+                self.stale_plurals[(database, schema)].discard(object_type_plural)
+
+                self.schema_rows.pop((object_type_plural, database, schema), None)
+                self.database_rows.pop((object_type_plural, database), None)
+
+        if self.engine.settings.bulk_metadata:
+            rows_by_schema = self._get_database_rows(object_type_plural, database, schema_column)
+
+            if rows_by_schema is not None:
+                return rows_by_schema.get(schema, [])
+
+        return self._get_schema_rows(object_type_plural, database, schema)
+
+    def get_columns_in_database(self, database: str):
+        key = ("COLUMNS", database)
+
+        with self._lock:
+            key_lock = self._key_locks[key]
+
+        # Only one thread retrieves columns for each database, other threads are waiting for result
+        with key_lock:
+            with self._lock:
+                if database in self.column_rows:
+                    return self.column_rows[database]
+
+            # INFORMATION_SCHEMA is not affected by row limit of SHOW commands, but it requires warehouse
+            try:
+                cur = self.engine.execute_meta(
+                    "SELECT * FROM {database:i}.INFORMATION_SCHEMA.COLUMNS "
+                    "WHERE TABLE_SCHEMA != 'INFORMATION_SCHEMA' "
+                    "ORDER BY TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION",
+                    {
+                        "database": database,
+                    },
+                )
+            except SnowDDLExecuteError as e:
+                # Query might fail for very large databases, failure is remembered and columns are retrieved for each table
+                self.engine.logger.warning(
+                    f"Could not retrieve columns in database [{database}], DESC TABLE is used instead: \n{e.verbose_message()}"
+                )
+
+                with self._lock:
+                    self.column_rows[database] = None
+
+                return None
+
+            rows_by_table = defaultdict(list)
+
+            for r in cur:
+                rows_by_table[f"{r['TABLE_CATALOG']}.{r['TABLE_SCHEMA']}.{r['TABLE_NAME']}"].append(r)
+
+            with self._lock:
+                self.column_rows[database] = rows_by_table
+
+            return rows_by_table
+
+    def invalidate(self, object_type: ObjectType, database: str, schema: str):
+        with self._lock:
+            self.changed_plurals[(database, schema)].add(object_type.plural)
+            self.stale_plurals[(database, schema)].add(object_type.plural)
+
+    def _has_tables_of_type(self, object_type_plural: str, database: str, schema: str):
+        table_rows = self._get_cached_rows(ObjectType.TABLE.plural, database, schema)
+
+        # Result of SHOW TABLES is not available or tables of this type were changed, it is not possible to decide
+        # Changes of other table types do not affect flags of this table type
+        if table_rows is None or object_type_plural in self.changed_plurals[(database, schema)]:
+            return True
+
+        flag = self.table_type_flags[object_type_plural]
+
+        for r in table_rows:
+            # Flag might be missing in SHOW TABLES output
+            if r.get(flag, "Y") == "Y":
+                return True
+
+        return False
+
+    def _get_cached_rows(self, object_type_plural: str, database: str, schema: str):
+        with self._lock:
+            if (object_type_plural, database, schema) in self.schema_rows:
+                return self.schema_rows[(object_type_plural, database, schema)]
+
+            rows_by_schema = self.database_rows.get((object_type_plural, database))
+
+            if rows_by_schema is not None:
+                return rows_by_schema.get(schema, [])
+
+        return None
+
+    def _get_schema_rows(self, object_type_plural: str, database: str, schema: str):
+        key = (object_type_plural, database, schema)
+
+        with self._lock:
+            key_lock = self._key_locks[key]
+
+        # Only one thread retrieves each listing, other threads are waiting for result
+        with key_lock:
+            with self._lock:
+                if key in self.schema_rows:
+                    return self.schema_rows[key]
+
+            cur = self.engine.execute_meta(
+                "SHOW {object_type_plural:r} IN SCHEMA {database:i}.{schema:i}",
+                {
+                    "object_type_plural": object_type_plural,
+                    "database": database,
+                    "schema": schema,
+                },
+            )
+
+            rows = cur.fetchall()
+
+            with self._lock:
+                self.schema_rows[key] = rows
+
+            return rows
+
+    def _get_database_rows(self, object_type_plural: str, database: str, schema_column: str):
+        key = (object_type_plural, database)
+
+        with self._lock:
+            key_lock = self._key_locks[key]
+
+        # Only one thread retrieves metadata for each database, other threads are waiting for result
+        with key_lock:
+            with self._lock:
+                if key in self.database_rows:
+                    return self.database_rows[key]
+
+            cur = self.engine.execute_meta(
+                "SHOW {object_type_plural:r} IN DATABASE {database:i}",
+                {
+                    "object_type_plural": object_type_plural,
+                    "database": database,
+                },
+            )
+
+            rows = cur.fetchall()
+
+            # Result might be truncated, fall back to individual SHOW commands for each schema
+            if len(rows) >= self.show_row_limit:
+                rows_by_schema = None
+            else:
+                rows_by_schema = defaultdict(list)
+
+                for r in rows:
+                    rows_by_schema[r[schema_column]].append(r)
+
+            with self._lock:
+                self.database_rows[key] = rows_by_schema
+
+            return rows_by_schema
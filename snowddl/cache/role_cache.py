@@ -0,0 +1,456 @@
+from collections import defaultdict
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from snowddl.blueprint import ObjectType, build_grant_name_ident
+from snowddl.error import SnowDDLExecuteError
+
+if TYPE_CHECKING:
+    from snowddl.engine import SnowDDLEngine
+
+
+class RoleCache:
+    # Number of most recently created roles used to check if bulk grants are up to date
+    bulk_grants_probe_roles = 3
+
+    # SHOW commands return at most 10000 rows, larger results are truncated
+    show_row_limit = 10000
+
+    def __init__(self, engine: "SnowDDLEngine"):
+        self.engine = engine
+
+        # Roles are loaded on first request, runs without role resolvers do not need them
+        self.roles: Optional[Dict[str, Dict]] = None
+        self.role_created_on: Dict[str, object] = {}
+
+        # Patterns of roles loaded individually, used when SHOW ROLES for env prefix was truncated
+        self.loaded_patterns: Optional[Set[Tuple[str, str]]] = None
+        self.role_grants: Dict[str, Tuple] = {}
+
+        # Rows of SHOW GRANTS TO ROLE and SHOW FUTURE GRANTS TO ROLE for all roles, loaded in bulk
+        self.bulk_grant_rows: Optional[Dict[str, List[Dict]]] = None
+        self.bulk_future_grant_rows: Optional[Dict[str, List[Dict]]] = None
+        self.bulk_stale_roles: Set[str] = set()
+        self.is_bulk_loaded = False
+
+        self._lock = Lock()
+        self._load_lock = Lock()
+        self._bulk_load_lock = Lock()
+        self._key_locks: Dict[str, Lock] = defaultdict(Lock)
+
+    def get_roles(self, pattern: Tuple[str, str]) -> Dict[str, Dict]:
+        # Equivalent of SHOW ROLES LIKE {pattern:lse}, LIKE is case-insensitive
+        prefix = pattern[0].upper()
+        suffix = pattern[1].upper()
+
+        self._load_roles()
+
+        if self.loaded_patterns is not None:
+            self._load_roles_by_pattern(pattern)
+
+        # Bulk grants are loaded by resolver thread, since loading uses engine executor
+        if self.engine.settings.bulk_grants:
+            self._load_bulk_grants()
+
+        with self._lock:
+            return {
+                role_name: dict(role)
+                for role_name, role in self.roles.items()
+                if role_name.upper().startswith(prefix) and role_name.upper().endswith(suffix)
+            }
+
+    def get_role_grants(self, role_name: str, loader: Callable[[str], Tuple]) -> Tuple:
+        with self._lock:
+            key_lock = self._key_locks[role_name]
+
+        # Only one thread retrieves grants of each role, other threads are waiting for result
+        with key_lock:
+            with self._lock:
+                if role_name in self.role_grants:
+                    return self._copy_role_grants(self.role_grants[role_name])
+
+            role_grants = loader(role_name)
+
+            with self._lock:
+                self.role_grants[role_name] = role_grants
+
+            return self._copy_role_grants(role_grants)
+
+    def get_grant_rows(self, role_name: str) -> List[Dict]:
+        # Equivalent of SHOW GRANTS TO ROLE
+        bulk_rows = self._get_bulk_rows(role_name, "bulk_grant_rows")
+
+        if bulk_rows is not None:
+            return bulk_rows
+
+        cur = self.engine.execute_meta(
+            "SHOW GRANTS TO ROLE {role_name:i}",
+            {
+                "role_name": role_name,
+            },
+        )
+
+        return cur.fetchall()
+
+    def get_future_grant_rows(self, role_name: str) -> List[Dict]:
+        # Equivalent of SHOW FUTURE GRANTS TO ROLE
+        bulk_rows = self._get_bulk_rows(role_name, "bulk_future_grant_rows")
+
+        if bulk_rows is not None:
+            return bulk_rows
+
+        cur = self.engine.execute_meta(
+            "SHOW FUTURE GRANTS TO ROLE {role_name:i}",
+            {
+                "role_name": role_name,
+            },
+        )
+
+        return cur.fetchall()
+
+    def add_role(self, role_name: str, comment: Optional[str]):
+        self._load_roles()
+
+        with self._lock:
+            self.roles[role_name] = {
+                "role_name": role_name,
+                "comment": comment,
+            }
+
+            self.role_grants.pop(role_name, None)
+            self.bulk_stale_roles.add(role_name)
+
+    def set_role_comment(self, role_name: str, comment: Optional[str]):
+        with self._lock:
+            if self.roles and role_name in self.roles:
+                self.roles[role_name]["comment"] = comment
+
+    def remove_role(self, role_name: str):
+        with self._lock:
+            if self.roles:
+                self.roles.pop(role_name, None)
+
+            self.role_grants.pop(role_name, None)
+
+    def invalidate_role_grants(self, role_name: str):
+        # Grants might be applied asynchronously and fail later, so they are loaded again on next request
+        with self._lock:
+            self.role_grants.pop(role_name, None)
+            self.bulk_stale_roles.add(role_name)
+
+    def _load_roles(self):
+        # Only one thread retrieves roles, other threads are waiting for result
+        with self._load_lock:
+            if self.roles is not None:
+                return
+
+            cur = self.engine.execute_meta(
+                "SHOW ROLES LIKE {env_prefix:ls}",
+                {
+                    "env_prefix": self.engine.config.env_prefix,
+                },
+            )
+
+            rows = cur.fetchall()
+
+            # Result might be truncated, fall back to individual SHOW ROLES for pattern of each role resolver
+            if len(rows) >= self.show_row_limit:
+                self.engine.logger.info(
+                    f"Number of roles exceeds SHOW ROLES limit [{self.show_row_limit}], "
+                    f"roles are retrieved for each role type individually"
+                )
+
+                with self._lock:
+                    self.roles = {}
+                    self.loaded_patterns = set()
+
+                return
+
+            roles = self._build_roles(rows)
+
+            with self._lock:
+                self.roles = roles
+
+    def _load_roles_by_pattern(self, pattern: Tuple[str, str]):
+        with self._load_lock:
+            if pattern in self.loaded_patterns:
+                return
+
+            cur = self.engine.execute_meta(
+                "SHOW ROLES LIKE {pattern:lse}",
+                {
+                    "pattern": pattern,
+                },
+            )
+
+            rows = cur.fetchall()
+
+            if len(rows) >= self.show_row_limit:
+                self.engine.logger.warning(
+                    f"Number of roles matching pattern [{pattern[0]}%{pattern[1]}] "
+                    f"exceeds SHOW ROLES limit [{self.show_row_limit}], some roles might be missing"
+                )
+
+            roles = self._build_roles(rows)
+
+            with self._lock:
+                self.roles.update(roles)
+                self.loaded_patterns.add(pattern)
+
+    def _build_roles(self, rows: List[Dict]) -> Dict[str, Dict]:
+        roles = {}
+
+        for r in rows:
+            if r["owner"] != self.engine.context.current_role:
+                continue
+
+            roles[r["name"]] = {
+                "role_name": r["name"],
+                "comment": r["comment"] if r["comment"] else None,
+            }
+
+            self.role_created_on[r["name"]] = r["created_on"]
+
+        return roles
+
+    def _get_bulk_rows(self, role_name: str, attr_name: str):
+        with self._lock:
+            if not self.is_bulk_loaded:
+                return None
+
+            # Grants of roles changed during current run are always retrieved from Snowflake
+            if role_name in self.bulk_stale_roles:
+                return None
+
+            bulk_rows = getattr(self, attr_name)
+
+            if bulk_rows is None:
+                return None
+
+            return list(bulk_rows.get(role_name, []))
+
+    def _load_bulk_grants(self):
+        # Only one thread retrieves grants, other threads are waiting for result
+        with self._bulk_load_lock:
+            if self.is_bulk_loaded:
+                return
+
+            self._load_roles()
+
+            # Bulk grants are matched with all known roles, which are not available if SHOW ROLES was truncated
+            if self.loaded_patterns is not None:
+                self.engine.logger.info("Bulk grants are not available, grants are retrieved for each role individually")
+
+                with self._lock:
+                    self.is_bulk_loaded = True
+
+                return
+
+            bulk_grant_rows = self._load_bulk_grant_rows()
+
+            if bulk_grant_rows is not None and not self._is_bulk_grant_rows_fresh(bulk_grant_rows):
+                bulk_grant_rows = None
+
+            bulk_future_grant_rows = self._load_bulk_future_grant_rows()
+
+            with self._lock:
+                self.bulk_grant_rows = bulk_grant_rows
+                self.bulk_future_grant_rows = bulk_future_grant_rows
+                self.is_bulk_loaded = True
+
+    def _load_bulk_grant_rows(self):
+        # ACCOUNT_USAGE requires warehouse
+        if not self.engine.context.current_warehouse:
+            self.engine.logger.warning("Bulk grants require warehouse, grants are retrieved for each role individually")
+            return None
+
+        # ACCOUNT_USAGE is not affected by row limit of SHOW commands, result is fetched in chunks while iterating
+        try:
+            cur = self.engine.execute_meta(
+                "SELECT GRANTEE_NAME, PRIVILEGE, GRANTED_ON, TABLE_CATALOG, TABLE_SCHEMA, NAME "
+                "FROM SNOWFLAKE.ACCOUNT_USAGE.GRANTS_TO_ROLES "
+                "WHERE GRANTED_TO = 'ROLE' AND DELETED_ON IS NULL AND STARTSWITH(GRANTEE_NAME, {env_prefix})",
+                {
+                    "env_prefix": self.engine.config.env_prefix,
+                },
+            )
+        except SnowDDLExecuteError as e:
+            self.engine.logger.warning(
+                f"Could not retrieve bulk grants, grants are retrieved for each role individually: \n{e.verbose_message()}"
+            )
+            return None
+
+        bulk_grant_rows = defaultdict(list)
+
+        for r in cur:
+            # Grants of roles created by other roles are not used
+            if r["GRANTEE_NAME"] not in self.roles:
+                continue
+
+            bulk_grant_rows[r["GRANTEE_NAME"]].append(
+                {
+                    "privilege": r["PRIVILEGE"],
+                    "granted_on": r["GRANTED_ON"],
+                    "name": self._get_bulk_grant_name(r),
+                }
+            )
+
+        return bulk_grant_rows
+
+    def _load_bulk_future_grant_rows(self):
+        # Future grants are not available in ACCOUNT_USAGE, but can be retrieved for each database and schema
+        # Roles may have future grants in databases not known to schema cache, so it is only possible without filters
+        if self.engine.settings.include_databases:
+            return None
+
+        # Databases owned by other roles or without env prefix are not known to schema cache, but may contain future grants
+        cur = self.engine.execute_meta("SHOW DATABASES")
+
+        for r in cur:
+            if not r["origin"] and r["name"] not in self.engine.schema_cache.databases:
+                self.engine.logger.info(
+                    f"Database [{r['name']}] is not managed by SnowDDL, future grants are retrieved for each role individually"
+                )
+                return None
+
+        bulk_future_grant_rows = defaultdict(list)
+
+        containers = [("DATABASE", d["database"]) for d in self.engine.schema_cache.databases.values()]
+        containers.extend(("SCHEMA", (s["database"], s["schema"])) for s in self.engine.schema_cache.schemas.values())
+
+        for rows in self.engine.executor.map(self._get_container_future_grant_rows, containers):
+            for r in rows:
+                if r["grantee_name"] in self.roles:
+                    bulk_future_grant_rows[r["grantee_name"]].append(r)
+
+        return bulk_future_grant_rows
+
+    def _get_container_future_grant_rows(self, container: Tuple[str, object]):
+        container_type, container_name = container
+
+        if container_type == "DATABASE":
+            cur = self.engine.execute_meta(
+                "SHOW FUTURE GRANTS IN DATABASE {database:i}",
+                {
+                    "database": container_name,
+                },
+            )
+        else:
+            cur = self.engine.execute_meta(
+                "SHOW FUTURE GRANTS IN SCHEMA {database:i}.{schema:i}",
+                {
+                    "database": container_name[0],
+                    "schema": container_name[1],
+                },
+            )
+
+        return [r for r in cur if r["grant_to"] == "ROLE"]
+
+    def _is_bulk_grant_rows_fresh(self, bulk_grant_rows: Dict[str, List[Dict]]):
+        # ACCOUNT_USAGE has latency, recently created roles are the most likely to be missing or incomplete
+        probe_role_names = sorted(self.roles, key=lambda role_name: self.role_created_on[role_name], reverse=True)
+
+        for role_name in probe_role_names[: self.bulk_grants_probe_roles]:
+            cur = self.engine.execute_meta(
+                "SHOW GRANTS TO ROLE {role_name:i}",
+                {
+                    "role_name": role_name,
+                },
+            )
+
+            live_keys = {self._get_probe_key(r) for r in cur}
+            bulk_keys = {self._get_probe_key(r) for r in bulk_grant_rows.get(role_name, [])}
+
+            if live_keys != bulk_keys:
+                self.engine.logger.warning(
+                    f"Bulk grants of role [{role_name}] do not match SHOW GRANTS, ACCOUNT_USAGE is lagging behind, "
+                    f"grants are retrieved for each role individually"
+                )
+
+                return False
+
+        return True
+
+    def _get_bulk_grant_name(self, row: Dict):
+        name = row["NAME"]
+
+        if row["GRANTED_ON"] in ("FUNCTION", "PROCEDURE"):
+            name = self._get_bulk_signature(name)
+
+        # Name is built in the same format as in SHOW GRANTS output
+        if row["TABLE_SCHEMA"]:
+            return f"{row['TABLE_CATALOG']}.{row['TABLE_SCHEMA']}.{name}"
+
+        if row["TABLE_CATALOG"] and row["GRANTED_ON"] != "DATABASE":
+            return f"{row['TABLE_CATALOG']}.{name}"
+
+        return name
+
+    def _get_bulk_signature(self, name: str):
+        # ACCOUNT_USAGE returns signature without quotes, arguments may have no names and may have precision, e.g. F(NUMBER(38,0))
+        # SHOW GRANTS returns quoted signature with names and data types of arguments, e.g. "F(A NUMBER):NUMBER(38,0)"
+        # Signature is converted to quoted format with data types only, which is parsed into the same identifier
+        name = name.strip('"')
+        start_idx = name.find("(")
+
+        if start_idx < 0:
+            return f'"{name}"'
+
+        arguments = []
+        current = ""
+        depth = 0
+        finish_idx = None
+
+        for idx in range(start_idx + 1, len(name)):
+            char = name[idx]
+
+            if char == ")" and depth == 0:
+                finish_idx = idx
+                break
+
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+
+            if char == "," and depth == 0:
+                arguments.append(current)
+                current = ""
+            else:
+                current += char
+
+        if finish_idx is None:
+            return f'"{name}"'
+
+        if current.strip():
+            arguments.append(current)
+
+        data_types = []
+
+        for arg in arguments:
+            arg = arg.strip()
+
+            if "(" in arg:
+                arg = arg[: arg.index("(")]
+
+            data_types.append(arg.strip().split(" ")[-1])
+
+        return f'"{name[:start_idx]}({", ".join(data_types)}){name[finish_idx + 1:]}"'
+
+    def _get_probe_key(self, row: Dict):
+        # Name of account is formatted differently in ACCOUNT_USAGE, other names are compared as identifiers, same as grants
+        if row["granted_on"] == "ACCOUNT":
+            name = ""
+        else:
+            try:
+                name = str(build_grant_name_ident(self.engine.config.env_prefix, row["name"], ObjectType[row["granted_on"]]))
+            except (KeyError, ValueError):
+                name = row["name"]
+
+        return row["privilege"], row["granted_on"], name
+
+    def _copy_role_grants(self, role_grants: Tuple):
+        # Callers may modify lists of grants, cached lists are not shared
+        role_name, grants, account_grants, future_grants = role_grants
+
+        return role_name, list(grants), list(account_grants), list(future_grants)
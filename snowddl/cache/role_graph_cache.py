@@ -0,0 +1,178 @@
+from threading import Lock
+from typing import Dict, List, Set, Tuple, TYPE_CHECKING
+
+from snowddl.blueprint import Grant, ObjectType, RoleBlueprint
+
+if TYPE_CHECKING:
+    from snowddl.engine import SnowDDLEngine
+
+
+class RoleGraphCache:
+    def __init__(self, engine: "SnowDDLEngine"):
+        self.engine = engine
+
+        # Blueprints of roles processed during current run, roles are added by resolvers one by one
+        # Inherited roles are always resolved earlier, so graph is complete for each new role
+        self.roles: Dict[str, RoleBlueprint] = {}
+        self.redundant_grants: Dict[str, List[Tuple[Grant, str]]] = {}
+        self.skipped_grant_count = 0
+
+        self._inherited_roles: Dict[str, Set[str]] = {}
+        self._grant_keys: Dict[str, Set[Tuple]] = {}
+
+        self._lock = Lock()
+
+    def split_redundant_grants(self, bp: RoleBlueprint) -> Tuple[List[Grant], List[Tuple[Grant, str]]]:
+        # Returns grants which are still required and redundant grants with names of roles implying them
+        # Grants are checked one by one against remaining grants, so mutually implied grants are not dropped together
+        role_name = str(bp.full_name)
+
+        remaining_grants = list(bp.grants)
+        redundant_grants = []
+
+        with self._lock:
+            for grant in bp.grants:
+                # There is only one owner, OWNERSHIP is never implied
+                if grant.privilege == "OWNERSHIP":
+                    continue
+
+                other_grants = list(remaining_grants)
+                other_grants.remove(grant)
+
+                implied_by = self._find_implying_role(role_name, grant, other_grants)
+
+                if implied_by:
+                    remaining_grants.remove(grant)
+                    redundant_grants.append((grant, implied_by))
+
+        return remaining_grants, redundant_grants
+
+    def add_roles(self, blueprints: Dict[str, RoleBlueprint], redundant_grants: Dict[str, List[Tuple[Grant, str]]]):
+        with self._lock:
+            for full_name, bp in blueprints.items():
+                self.roles[full_name] = bp
+
+            for full_name, grants in redundant_grants.items():
+                self.redundant_grants[full_name] = grants
+
+            # New roles might be inherited by roles added earlier, inheritance is calculated again on next request
+            self._inherited_roles = {}
+            self._grant_keys = {}
+
+    def add_skipped_grants(self, skipped_grant_count: int):
+        with self._lock:
+            self.skipped_grant_count += skipped_grant_count
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = {
+                "roles": len(self.roles),
+                "role_grants": 0,
+                "object_grants": 0,
+                "future_grants": 0,
+                "account_grants": 0,
+                "effective_grants": 0,
+                "max_depth": 0,
+                "redundant_grants": sum(len(grants) for grants in self.redundant_grants.values()),
+                "skipped_grants": self.skipped_grant_count,
+            }
+
+            depths = {}
+
+            for role_name, bp in self.roles.items():
+                for grant in bp.grants:
+                    if self._is_role_grant(grant):
+                        stats["role_grants"] += 1
+                    else:
+                        stats["object_grants"] += 1
+
+                stats["future_grants"] += len(bp.future_grants)
+                stats["account_grants"] += len(bp.account_grants)
+
+                # Number of distinct privileges available to role, including privileges of all inherited roles
+                effective_keys = set(self._get_grant_keys(role_name))
+
+                for inherited_role_name in self._get_inherited_roles(role_name):
+                    effective_keys.update(self._get_grant_keys(inherited_role_name))
+
+                stats["effective_grants"] += len(effective_keys)
+                stats["max_depth"] = max(stats["max_depth"], self._get_depth(role_name, depths, set()))
+
+            return stats
+
+    def _find_implying_role(self, role_name: str, grant: Grant, other_grants: List[Grant]):
+        for other_grant in other_grants:
+            if not self._is_role_grant(other_grant):
+                continue
+
+            other_role_name = str(other_grant.name)
+            reachable_role_names = {other_role_name} | self._get_inherited_roles(other_role_name)
+
+            # Grants implied only through cycle back to the same role cannot be dropped
+            if role_name in reachable_role_names:
+                continue
+
+            if self._is_role_grant(grant):
+                if str(grant.name) in reachable_role_names:
+                    return other_role_name
+            else:
+                if any(grant.key() in self._get_grant_keys(name) for name in reachable_role_names):
+                    return other_role_name
+
+        return None
+
+    def _get_inherited_roles(self, role_name: str) -> Set[str]:
+        if role_name not in self._inherited_roles:
+            inherited_role_names = set()
+            pending_role_names = self._get_granted_role_names(role_name)
+
+            while pending_role_names:
+                name = pending_role_names.pop()
+
+                if name in inherited_role_names:
+                    continue
+
+                inherited_role_names.add(name)
+                pending_role_names.extend(self._get_granted_role_names(name))
+
+            inherited_role_names.discard(role_name)
+            self._inherited_roles[role_name] = inherited_role_names
+
+        return self._inherited_roles[role_name]
+
+    def _get_granted_role_names(self, role_name: str) -> List[str]:
+        # Roles unknown to graph (e.g. global roles, roles of skipped resolvers) have no known grants
+        if role_name not in self.roles:
+            return []
+
+        return [str(grant.name) for grant in self.roles[role_name].grants if self._is_role_grant(grant)]
+
+    def _get_grant_keys(self, role_name: str) -> Set[Tuple]:
+        if role_name not in self._grant_keys:
+            if role_name in self.roles:
+                self._grant_keys[role_name] = {
+                    grant.key() for grant in self.roles[role_name].grants if not self._is_role_grant(grant)
+                }
+            else:
+                self._grant_keys[role_name] = set()
+
+        return self._grant_keys[role_name]
+
+    def _get_depth(self, role_name: str, depths: Dict[str, int], visiting: Set[str]) -> int:
+        if role_name in depths:
+            return depths[role_name]
+
+        # Cycles are not allowed by Snowflake, but config may still contain them
+        if role_name in visiting:
+            return 0
+
+        visiting.add(role_name)
+        depth = max((self._get_depth(name, depths, visiting) + 1 for name in self._get_granted_role_names(role_name)), default=0)
+        visiting.discard(role_name)
+
+        depths[role_name] = depth
+
+        return depth
+
+    def _is_role_grant(self, grant: Grant):
+        return grant.privilege == "USAGE" and grant.on == ObjectType.ROLE
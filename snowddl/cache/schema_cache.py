@@ -48,9 +48,14 @@ class SchemaCache:
             }
 
         # Process schemas in parallel
-        for database_schemas in self.engine.executor.map(self._get_database_schemas, self.databases):
+        for database_schemas in self.engine.executor.map(self._get_database_schemas_from_snapshot, self.databases):
             self.schemas.update(database_schemas)
 
+    def _get_database_schemas_from_snapshot(self, database_name):
+        return self.engine.snapshot_cache.get_or_load(
+            self.__class__.__name__, database_name, "", self._get_database_schemas, database_name
+        )
+
     def _get_database_schemas(self, database_name):
         schemas = {}
 
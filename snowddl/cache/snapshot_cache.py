@@ -0,0 +1,199 @@
+from collections import defaultdict
+from hashlib import sha256
+from os import replace
+from pathlib import Path
+from pickle import dump, load, HIGHEST_PROTOCOL
+from threading import Lock
+from time import time
+from typing import Dict, Optional, Set, TYPE_CHECKING
+
+from snowddl.blueprint import ObjectType
+from snowddl.error import SnowDDLExecuteError
+
+if TYPE_CHECKING:
+    from snowddl.engine import SnowDDLEngine
+
+
+class SnapshotCache:
+    snapshot_version = 1
+
+    # INFORMATION_SCHEMA views used to detect changes in database
+    probe_views = [
+        "SCHEMATA",
+        "TABLES",
+        "EXTERNAL_TABLES",
+        "TABLE_CONSTRAINTS",
+        "FUNCTIONS",
+        "PROCEDURES",
+        "SEQUENCES",
+        "STAGES",
+        "FILE_FORMATS",
+        "PIPES",
+    ]
+
+    # Changes of these object types are reflected in probe views, other object types are never taken from snapshot
+    probe_object_types = [
+        ObjectType.TABLE,
+        ObjectType.DYNAMIC_TABLE,
+        ObjectType.EVENT_TABLE,
+        ObjectType.EXTERNAL_TABLE,
+        ObjectType.HYBRID_TABLE,
+        ObjectType.ICEBERG_TABLE,
+        ObjectType.PRIMARY_KEY,
+        ObjectType.UNIQUE_KEY,
+        ObjectType.FOREIGN_KEY,
+        ObjectType.VIEW,
+        ObjectType.MATERIALIZED_VIEW,
+        ObjectType.FUNCTION,
+        ObjectType.EXTERNAL_FUNCTION,
+        ObjectType.PROCEDURE,
+        ObjectType.SEQUENCE,
+        ObjectType.STAGE,
+        ObjectType.FILE_FORMAT,
+        ObjectType.PIPE,
+    ]
+
+    def __init__(self, engine: "SnowDDLEngine"):
+        self.engine = engine
+
+        self.snapshot_file: Optional[Path] = None
+        self.snapshot: Dict[str, Dict] = {}
+
+        self.fingerprints: Dict[str, Optional[tuple]] = {}
+        self.entries: Dict[str, Dict[tuple, object]] = defaultdict(dict)
+        self.invalidated_databases: Set[str] = set()
+
+        self._lock = Lock()
+        self._database_locks: Dict[str, Lock] = defaultdict(Lock)
+
+        # Probe queries on INFORMATION_SCHEMA require warehouse
+        if self.engine.settings.snapshot_path and self.engine.context.current_warehouse:
+            self.snapshot_file = Path(self.engine.settings.snapshot_path) / f"snowddl_snapshot_{self._get_snapshot_key()}.pickle"
+            self.snapshot = self._load_snapshot()
+
+    def is_enabled(self):
+        return self.snapshot_file is not None
+
+    def get_or_load(self, section: str, database: str, key: str, loader, *args):
+        if not self.is_enabled():
+            return loader(*args)
+
+        fingerprint = self._get_fingerprint(database)
+        database_snapshot = self.snapshot.get(database)
+
+        if (
+            fingerprint is not None
+            and database not in self.invalidated_databases
+            and database_snapshot
+            and database_snapshot["fingerprint"] == fingerprint
+            and time() - database_snapshot["created_at"] < self.engine.settings.snapshot_ttl
+            and (section, key) in database_snapshot["entries"]
+        ):
+            value = database_snapshot["entries"][(section, key)]
+        else:
+            value = loader(*args)
+
+        with self._lock:
+            # Only values matching fingerprint obtained at the beginning of run can be stored
+            if fingerprint is not None and database not in self.invalidated_databases:
+                self.entries[database][(section, key)] = value
+
+        return value
+
+    def invalidate(self, database: str):
+        with self._lock:
+            self.invalidated_databases.add(database)
+            self.entries.pop(database, None)
+
+    def save(self):
+        if not self.is_enabled():
+            return
+
+        snapshot = {}
+
+        # Databases which were not checked during this run remain in snapshot as is
+        for database, database_snapshot in self.snapshot.items():
+            if database not in self.fingerprints and database not in self.invalidated_databases:
+                snapshot[database] = database_snapshot
+
+        for database, entries in self.entries.items():
+            database_snapshot = self.snapshot.get(database)
+
+            # Age of snapshot is preserved for unchanged databases, so stale entries are refreshed at least once per TTL
+            if database_snapshot and database_snapshot["fingerprint"] == self.fingerprints[database]:
+                created_at = database_snapshot["created_at"]
+            else:
+                created_at = time()
+
+            snapshot[database] = {
+                "fingerprint": self.fingerprints[database],
+                "created_at": created_at,
+                "entries": entries,
+            }
+
+        self.snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.snapshot_file.with_suffix(".tmp")
+
+        with open(tmp_file, "wb") as f:
+            dump({"version": self.snapshot_version, "databases": snapshot}, f, protocol=HIGHEST_PROTOCOL)
+
+        replace(tmp_file, self.snapshot_file)
+
+    def _get_snapshot_key(self):
+        key_parts = [
+            self.engine.context.current_account,
+            self.engine.context.current_role,
+            self.engine.config.env_prefix,
+        ]
+
+        return sha256("|".join(str(p) for p in key_parts).encode("utf-8")).hexdigest()[:16]
+
+    def _load_snapshot(self):
+        if not self.snapshot_file.is_file():
+            return {}
+
+        try:
+            with open(self.snapshot_file, "rb") as f:
+                data = load(f)
+        except Exception as e:
+            self.engine.logger.warning(f"Could not load metadata snapshot [{self.snapshot_file}]: {e}")
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != self.snapshot_version:
+            return {}
+
+        return data["databases"]
+
+    def _get_fingerprint(self, database: str):
+        with self._lock:
+            database_lock = self._database_locks[database]
+
+        # Probe is executed only once per database during run
+        with database_lock:
+            if database in self.fingerprints:
+                return self.fingerprints[database]
+
+            query_parts = []
+
+            for view_name in self.probe_views:
+                query_parts.append(
+                    self.engine.format(
+                        "SELECT {view_name} AS VIEW_NAME, COUNT(*) AS OBJECT_COUNT, MAX(LAST_ALTERED) AS LAST_ALTERED "
+                        "FROM {database:i}.INFORMATION_SCHEMA.{view_name:r}",
+                        {
+                            "database": database,
+                            "view_name": view_name,
+                        },
+                    )
+                )
+
+            try:
+                cur = self.engine.execute_meta("\nUNION ALL\n".join(query_parts))
+                fingerprint = tuple(sorted((r["VIEW_NAME"], r["OBJECT_COUNT"], str(r["LAST_ALTERED"])) for r in cur))
+            except SnowDDLExecuteError as e:
+                self.engine.logger.info(f"Could not probe changes in database [{database}]: \n{e.verbose_message()}")
+                fingerprint = None
+
+            self.fingerprints[database] = fingerprint
+
+            return fingerprint
@@ -6,6 +6,7 @@ from snowddl.blueprint import (
     AbstractIdentWithPrefix,
     AbstractPolicyReference,
     IdentPattern,
+    IdentPatternIndex,
     ObjectType,
     PermissionModel,
     PermissionModelRuleset,
@@ -15,6 +16,14 @@ from snowddl.blueprint import (
 )
 
 
+def get_placeholder(placeholders: dict, name: str) -> Union[bool, float, int, str, List[Union[bool, float, int, str]]]:
+    # Shared with parser worker processes, which do not have access to config object
+    if name not in placeholders:
+        raise ValueError(f"Unknown placeholder [{name}]")
+
+    return placeholders[name]
+
+
 class SnowDDLConfig:
     DATABASE_ACCESS_ROLE_SUFFIX = "D_ROLE"
     SCHEMA_ACCESS_ROLE_SUFFIX = "S_ROLE"
@@ -40,17 +49,22 @@ class SnowDDLConfig:
         self.placeholders: Dict[str, Union[bool, float, int, str]] = {}
         self.permission_models: Dict[str, PermissionModel] = self._init_permission_models()
 
+        self.pattern_indexes: Dict[Type[T_Blueprint], IdentPatternIndex] = {}
+
     def get_blueprints_by_type(self, cls: Type[T_Blueprint]) -> Dict[str, T_Blueprint]:
         return self.blueprints.get(cls, {})
 
     def get_blueprints_by_type_and_pattern(self, cls: Type[T_Blueprint], pattern: IdentPattern) -> Dict[str, T_Blueprint]:
-        return {full_name: bp for full_name, bp in self.blueprints.get(cls, {}).items() if pattern.is_match_ident(bp.full_name)}
+        if not self.blueprints.get(cls):
+            return {}
 
-    def get_placeholder(self, name: str) -> Union[bool, float, int, str, List[Union[bool, float, int, str]]]:
-        if name not in self.placeholders:
-            raise ValueError(f"Unknown placeholder [{name}]")
+        if cls not in self.pattern_indexes:
+            self.pattern_indexes[cls] = IdentPatternIndex(self.blueprints[cls])
+
+        return self.pattern_indexes[cls].get_blueprints_by_pattern(pattern)
 
-        return self.placeholders[name]
+    def get_placeholder(self, name: str) -> Union[bool, float, int, str, List[Union[bool, float, int, str]]]:
+        return get_placeholder(self.placeholders, name)
 
     def get_permission_model(self, name: Optional[str]) -> PermissionModel:
         if name is None:
@@ -62,12 +76,19 @@ class SnowDDLConfig:
 
     def add_blueprint(self, bp: AbstractBlueprint):
         self.blueprints[bp.__class__][str(bp.full_name)] = bp
+        self.pattern_indexes.pop(bp.__class__, None)
+
+    def freeze_blueprints(self):
+        for bp_dict in self.blueprints.values():
+            for bp in bp_dict.values():
+                bp.freeze()
 
     def remove_blueprint(self, bp: AbstractBlueprint):
         if str(bp.full_name) not in self.blueprints.get(bp.__class__, {}):
             raise ValueError(f"Blueprint with type [{bp.__class__.__name__}] and name [{bp.full_name}] does not exist in config")
 
         del self.blueprints[bp.__class__][str(bp.full_name)]
+        self.pattern_indexes.pop(bp.__class__, None)
 
     def add_policy_reference(self, cls: Type[T_Blueprint], policy_name: AbstractIdentWithPrefix, ref: AbstractPolicyReference):
         if "references" not in cls.model_fields:
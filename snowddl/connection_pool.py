@@ -0,0 +1,134 @@
+from contextlib import contextmanager
+from queue import LifoQueue, Empty
+from threading import Lock
+from time import monotonic
+from typing import Callable, List, Optional, TYPE_CHECKING
+
+from snowflake.connector import SnowflakeConnection, Error
+
+if TYPE_CHECKING:
+    from snowddl.engine import SnowDDLEngine
+
+
+class SnowDDLConnectionPool:
+    def __init__(
+        self,
+        engine: "SnowDDLEngine",
+        connection_factory: Optional[Callable[[], SnowflakeConnection]] = None,
+        max_connections: int = 1,
+        health_check_interval: int = 300,
+    ):
+        self.engine = engine
+        self.connection_factory = connection_factory
+        self.max_connections = max(max_connections, 1) if connection_factory else 1
+        self.health_check_interval = health_check_interval
+
+        # Main connection is always a part of pool, additional sessions are opened lazily on demand
+        self.all_connections: List[SnowflakeConnection] = [engine.connection]
+        self.idle_connections: LifoQueue = LifoQueue()
+        self.idle_connections.put((engine.connection, monotonic()))
+
+        self._lock = Lock()
+        self._is_closed = False
+
+    @contextmanager
+    def session(self):
+        connection = self.checkout()
+
+        try:
+            yield connection
+        finally:
+            self.checkin(connection)
+
+    def checkout(self) -> SnowflakeConnection:
+        if self._is_closed:
+            return self.engine.connection
+
+        while True:
+            try:
+                connection, last_used_at = self.idle_connections.get_nowait()
+            except Empty:
+                connection = self._open_additional_connection()
+
+                if connection:
+                    return connection
+
+                # Pool is exhausted, wait for another thread to return a session
+                connection, last_used_at = self.idle_connections.get()
+
+            if self._is_healthy(connection, last_used_at):
+                return connection
+
+            self._discard_connection(connection)
+
+    def checkin(self, connection: SnowflakeConnection):
+        if self._is_closed:
+            return
+
+        self.idle_connections.put((connection, monotonic()))
+
+    def close(self):
+        with self._lock:
+            self._is_closed = True
+
+            # Main connection is owned by application and must be closed explicitly by caller
+            for connection in self.all_connections:
+                if connection is self.engine.connection:
+                    continue
+
+                try:
+                    connection.close()
+                except Error:
+                    pass
+
+            self.all_connections = [self.engine.connection]
+
+    def size(self):
+        return len(self.all_connections)
+
+    def _open_additional_connection(self) -> Optional[SnowflakeConnection]:
+        with self._lock:
+            if len(self.all_connections) >= self.max_connections:
+                return None
+
+            connection = self.connection_factory()
+            self.all_connections.append(connection)
+
+        # Additional sessions must share context with main session
+        try:
+            cur = connection.cursor()
+            cur.execute(self.engine.format("USE ROLE {role:i}", {"role": self.engine.context.current_role}))
+
+            if self.engine.context.current_warehouse:
+                cur.execute(
+                    self.engine.format("USE WAREHOUSE {warehouse:i}", {"warehouse": self.engine.context.current_warehouse})
+                )
+        except Error:
+            self._discard_connection(connection)
+            raise
+
+        return connection
+
+    def _is_healthy(self, connection: SnowflakeConnection, last_used_at: float):
+        if connection.is_closed():
+            return False
+
+        # Main connection is always considered healthy, errors will be raised on the next query
+        if connection is self.engine.connection:
+            return True
+
+        # Sessions which were idle for a long time are checked with heartbeat request
+        if monotonic() - last_used_at > self.health_check_interval:
+            return connection.is_valid()
+
+        return True
+
+    def _discard_connection(self, connection: SnowflakeConnection):
+        with self._lock:
+            if connection in self.all_connections:
+                self.all_connections.remove(connection)
+
+        try:
+            connection.close()
+        except Error:
+            pass
@@ -122,6 +122,9 @@ class SnowDDLContext:
         if not self.engine.config.env_prefix:
             return
 
+        # Additional sessions must not keep using role with prefix which is about to be dropped
+        self.engine.connection_pool.close()
+
         self.engine.execute_meta(
             "USE ROLE {original_role:i}",
             {
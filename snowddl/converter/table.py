@@ -19,13 +19,7 @@ class TableConverter(AbstractSchemaObjectConverter):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW TABLES IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.engine.metadata_cache.show_objects_in_schema("TABLES", schema["database"], schema["schema"])
 
         for r in cur:
             # Skip other table types
@@ -1,12 +1,16 @@
 from logging import getLogger, NullHandler
-from threading import get_ident as threading_get_ident
+from threading import get_ident as threading_get_ident, local as threading_local, Lock
+from time import sleep
 
 from collections import defaultdict
+from contextlib import nullcontext
 from concurrent.futures import ThreadPoolExecutor
 from snowflake.connector import DictCursor, SnowflakeConnection, Error
+from typing import Callable, Dict, List, Optional
 
-from snowddl.cache import IntentionCache, SchemaCache
+from snowddl.cache import IntentionCache, MetadataCache, RoleCache, RoleGraphCache, SchemaCache, SnapshotCache
 from snowddl.config import SnowDDLConfig
+from snowddl.connection_pool import SnowDDLConnectionPool
 from snowddl.settings import SnowDDLSettings
 from snowddl.formatter import SnowDDLFormatter
 from snowddl.query_builder import SnowDDLQueryBuilder
@@ -18,8 +22,34 @@ logger = getLogger(__name__)
 logger.addHandler(NullHandler())
 
 
+class SnowDDLDeferredQuery:
+    def __init__(self, sql: str, sfqid: Optional[str] = None, fallback_sqls: Optional[List[str]] = None):
+        self.sql = sql
+        self.sfqid = sfqid
+        self.fallback_sqls = fallback_sqls
+
+        self.is_done = False
+        self.error: Optional[SnowDDLExecuteError] = None
+
+
+class SnowDDLExecutor(ThreadPoolExecutor):
+    # Tasks inherit buffer owner of submitting thread, so DDL of concurrent resolvers is never mixed in buffers
+    def __init__(self, engine: "SnowDDLEngine", **kwargs):
+        super().__init__(**kwargs)
+        self.engine = engine
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(self.engine.run_with_buffer_owner, self.engine.get_buffer_owner(), fn, *args, **kwargs)
+
+
 class SnowDDLEngine:
-    def __init__(self, connection: SnowflakeConnection, config: SnowDDLConfig, settings: SnowDDLSettings):
+    def __init__(
+        self,
+        connection: SnowflakeConnection,
+        config: SnowDDLConfig,
+        settings: SnowDDLSettings,
+        connection_factory: Optional[Callable[[], SnowflakeConnection]] = None,
+    ):
         self.connection = connection
         self.config = config
         self.settings = settings
@@ -28,7 +58,7 @@ class SnowDDLEngine:
         self.formatter = SnowDDLFormatter()
         self.format = self.formatter.format_sql
 
-        self.executor = ThreadPoolExecutor(max_workers=self.settings.max_workers, thread_name_prefix=self.__class__.__name__)
+        self.executor = SnowDDLExecutor(self, max_workers=self.settings.max_workers, thread_name_prefix=self.__class__.__name__)
 
         self.executed_ddl = []
         self.suggested_ddl = []
@@ -36,10 +66,26 @@ class SnowDDLEngine:
         self._executed_ddl_buffer = defaultdict(list)
         self._suggested_ddl_buffer = defaultdict(list)
 
+        self._buffer_lock = Lock()
+        self._buffer_owner = threading_local()
+
+        self._deferred_query_buffer = defaultdict(list)
+        self._async_query_lock = Lock()
+        self._async_query_in_flight = 0
+
+        self.connection_pool = None
+
         self.context = SnowDDLContext(self)
         self.context.activate_role_with_prefix()
 
+        # Additional sessions are opened only after role with prefix was activated in main session
+        self.connection_pool = SnowDDLConnectionPool(self, connection_factory, self.settings.max_connections)
+
         self.intention_cache = IntentionCache(self)
+        self.metadata_cache = MetadataCache(self)
+        self.role_cache = RoleCache(self)
+        self.role_graph_cache = RoleGraphCache(self)
+        self.snapshot_cache = SnapshotCache(self)
         self.schema_cache = SchemaCache(self)
 
     def __enter__(self):
@@ -47,6 +93,11 @@ class SnowDDLEngine:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.executor.shutdown()
+        self.connection_pool.close()
+
+        # Snapshot is saved only after successful run
+        if exc_type is None:
+            self.snapshot_cache.save()
 
     def query_builder(self):
         return SnowDDLQueryBuilder(self.formatter)
@@ -63,53 +114,256 @@ class SnowDDLEngine:
     def execute_context_ddl(self, sql, params=None):
         return self._execute(sql, params)
 
-    def execute_safe_ddl(self, sql, params=None, condition=True, file_stream=None):
+    def execute_safe_ddl(self, sql, params=None, condition=True, file_stream=None, is_independent=False, fallback_params=None):
         if self.settings.execute_safe_ddl and condition:
-            self._execute(sql, params, False, file_stream)
+            if is_independent:
+                self._execute_independent(sql, params, fallback_params)
+            else:
+                self._execute(sql, params, False, file_stream)
         else:
             self._suggest(sql, params)
 
-    def execute_unsafe_ddl(self, sql, params=None, condition=True, file_stream=None):
+    def execute_unsafe_ddl(self, sql, params=None, condition=True, file_stream=None, is_independent=False, fallback_params=None):
         if self.settings.execute_unsafe_ddl and condition:
-            self._execute(sql, params, False, file_stream)
+            if is_independent:
+                self._execute_independent(sql, params, fallback_params)
+            else:
+                self._execute(sql, params, False, file_stream)
         else:
             self._suggest(sql, params)
 
+    def pop_deferred_queries(self) -> List[SnowDDLDeferredQuery]:
+        return self._deferred_query_buffer.pop(threading_get_ident(), [])
+
+    def complete_deferred_queries(self, queries: Dict[str, List[SnowDDLDeferredQuery]]) -> Dict[str, SnowDDLExecuteError]:
+        batched_queries = [q for object_queries in queries.values() for q in object_queries if q.sfqid is None]
+        batches = [
+            batched_queries[i : i + self.settings.max_statements_per_request]
+            for i in range(0, len(batched_queries), self.settings.max_statements_per_request)
+        ]
+
+        # Process multi-statement requests in parallel
+        for _ in self.executor.map(self._execute_batch, batches):
+            pass
+
+        for object_queries in queries.values():
+            for query in object_queries:
+                self._wait_async_query(query)
+
+        queries = self._expand_failed_queries(queries)
+
+        # Report the first error for each object only, similar to synchronous execution which stops on the first error
+        errors = {}
+
+        for full_name, object_queries in queries.items():
+            for query in object_queries:
+                if query.error:
+                    errors.setdefault(full_name, query.error)
+                else:
+                    self._append_to_buffer(self._executed_ddl_buffer, query.sql)
+
+        return errors
+
     def flush_thread_buffers(self):
-        for thread_sql in self._executed_ddl_buffer.values():
-            for sql in thread_sql:
-                self.executed_ddl.append(sql)
+        # Deferred queries submitted outside of resolver tasks must be completed before buffers are flushed
+        # Worker threads might be busy with tasks of concurrent resolvers, so only current thread is checked
+        errors = self.complete_deferred_queries({"": self.pop_deferred_queries()})
 
-        for thread_sql in self._suggested_ddl_buffer.values():
-            for sql in thread_sql:
-                self.suggested_ddl.append(sql)
+        if errors:
+            raise next(iter(errors.values()))
 
-        self._executed_ddl_buffer = defaultdict(list)
-        self._suggested_ddl_buffer = defaultdict(list)
+        # Only DDL of current thread and tasks submitted by it is flushed, concurrent resolvers flush their own DDL
+        owner = self.get_buffer_owner()
+
+        with self._buffer_lock:
+            self.executed_ddl.extend(self._executed_ddl_buffer.pop(owner, []))
+            self.suggested_ddl.extend(self._suggested_ddl_buffer.pop(owner, []))
+
+    def get_buffer_owner(self):
+        return getattr(self._buffer_owner, "ident", None) or threading_get_ident()
+
+    def run_with_buffer_owner(self, owner, fn, *args, **kwargs):
+        # Worker threads are reused, previous owner is restored after each task
+        previous_owner = getattr(self._buffer_owner, "ident", None)
+        self._buffer_owner.ident = owner
+
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._buffer_owner.ident = previous_owner
 
     def _execute(self, sql, params, is_meta=False, file_stream=None):
         sql = self.format(sql, params)
 
         try:
-            result = self.connection.cursor(DictCursor).execute(sql, file_stream=file_stream)
+            with self._session() as connection:
+                result = connection.cursor(DictCursor).execute(sql, file_stream=file_stream)
         except Error as e:
             raise SnowDDLExecuteError(e, sql)
 
         if not is_meta:
-            self._executed_ddl_buffer[threading_get_ident()].append(sql)
+            self._append_to_buffer(self._executed_ddl_buffer, sql)
 
         return result
 
+    def _execute_independent(self, sql, params, fallback_params=None):
+        # Statement combining multiple privileges is repeated for each privilege on failure, if fallback params are provided
+        fallback_sqls = [self.format(sql, p) for p in fallback_params] if fallback_params else None
+
+        # Independent statements are joined into multi-statement requests at the end of resolver batch
+        if self.settings.max_statements_per_request > 1:
+            sql = self.format(sql, params)
+            self._deferred_query_buffer[threading_get_ident()].append(SnowDDLDeferredQuery(sql, fallback_sqls=fallback_sqls))
+        elif self.settings.max_async_queries:
+            self._execute_async(sql, params, fallback_sqls)
+        else:
+            self._execute_with_fallback(sql, params, fallback_sqls)
+
+    def _execute_with_fallback(self, sql, params, fallback_sqls):
+        try:
+            self._execute(sql, params)
+        except SnowDDLExecuteError:
+            if not fallback_sqls:
+                raise
+
+            first_error = None
+
+            for fallback_sql in fallback_sqls:
+                try:
+                    self._execute(fallback_sql, None)
+                except SnowDDLExecuteError as e:
+                    first_error = first_error or e
+
+            if first_error:
+                raise first_error
+
+    def _expand_failed_queries(self, queries: Dict[str, List[SnowDDLDeferredQuery]]) -> Dict[str, List[SnowDDLDeferredQuery]]:
+        # Failed statements with fallback are replaced by fallback statements, so outcome of each statement is recorded
+        expanded_queries = {}
+        fallback_queries = []
+
+        for full_name, object_queries in queries.items():
+            expanded_queries[full_name] = []
+
+            for query in object_queries:
+                if query.error and query.fallback_sqls:
+                    query_fallbacks = [SnowDDLDeferredQuery(fallback_sql) for fallback_sql in query.fallback_sqls]
+
+                    expanded_queries[full_name].extend(query_fallbacks)
+                    fallback_queries.extend(query_fallbacks)
+                else:
+                    expanded_queries[full_name].append(query)
+
+        for _ in self.executor.map(self._execute_batch, [[q] for q in fallback_queries]):
+            pass
+
+        return expanded_queries
+
+    def _execute_batch(self, queries: List[SnowDDLDeferredQuery]):
+        if len(queries) > 1:
+            try:
+                with self._session() as connection:
+                    connection.cursor(DictCursor).execute(
+                        ";\n".join(q.sql for q in queries), num_statements=len(queries)
+                    )
+
+                for query in queries:
+                    query.is_done = True
+
+                return
+            except Error:
+                # Statements are idempotent, so failed request is repeated statement by statement to pinpoint exact error
+                pass
+
+        for query in queries:
+            try:
+                with self._session() as connection:
+                    connection.cursor(DictCursor).execute(query.sql)
+            except Error as e:
+                query.error = SnowDDLExecuteError(e, query.sql)
+
+            query.is_done = True
+
+    def _execute_async(self, sql, params, fallback_sqls=None):
+        sql = self.format(sql, params)
+        thread_queries = self._deferred_query_buffer[threading_get_ident()]
+
+        # Wait for the oldest query of current thread when window of in-flight queries is full
+        while not self._acquire_async_query_slot():
+            pending_queries = [q for q in thread_queries if q.sfqid and not q.is_done]
+
+            if not pending_queries:
+                # Window is occupied by other threads, fall back to synchronous execution
+                self._execute_with_fallback(sql, None, fallback_sqls)
+                return
+
+            self._wait_async_query(pending_queries[0])
+
+        try:
+            with self._session() as connection:
+                cur = connection.cursor(DictCursor)
+                cur.execute_async(sql)
+        except Error as e:
+            self._release_async_query_slot()
+            raise SnowDDLExecuteError(e, sql)
+
+        thread_queries.append(SnowDDLDeferredQuery(sql, cur.sfqid, fallback_sqls))
+
+    def _wait_async_query(self, query: SnowDDLDeferredQuery):
+        if query.is_done or query.sfqid is None:
+            return
+
+        delay = 0.05
+
+        try:
+            while True:
+                with self._session() as connection:
+                    status = connection.get_query_status_throw_if_error(query.sfqid)
+
+                    if not connection.is_still_running(status):
+                        break
+
+                sleep(delay)
+                delay = min(delay * 2, 1.0)
+        except Error as e:
+            query.error = SnowDDLExecuteError(e, query.sql)
+
+        query.is_done = True
+        self._release_async_query_slot()
+
+    def _acquire_async_query_slot(self):
+        with self._async_query_lock:
+            if self._async_query_in_flight >= self.settings.max_async_queries:
+                return False
+
+            self._async_query_in_flight += 1
+            return True
+
+    def _release_async_query_slot(self):
+        with self._async_query_lock:
+            self._async_query_in_flight -= 1
+
     def _describe(self, sql, params):
         sql = self.format(sql, params)
 
         try:
-            result = self.connection.cursor(DictCursor).describe(sql)
+            with self._session() as connection:
+                result = connection.cursor(DictCursor).describe(sql)
         except Error as e:
             raise SnowDDLExecuteError(e, sql)
 
         return result
 
+    def _session(self):
+        if self.connection_pool is None:
+            return nullcontext(self.connection)
+
+        return self.connection_pool.session()
+
     def _suggest(self, sql, params):
         sql = self.format(sql, params)
-        self._suggested_ddl_buffer[threading_get_ident()].append(sql)
+        self._append_to_buffer(self._suggested_ddl_buffer, sql)
+
+    def _append_to_buffer(self, buffer, sql):
+        with self._buffer_lock:
+            buffer[self.get_buffer_owner()].append(sql)
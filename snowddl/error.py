@@ -26,3 +26,7 @@ class SnowDDLExecuteError(Exception):
 
 class SnowDDLUnsupportedError(Exception):
     pass
+
+
+class SnowDDLDependencyError(Exception):
+    pass
@@ -1,6 +1,7 @@
 import re
 import string
 
+from functools import lru_cache
 from snowddl.blueprint import AbstractIdent
 
 
@@ -90,6 +91,12 @@ class SnowDDLFormatter(string.Formatter):
         if not isinstance(val, AbstractIdent):
             return f'"{cls.escape_ident(val)}"'
 
+        return cls._quote_abstract_ident(val)
+
+    @classmethod
+    @lru_cache(maxsize=65536, typed=True)
+    def _quote_abstract_ident(cls, val: AbstractIdent):
+        # Idents are immutable, quoted representation can be reused
         core_parts, argument_parts = val.parts_for_format()
 
         if argument_parts is not None:
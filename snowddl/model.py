@@ -3,9 +3,84 @@ from pydantic import BaseModel, ConfigDict
 
 
 class BaseModelWithConfig(BaseModel, ABC):
+    __slots__ = ("__snowddl_frozen__",)
+
     model_config = ConfigDict(
         allow_inf_nan=False,
         arbitrary_types_allowed=True,
         extra="forbid",
         validate_assignment=True,
     )
+
+    @classmethod
+    def model_construct_trusted(cls, **data):
+        # Fast construction without validation, for internal callers only
+        # All values must have exact types expected by model fields, no coercion is performed
+        unknown_field_names = data.keys() - cls.model_fields.keys()
+
+        if unknown_field_names:
+            raise ValueError(f"Unknown fields {sorted(unknown_field_names)} for {cls.__name__}")
+
+        values = {}
+
+        for field_name, field_info in cls.model_fields.items():
+            if field_name in data:
+                values[field_name] = data[field_name]
+            elif field_info.is_required():
+                raise ValueError(f"Missing required field [{field_name}] for {cls.__name__}")
+            else:
+                values[field_name] = field_info.get_default(call_default_factory=True)
+
+        obj = cls.__new__(cls)
+
+        object.__setattr__(obj, "__dict__", values)
+        object.__setattr__(obj, "__pydantic_fields_set__", set(data))
+        object.__setattr__(obj, "__pydantic_extra__", None)
+        object.__setattr__(obj, "__pydantic_private__", None)
+
+        return obj
+
+    def freeze(self):
+        # Frozen models reject assignment of fields, but nested containers are not frozen
+        object.__setattr__(self, "__snowddl_frozen__", True)
+
+    def is_frozen(self):
+        return getattr(self, "__snowddl_frozen__", False)
+
+    def __copy__(self):
+        # Copies of frozen model are frozen as well, including .model_copy(update=...)
+        copied = super().__copy__()
+
+        if self.is_frozen():
+            copied.freeze()
+
+        return copied
+
+    def __deepcopy__(self, memo=None):
+        copied = super().__deepcopy__(memo)
+
+        if self.is_frozen():
+            copied.freeze()
+
+        return copied
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["__snowddl_frozen__"] = self.is_frozen()
+
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        is_frozen = state.pop("__snowddl_frozen__", False)
+
+        super().__setstate__(state)
+
+        if is_frozen:
+            self.freeze()
+
+    def __setattr__(self, name, value):
+        if self.is_frozen():
+            raise ValueError(f"Cannot set field [{name}], {self.__class__.__name__} is frozen")
+
+        super().__setattr__(name, value)
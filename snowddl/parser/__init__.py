@@ -1,3 +1,5 @@
+from snowddl.blueprint import ObjectType
+
 from ._parsed_file import ParsedFile
 from ._scanner import DirectoryScanner
 from .abc_parser import AbstractParser
@@ -118,3 +120,118 @@ singledb_parse_sequence = [
     TaskParser,
     AlertParser,
 ]
+
+
+# Object types resolved with blueprints created by each parser
+# Parsers which are not listed here are never skipped
+default_parse_object_types = {
+    AccountParameterParser: [ObjectType.ACCOUNT_PARAMETER],
+    AggregationPolicyParser: [ObjectType.AGGREGATION_POLICY],
+    AuthenticationPolicyParser: [ObjectType.AUTHENTICATION_POLICY],
+    MaskingPolicyParser: [ObjectType.MASKING_POLICY],
+    NetworkPolicyParser: [ObjectType.NETWORK_POLICY],
+    ProjectionPolicyParser: [ObjectType.PROJECTION_POLICY],
+    RowAccessPolicyParser: [ObjectType.ROW_ACCESS_POLICY],
+    ResourceMonitorParser: [ObjectType.RESOURCE_MONITOR],
+    AccountPolicyParser: [ObjectType.AUTHENTICATION_POLICY, ObjectType.NETWORK_POLICY],
+    WarehouseParser: [ObjectType.WAREHOUSE, ObjectType.ROLE],
+    DatabaseParser: [ObjectType.DATABASE, ObjectType.ROLE],
+    SchemaParser: [ObjectType.SCHEMA, ObjectType.ROLE],
+    SecretParser: [ObjectType.SECRET],
+    NetworkRuleParser: [ObjectType.NETWORK_RULE],
+    ExternalAccessIntegrationParser: [ObjectType.EXTERNAL_ACCESS_INTEGRATION],
+    FileFormatParser: [ObjectType.FILE_FORMAT],
+    StageParser: [ObjectType.STAGE, ObjectType.STAGE_FILE],
+    SequenceParser: [ObjectType.SEQUENCE],
+    FunctionParser: [ObjectType.FUNCTION],
+    ExternalFunctionParser: [ObjectType.EXTERNAL_FUNCTION],
+    ProcedureParser: [ObjectType.PROCEDURE],
+    TableParser: [
+        ObjectType.TABLE,
+        ObjectType.CLONE_TABLE,
+        ObjectType.PRIMARY_KEY,
+        ObjectType.UNIQUE_KEY,
+        ObjectType.FOREIGN_KEY,
+    ],
+    EventTableParser: [ObjectType.EVENT_TABLE],
+    HybridTableParser: [ObjectType.HYBRID_TABLE],
+    IcebergTableParser: [ObjectType.ICEBERG_TABLE],
+    DynamicTableParser: [ObjectType.DYNAMIC_TABLE],
+    ExternalTableParser: [ObjectType.EXTERNAL_TABLE, ObjectType.PRIMARY_KEY, ObjectType.UNIQUE_KEY, ObjectType.FOREIGN_KEY],
+    MaterializedViewParser: [ObjectType.MATERIALIZED_VIEW],
+    ViewParser: [ObjectType.VIEW],
+    SemanticViewParser: [ObjectType.SEMANTIC_VIEW],
+    PipeParser: [ObjectType.PIPE],
+    StreamParser: [ObjectType.STREAM],
+    TaskParser: [ObjectType.TASK],
+    AlertParser: [ObjectType.ALERT],
+    OutboundShareParser: [ObjectType.SHARE],
+    TechnicalRoleParser: [ObjectType.ROLE],
+    BusinessRoleParser: [ObjectType.ROLE],
+    UserParser: [ObjectType.USER, ObjectType.ROLE],
+}
+
+
+# Other parsers required to build, validate and resolve blueprints of each parser
+# Policy parsers must run before parsers adding policy references
+schema_object_parse_dependencies = [DatabaseParser, SchemaParser]
+policy_reference_parse_dependencies = [
+    AggregationPolicyParser,
+    MaskingPolicyParser,
+    ProjectionPolicyParser,
+    RowAccessPolicyParser,
+]
+
+default_parse_dependencies = {
+    AccountParameterParser: [],
+    AggregationPolicyParser: [*schema_object_parse_dependencies, TableParser, ViewParser],
+    AuthenticationPolicyParser: [*schema_object_parse_dependencies, AccountPolicyParser, UserParser],
+    MaskingPolicyParser: [*schema_object_parse_dependencies, TableParser, ViewParser],
+    NetworkPolicyParser: [AccountPolicyParser, UserParser],
+    ProjectionPolicyParser: [*schema_object_parse_dependencies, TableParser, ViewParser],
+    RowAccessPolicyParser: [*schema_object_parse_dependencies, TableParser, ViewParser, ExternalTableParser],
+    ResourceMonitorParser: [],
+    AccountPolicyParser: [AuthenticationPolicyParser, NetworkPolicyParser],
+    WarehouseParser: [],
+    DatabaseParser: [],
+    SchemaParser: [DatabaseParser],
+    SecretParser: schema_object_parse_dependencies,
+    NetworkRuleParser: schema_object_parse_dependencies,
+    ExternalAccessIntegrationParser: [],
+    FileFormatParser: schema_object_parse_dependencies,
+    StageParser: schema_object_parse_dependencies,
+    SequenceParser: schema_object_parse_dependencies,
+    FunctionParser: schema_object_parse_dependencies,
+    ExternalFunctionParser: schema_object_parse_dependencies,
+    ProcedureParser: schema_object_parse_dependencies,
+    TableParser: [*schema_object_parse_dependencies, *policy_reference_parse_dependencies],
+    EventTableParser: schema_object_parse_dependencies,
+    HybridTableParser: schema_object_parse_dependencies,
+    IcebergTableParser: schema_object_parse_dependencies,
+    DynamicTableParser: schema_object_parse_dependencies,
+    ExternalTableParser: [*schema_object_parse_dependencies, RowAccessPolicyParser],
+    MaterializedViewParser: schema_object_parse_dependencies,
+    ViewParser: [*schema_object_parse_dependencies, *policy_reference_parse_dependencies],
+    SemanticViewParser: schema_object_parse_dependencies,
+    PipeParser: schema_object_parse_dependencies,
+    StreamParser: [
+        *schema_object_parse_dependencies,
+        StageParser,
+        TableParser,
+        EventTableParser,
+        DynamicTableParser,
+        ExternalTableParser,
+        ViewParser,
+    ],
+    TaskParser: schema_object_parse_dependencies,
+    AlertParser: schema_object_parse_dependencies,
+    # Grant patterns may match objects of any type
+    OutboundShareParser: [p for p in default_parse_sequence if p is not OutboundShareParser],
+    TechnicalRoleParser: [p for p in default_parse_sequence if p is not TechnicalRoleParser],
+    BusinessRoleParser: [DatabaseParser, SchemaParser, WarehouseParser, TechnicalRoleParser],
+    UserParser: [AuthenticationPolicyParser, NetworkPolicyParser, WarehouseParser, BusinessRoleParser],
+}
+
+
+# Objects of these types are referenced by objects in other databases, so they are parsed in all databases
+cross_database_object_types = ["aggregation_policy", "masking_policy", "projection_policy", "row_access_policy"]
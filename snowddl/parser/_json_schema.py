@@ -0,0 +1,54 @@
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+from typing import Callable, Dict, Tuple
+
+try:
+    from fastjsonschema import compile as fast_compile, JsonSchemaException
+except ImportError:
+    fast_compile = None
+
+
+# Key is id() of JSON schema, schema is stored alongside validator to make sure id() is not reused
+compiled_validators: Dict[int, Tuple[dict, Callable[[dict], None]]] = {}
+
+
+def validate_json_schema(params: dict, json_schema: dict):
+    compiled = compiled_validators.get(id(json_schema))
+
+    if compiled is None or compiled[0] is not json_schema:
+        compiled = (json_schema, compile_validator(json_schema))
+        compiled_validators[id(json_schema)] = compiled
+
+    compiled[1](params)
+
+
+def compile_validator(json_schema: dict):
+    validator_cls = validator_for(json_schema)
+    validator_cls.check_schema(json_schema)
+
+    validator = validator_cls(json_schema)
+
+    def validate(params: dict):
+        # Same error as jsonschema.validate(), including path to the failing value
+        error = best_match(validator.iter_errors(params))
+
+        if error is not None:
+            raise error
+
+    if fast_compile is None:
+        return validate
+
+    # Some valid schemas are not supported by generated validators, regular validator is used for them
+    try:
+        fast_validate = fast_compile(json_schema)
+    except Exception:
+        return validate
+
+    def validate_fast(params: dict):
+        try:
+            fast_validate(params)
+        except JsonSchemaException:
+            # Generated validator is used for the common case only, regular validator makes the final decision
+            validate(params)
+
+    return validate_fast
@@ -1,9 +1,11 @@
-from jsonschema import validate
 from pathlib import Path
+from pickle import dumps
 from re import compile, IGNORECASE
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 from yaml import load
 
+from snowddl.config import get_placeholder
+from snowddl.parser._json_schema import validate_json_schema
 from snowddl.parser._yaml import SnowDDLLoader
 
 if TYPE_CHECKING:
@@ -15,7 +17,7 @@ class ParsedFile:
     placeholder_end = "}}"
     placeholder_re = compile(r"\${{\s?([a-z0-9._-]+)\s?}}", IGNORECASE)
 
-    def __init__(self, parser: "AbstractParser", path: Path, json_schema: dict):
+    def __init__(self, parser: "AbstractParser", path: Path, json_schema: dict, params: Optional[dict] = None):
         self.parser = parser
 
         self.path = path
@@ -26,10 +28,22 @@ class ParsedFile:
         self.schema = None
 
         self._guess_database_schema_from_path()
-        self._load_params()
 
-        self._apply_placeholders(self.params)
-        self._validate_json_schema()
+        if params is None:
+            self.params = self.load_params(path, json_schema, parser.config.placeholders)
+        else:
+            # Params were already loaded, processed and validated in worker process
+            self.params = params
+
+    @classmethod
+    def load_params(cls, path: Path, json_schema: dict, placeholders: dict):
+        with path.open("r", encoding="utf-8") as f:
+            params = load(f, Loader=SnowDDLLoader) or {}
+
+        cls._apply_placeholders(params, placeholders)
+        validate_json_schema(params, json_schema)
+
+        return params
 
     def _guess_database_schema_from_path(self):
         try:
@@ -43,31 +57,39 @@ class ParsedFile:
         if len(relative_path.parts) > 2:
             self.schema = relative_path.parts[1].upper()
 
-    def _load_params(self):
-        with self.path.open("r", encoding="utf-8") as f:
-            self.params = load(f, Loader=SnowDDLLoader) or {}
-
-    def _apply_placeholders(self, data: dict):
+    @classmethod
+    def _apply_placeholders(cls, data: dict, placeholders: dict):
         for k, v in data.items():
             if isinstance(v, dict):
-                self._apply_placeholders(v)
+                cls._apply_placeholders(v, placeholders)
             elif isinstance(v, list):
-                data[k] = [self._apply_placeholders_inner(i) if isinstance(i, str) else i for i in v]
+                data[k] = [cls._apply_placeholders_inner(i, placeholders) if isinstance(i, str) else i for i in v]
             elif isinstance(v, str):
-                data[k] = self._apply_placeholders_inner(v)
+                data[k] = cls._apply_placeholders_inner(v, placeholders)
 
-    def _apply_placeholders_inner(self, val: str):
-        if self.placeholder_start in val:
-            m = self.placeholder_re.fullmatch(val)
+    @classmethod
+    def _apply_placeholders_inner(cls, val: str, placeholders: dict):
+        if cls.placeholder_start in val:
+            m = cls.placeholder_re.fullmatch(val)
 
             if m:
                 # Value is a single placeholder, return and preserve type
-                return self.parser.config.get_placeholder(m.group(1).upper())
+                return get_placeholder(placeholders, m.group(1).upper())
             else:
                 # Value is a string with multiple placeholders or other parts, replace and return as string
-                return self.placeholder_re.sub(lambda m: str(self.parser.config.get_placeholder(m.group(1).upper())), val)
+                return cls.placeholder_re.sub(lambda m: str(get_placeholder(placeholders, m.group(1).upper())), val)
 
         return val
 
-    def _validate_json_schema(self):
-        validate(self.params, self.json_schema)
+
+def load_params_in_worker(path: Path, json_schema: dict, placeholders: dict):
+    # Exceptions are returned instead of raised, so errors are reported for each file individually
+    try:
+        return ParsedFile.load_params(path, json_schema, placeholders), None
+    except Exception as e:
+        try:
+            dumps(e)
+        except Exception:
+            e = ValueError(str(e))
+
+        return None, e
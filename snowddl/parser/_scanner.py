@@ -1,15 +1,28 @@
 from collections import defaultdict
+from hashlib import sha256
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, Iterable, Optional, Set
 
 
 class DirectoryScanner:
     allowed_file_suffixes = (".yml", ".yaml")
     allowed_file_levels = (1, 2, 3, 4)
 
-    def __init__(self, base_path: Path):
+    def __init__(
+        self,
+        base_path: Path,
+        include_databases: Optional[Iterable[str]] = None,
+        shared_object_types: Iterable[str] = (),
+        include_database_params: bool = True,
+    ):
         self.base_path = base_path
 
+        # Schema object files of other databases are skipped, except for object types shared across databases
+        # Database and schema params of other databases are scanned unless explicitly disabled
+        self.include_databases = {self._normalise_key(d) for d in include_databases} if include_databases else None
+        self.shared_object_types = {self._normalise_key(t) for t in shared_object_types}
+        self.include_database_params = include_database_params
+
         # Key is relative path without suffix
         self.all_file_paths: Dict[str, Path] = {}
         self.accessed_files: Set[str] = set()
@@ -51,6 +64,30 @@ class DirectoryScanner:
     def get_unused_file_paths(self) -> Dict[str, Path]:
         return {file_key: file_path for file_key, file_path in self.all_file_paths.items() if file_key not in self.accessed_files}
 
+    def get_manifest(self) -> Dict[str, tuple]:
+        # All files are included, since config may depend on non-YAML files (e.g. !include, __custom)
+        manifest = {}
+
+        for path in sorted(self.base_path.rglob("*")):
+            relative_path = path.relative_to(self.base_path)
+
+            # Hidden files and bytecode of __custom modules do not affect config
+            if any(part.startswith(".") or part == "__pycache__" for part in relative_path.parts) or not path.is_file():
+                continue
+
+            content = path.read_bytes()
+            manifest[relative_path.as_posix()] = (len(content), sha256(content).hexdigest())
+
+        return manifest
+
+    def has_encrypted_values(self) -> bool:
+        # Values of !decrypt tags are stored in plain text after parsing
+        for path in self.base_path.rglob("*"):
+            if path.suffix in (".yml", ".yaml") and path.is_file() and b"!decrypt" in path.read_bytes():
+                return True
+
+        return False
+
     def _scan_dir_recursively(self, dir_path: Path):
         for item_path in sorted(dir_path.iterdir()):
             relative_item_path = item_path.relative_to(self.base_path)
@@ -62,7 +99,7 @@ class DirectoryScanner:
 
             if item_path.is_dir():
                 # 1st level dir is database
-                if relative_item_level == 1:
+                if relative_item_level == 1 and not self._is_skipped_database_params(relative_item_path):
                     database_key = self._normalise_key(relative_item_path.parts[0])
 
                     if database_key in self.database_dir_paths:
@@ -74,7 +111,7 @@ class DirectoryScanner:
                     self.database_dir_paths[database_key] = item_path
 
                 # 2nd level dir is schema
-                if relative_item_level == 2:
+                if relative_item_level == 2 and not self._is_skipped_database_params(relative_item_path):
                     database_key = self._normalise_key(relative_item_path.parts[0])
                     schema_key = self._normalise_key(relative_item_path.parts[1])
 
@@ -86,6 +123,10 @@ class DirectoryScanner:
 
                     self.schema_dir_paths[database_key][schema_key] = item_path
 
+                # 3rd level dir is object type
+                if relative_item_level == 3 and self._is_skipped_object_type_dir(relative_item_path):
+                    continue
+
                 self._scan_dir_recursively(item_path)
 
             if item_path.is_file():
@@ -97,6 +138,10 @@ class DirectoryScanner:
                 if relative_item_level not in self.allowed_file_levels:
                     continue
 
+                # Skip database and schema params of other databases
+                if relative_item_level in (2, 3) and self._is_skipped_database_params(relative_item_path):
+                    continue
+
                 file_key = self._normalise_key(relative_item_path.with_suffix("").as_posix())
 
                 if file_key in self.all_file_paths:
@@ -110,5 +155,23 @@ class DirectoryScanner:
 
                 self.all_file_paths[file_key] = item_path
 
+    def _is_excluded_database(self, relative_item_path: Path):
+        if self.include_databases is None:
+            return False
+
+        return self._normalise_key(relative_item_path.parts[0]) not in self.include_databases
+
+    def _is_skipped_object_type_dir(self, relative_item_path: Path):
+        if not self._is_excluded_database(relative_item_path):
+            return False
+
+        return self._normalise_key(relative_item_path.parts[2]) not in self.shared_object_types
+
+    def _is_skipped_database_params(self, relative_item_path: Path):
+        if self.include_database_params:
+            return False
+
+        return self._is_excluded_database(relative_item_path)
+
     def _normalise_key(self, key: str):
         return key.lower()
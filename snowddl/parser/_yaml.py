@@ -3,14 +3,36 @@ from yaml import SafeLoader, Node, add_constructor
 
 from snowddl.fernet.wrapper import FernetWrapper
 
+try:
+    from yaml import CSafeLoader
+except ImportError:
+    CSafeLoader = None
+
 
 fernet_wrapper = FernetWrapper()
 
 
-class SnowDDLLoader(SafeLoader):
+class SnowDDLPythonLoader(SafeLoader):
     pass
 
 
+if CSafeLoader:
+
+    class SnowDDLCLoader(CSafeLoader):
+        def __init__(self, stream):
+            super().__init__(stream)
+
+            # libyaml parser does not expose name of stream, but it is required for !include
+            self.name = getattr(stream, "name", "<unicode string>")
+
+else:
+    SnowDDLCLoader = None
+
+
+# libyaml is much faster, pure Python loader is used only if PyYAML was built without libyaml
+SnowDDLLoader = SnowDDLCLoader or SnowDDLPythonLoader
+
+
 def include_constructor(loader: SnowDDLLoader, node: Node):
     yaml_path = Path(loader.name)
 
@@ -40,6 +62,8 @@ def decrypt_constructor(loader: SnowDDLLoader, node: Node):
     return fernet_wrapper.decrypt(str(node.value))
 
 
-add_constructor("!include", include_constructor, Loader=SnowDDLLoader)
-add_constructor("!encrypt", encrypt_constructor, Loader=SnowDDLLoader)
-add_constructor("!decrypt", decrypt_constructor, Loader=SnowDDLLoader)
+for loader_cls in (SnowDDLPythonLoader, SnowDDLCLoader):
+    if loader_cls:
+        add_constructor("!include", include_constructor, Loader=loader_cls)
+        add_constructor("!encrypt", encrypt_constructor, Loader=loader_cls)
+        add_constructor("!decrypt", decrypt_constructor, Loader=loader_cls)
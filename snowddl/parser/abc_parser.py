@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from itertools import repeat
 from logging import getLogger, NullHandler
 from pathlib import Path
 from traceback import TracebackException
@@ -6,7 +8,7 @@ from typing import Callable, Dict, List, Optional, Union
 
 from snowddl.config import SnowDDLConfig
 from snowddl.blueprint import BaseDataType, NameWithType
-from snowddl.parser._parsed_file import ParsedFile
+from snowddl.parser._parsed_file import ParsedFile, load_params_in_worker
 from snowddl.parser._scanner import DirectoryScanner
 
 
@@ -15,9 +17,14 @@ logger.addHandler(NullHandler())
 
 
 class AbstractParser(ABC):
-    def __init__(self, config: SnowDDLConfig, scanner: DirectoryScanner):
+    # Smaller number of files is parsed in main process, since worker processes have noticeable overhead
+    parallel_min_files = 100
+    parallel_chunk_size = 50
+
+    def __init__(self, config: SnowDDLConfig, scanner: DirectoryScanner, executor: Optional[Executor] = None):
         self.config = config
         self.scanner = scanner
+        self.executor = executor
 
         self.logger = logger
         self.errors: Dict[str, Exception] = {}
@@ -68,13 +75,41 @@ class AbstractParser(ABC):
                     self.add_error(e, path, entity_name)
 
     def parse_schema_object_files(self, object_type: str, json_schema: dict, callback: Callable[[ParsedFile], None]):
-        for path in self.scanner.get_schema_object_file_paths(object_type).values():
+        paths = list(self.scanner.get_schema_object_file_paths(object_type).values())
+
+        if self.executor and len(paths) >= self.parallel_min_files:
+            self.parse_files_in_parallel(paths, json_schema, callback)
+            return
+
+        for path in paths:
             try:
                 file = ParsedFile(self, path, json_schema)
                 callback(file)
             except Exception as e:
                 self.add_error(e, path)
 
+    def parse_files_in_parallel(self, paths: List[Path], json_schema: dict, callback: Callable[[ParsedFile], None]):
+        # YAML loading, placeholders and JSON schema validation run in worker processes
+        # Callbacks are called in main process in original order of files, so blueprints are built deterministically
+        results = self.executor.map(
+            load_params_in_worker,
+            paths,
+            repeat(json_schema),
+            repeat(self.config.placeholders),
+            chunksize=self.parallel_chunk_size,
+        )
+
+        for path, (params, exc) in zip(paths, results):
+            if exc:
+                self.add_error(exc, path)
+                continue
+
+            try:
+                file = ParsedFile(self, path, json_schema, params)
+                callback(file)
+            except Exception as e:
+                self.add_error(e, path)
+
     def parse_external_file(self, path: Path, json_schema: dict, callback: Callable[[ParsedFile], Union[None, Dict]] = None):
         if not callback:
             callback = lambda f: f.params
@@ -142,6 +142,132 @@ default_destroy_sequence = [
 ]
 
 
+# Resolver is executed only after all its dependencies were executed, independent resolvers may run concurrently
+default_resolve_dependencies = {
+    AccountParameterResolver: [],
+    ResourceMonitorResolver: [],
+    WarehouseResolver: [ResourceMonitorResolver],
+    WarehouseMonitorRoleResolver: [WarehouseResolver],
+    WarehouseUsageRoleResolver: [WarehouseResolver],
+    DatabaseResolver: [],
+    SchemaResolver: [DatabaseResolver],
+    ShareAccessRoleResolver: [SchemaResolver],
+    DatabaseReadRoleResolver: [SchemaResolver],
+    DatabaseWriteRoleResolver: [SchemaResolver],
+    SchemaReadRoleResolver: [SchemaResolver],
+    SchemaWriteRoleResolver: [SchemaResolver],
+    DatabaseOwnerRoleResolver: [
+        ShareAccessRoleResolver,
+        DatabaseReadRoleResolver,
+        DatabaseWriteRoleResolver,
+        SchemaReadRoleResolver,
+        SchemaWriteRoleResolver,
+        WarehouseUsageRoleResolver,
+    ],
+    SchemaOwnerRoleResolver: [
+        ShareAccessRoleResolver,
+        DatabaseReadRoleResolver,
+        DatabaseWriteRoleResolver,
+        SchemaReadRoleResolver,
+        SchemaWriteRoleResolver,
+        WarehouseUsageRoleResolver,
+    ],
+    SecretResolver: [DatabaseOwnerRoleResolver, SchemaOwnerRoleResolver],
+    NetworkRuleResolver: [DatabaseOwnerRoleResolver, SchemaOwnerRoleResolver],
+    ExternalAccessIntegrationResolver: [SecretResolver, NetworkRuleResolver],
+    FileFormatResolver: [DatabaseOwnerRoleResolver, SchemaOwnerRoleResolver],
+    StageResolver: [FileFormatResolver],
+    StageFileResolver: [StageResolver],
+    SequenceResolver: [DatabaseOwnerRoleResolver, SchemaOwnerRoleResolver],
+    FunctionResolver: [ExternalAccessIntegrationResolver, StageFileResolver, SequenceResolver],
+    ExternalFunctionResolver: [DatabaseOwnerRoleResolver, SchemaOwnerRoleResolver],
+    ProcedureResolver: [FunctionResolver, ExternalFunctionResolver],
+    CloneTableResolver: [DatabaseOwnerRoleResolver, SchemaOwnerRoleResolver],
+    TableResolver: [CloneTableResolver, FileFormatResolver, SequenceResolver, FunctionResolver],
+    # Other table types reuse SHOW TABLES listing retrieved by TableResolver
+    EventTableResolver: [TableResolver, DatabaseOwnerRoleResolver, SchemaOwnerRoleResolver],
+    HybridTableResolver: [TableResolver, SequenceResolver, FunctionResolver],
+    IcebergTableResolver: [TableResolver, DatabaseOwnerRoleResolver, SchemaOwnerRoleResolver],
+    DynamicTableResolver: [TableResolver, EventTableResolver, HybridTableResolver, IcebergTableResolver, WarehouseResolver],
+    ExternalTableResolver: [StageResolver, FileFormatResolver],
+    PrimaryKeyResolver: [TableResolver],
+    UniqueKeyResolver: [TableResolver],
+    ForeignKeyResolver: [PrimaryKeyResolver, UniqueKeyResolver],
+    MaterializedViewResolver: [DynamicTableResolver, ExternalTableResolver, FunctionResolver, ExternalFunctionResolver],
+    ViewResolver: [MaterializedViewResolver],
+    SemanticViewResolver: [ViewResolver, ForeignKeyResolver],
+    PipeResolver: [DynamicTableResolver, ExternalTableResolver],
+    StreamResolver: [ViewResolver],
+    TaskResolver: [
+        PipeResolver,
+        StreamResolver,
+        SemanticViewResolver,
+        ProcedureResolver,
+        ForeignKeyResolver,
+        WarehouseResolver,
+    ],
+    AlertResolver: [TaskResolver],
+    # --
+    OutboundShareResolver: [AlertResolver],
+    TechnicalRoleResolver: [OutboundShareResolver],
+    BusinessRoleResolver: [TechnicalRoleResolver, WarehouseMonitorRoleResolver],
+    UserRoleResolver: [BusinessRoleResolver],
+    UserResolver: [UserRoleResolver],
+    # --
+    AggregationPolicyResolver: [AlertResolver],
+    AuthenticationPolicyResolver: [UserResolver],
+    MaskingPolicyResolver: [AlertResolver],
+    NetworkPolicyResolver: [UserResolver, NetworkRuleResolver],
+    ProjectionPolicyResolver: [AlertResolver],
+    RowAccessPolicyResolver: [AlertResolver],
+}
+
+
+default_destroy_dependencies = {
+    AccountParameterResolver: [],
+    ResourceMonitorResolver: [],
+    WarehouseResolver: [ResourceMonitorResolver],
+    WarehouseMonitorRoleResolver: [WarehouseResolver],
+    WarehouseUsageRoleResolver: [WarehouseResolver],
+    # --
+    NetworkPolicyResolver: [AccountParameterResolver],
+    AuthenticationPolicyResolver: [AccountParameterResolver],
+    ExternalAccessIntegrationResolver: [],
+    OutboundShareResolver: [],
+    # --
+    DatabaseResolver: [
+        NetworkPolicyResolver,
+        AuthenticationPolicyResolver,
+        ExternalAccessIntegrationResolver,
+        OutboundShareResolver,
+    ],
+    SchemaResolver: [DatabaseResolver],
+    ShareAccessRoleResolver: [SchemaResolver],
+    DatabaseReadRoleResolver: [SchemaResolver],
+    DatabaseWriteRoleResolver: [SchemaResolver],
+    SchemaReadRoleResolver: [SchemaResolver],
+    SchemaWriteRoleResolver: [SchemaResolver],
+    DatabaseOwnerRoleResolver: [SchemaResolver],
+    SchemaOwnerRoleResolver: [SchemaResolver],
+    # --
+    TechnicalRoleResolver: [SchemaResolver],
+    BusinessRoleResolver: [
+        TechnicalRoleResolver,
+        ShareAccessRoleResolver,
+        DatabaseReadRoleResolver,
+        DatabaseWriteRoleResolver,
+        SchemaReadRoleResolver,
+        SchemaWriteRoleResolver,
+        DatabaseOwnerRoleResolver,
+        SchemaOwnerRoleResolver,
+        WarehouseMonitorRoleResolver,
+        WarehouseUsageRoleResolver,
+    ],
+    UserRoleResolver: [BusinessRoleResolver],
+    UserResolver: [UserRoleResolver],
+}
+
+
 singledb_resolve_sequence = [
     SchemaResolver,
     SecretResolver,
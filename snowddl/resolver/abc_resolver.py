@@ -1,12 +1,13 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from traceback import format_exc
+from traceback import format_exception
 
-from concurrent.futures import as_completed
-from typing import Dict, TYPE_CHECKING
+from collections import defaultdict
+from concurrent.futures import wait, FIRST_COMPLETED
+from typing import Dict, Union, TYPE_CHECKING
 
-from snowddl.error import SnowDDLExecuteError, SnowDDLUnsupportedError
-from snowddl.blueprint import AbstractBlueprint, DependsOnMixin, Edition, ObjectType
+from snowddl.error import SnowDDLDependencyError, SnowDDLExecuteError, SnowDDLUnsupportedError
+from snowddl.blueprint import AbstractBlueprint, AbstractIdent, DatabaseIdent, DependsOnMixin, Edition, ObjectType
 
 if TYPE_CHECKING:
     from snowddl.engine import SnowDDLEngine
@@ -43,7 +44,10 @@ class AbstractResolver(ABC):
         if self._is_skipped():
             return
 
-        self.blueprints = self.get_blueprints()
+        # Existing objects of other databases are not loaded, so blueprints of other databases are not resolved
+        self.blueprints = {
+            full_name: bp for full_name, bp in self.get_blueprints().items() if not self.is_excluded_database(bp.full_name)
+        }
 
         try:
             self.existing_objects = self.get_existing_objects()
@@ -75,17 +79,16 @@ class AbstractResolver(ABC):
         self._post_process()
 
     def _resolve_create_compare(self):
-        # Process blueprints in batches sorted in order of dependencies
-        for blueprint_names_batch in self._split_blueprints_into_batches():
-            tasks = {}
+        tasks = {}
 
-            for full_name in sorted(blueprint_names_batch):
-                if full_name in self.existing_objects:
-                    tasks[full_name] = (self.compare_object, self.blueprints[full_name], self.existing_objects[full_name])
-                else:
-                    tasks[full_name] = (self.create_object, self.blueprints[full_name])
+        for full_name in sorted(self.blueprints):
+            if full_name in self.existing_objects:
+                tasks[full_name] = (self.compare_object, self.blueprints[full_name], self.existing_objects[full_name])
+            else:
+                tasks[full_name] = (self.create_object, self.blueprints[full_name])
 
-            self._process_tasks(tasks)
+        # Each blueprint is processed as soon as all its dependencies were processed
+        self._process_tasks(tasks, self._get_blueprint_dependencies())
 
     def _resolve_drop(self):
         tasks = {}
@@ -116,78 +119,160 @@ class AbstractResolver(ABC):
 
         self._process_tasks(tasks)
 
-    def _process_tasks(self, tasks):
+    def _process_tasks(self, tasks, dependencies=None):
         futures = {}
+        task_results = {}
+        deferred_queries = {}
+
+        # Number of unprocessed dependencies and list of dependents for each task
+        pending_counters = {full_name: 0 for full_name in tasks}
+        dependents = defaultdict(list)
+
+        for full_name, parent_full_names in (dependencies or {}).items():
+            for parent_full_name in parent_full_names:
+                pending_counters[full_name] += 1
+                dependents[parent_full_name].append(full_name)
+
+        remaining_tasks = dict(tasks)
+
+        def submit_task(task_full_name):
+            futures[self.engine.executor.submit(self._run_task, *remaining_tasks.pop(task_full_name))] = task_full_name
+
+        def cancel_dependents(parent_full_name):
+            parent_full_names = [parent_full_name]
+
+            while parent_full_names:
+                parent_full_name = parent_full_names.pop()
 
-        for full_name, args in tasks.items():
-            futures[self.engine.executor.submit(*args)] = full_name
+                for dependent_full_name in dependents[parent_full_name]:
+                    if dependent_full_name not in remaining_tasks:
+                        continue
 
-        for f in as_completed(futures):
-            full_name = futures[f]
+                    del remaining_tasks[dependent_full_name]
 
-            try:
-                result = f.result()
+                    task_results[dependent_full_name] = SnowDDLDependencyError(
+                        f"Dependency [{parent_full_name}] of object [{dependent_full_name}] was not resolved successfully"
+                    )
+                    deferred_queries[dependent_full_name] = []
 
-                if result == ResolveResult.REPLACE:
-                    self.engine.intention_cache.add_replace_intention(self.object_type, full_name)
+                    self._process_task_result(dependent_full_name, task_results[dependent_full_name])
+                    parent_full_names.append(dependent_full_name)
 
-                if result == ResolveResult.DROP:
-                    self.engine.intention_cache.add_drop_intention(self.object_type, full_name)
+        for full_name in tasks:
+            if pending_counters[full_name] == 0:
+                submit_task(full_name)
 
-                if result == ResolveResult.NOCHANGE:
-                    self.engine.logger.debug(f"Resolved {self.object_type.name} [{full_name}]: {result.value}")
-                else:
-                    self.engine.logger.info(f"Resolved {self.object_type.name} [{full_name}]: {result.value}")
-            except Exception as e:
-                if isinstance(e, SnowDDLUnsupportedError):
-                    result = ResolveResult.UNSUPPORTED
-                else:
-                    result = ResolveResult.ERROR
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
 
-                if isinstance(e, SnowDDLExecuteError):
-                    error_text = e.verbose_message()
-                else:
-                    error_text = format_exc()
+            for f in sorted(done, key=lambda x: futures[x]):
+                full_name = futures.pop(f)
+                task_results[full_name], deferred_queries[full_name] = f.result()
 
-                self.engine.logger.warning(f"Resolved {self.object_type.name} [{full_name}]: {result.value}\n{error_text}")
-                self.errors[full_name] = e
+                # Outcome of objects with deferred queries is known only after all queries are completed
+                if not deferred_queries[full_name]:
+                    self._process_task_result(full_name, task_results[full_name])
 
-            self.resolved_objects[full_name] = result
+                # Dependents of failed objects are not processed
+                if isinstance(task_results[full_name], Exception):
+                    cancel_dependents(full_name)
+                    continue
+
+                for dependent_full_name in dependents[full_name]:
+                    pending_counters[dependent_full_name] -= 1
+
+                    if pending_counters[dependent_full_name] == 0 and dependent_full_name in remaining_tasks:
+                        submit_task(dependent_full_name)
+
+            # Remaining tasks have circular dependencies, process all of them at once
+            if not futures:
+                for full_name in list(remaining_tasks):
+                    submit_task(full_name)
+
+        # Barrier: execute or collect results of deferred queries
+        deferred_queries = {full_name: queries for full_name, queries in deferred_queries.items() if queries}
+        deferred_errors = self.engine.complete_deferred_queries(deferred_queries)
+
+        for full_name in deferred_queries:
+            if isinstance(task_results[full_name], Exception):
+                self._process_task_result(full_name, task_results[full_name])
+            elif full_name in deferred_errors:
+                self._process_task_result(full_name, deferred_errors[full_name])
+            else:
+                self._process_task_result(full_name, task_results[full_name])
 
         self.engine.flush_thread_buffers()
 
-    def _split_blueprints_into_batches(self):
-        all_batches = []
-        allocated_full_names = set()
+    def _run_task(self, callback, *args):
+        try:
+            result = callback(*args)
+        except Exception as e:
+            # Deferred queries submitted before exception must still be completed
+            result = e
 
-        remaining_blueprints = self.blueprints.copy()
+        return result, self.engine.pop_deferred_queries()
 
-        # Create new batches as long as at least one unallocated blueprint remains
-        while remaining_blueprints:
-            batch = []
+    def _process_task_result(self, full_name, result: Union[ResolveResult, Exception]):
+        if isinstance(result, Exception):
+            self._process_task_error(full_name, result)
+            return
 
-            # Allocate blueprints with no dependencies or fully resolved dependencies
-            for full_name, bp in remaining_blueprints.items():
-                if (
-                    not isinstance(bp, DependsOnMixin)
-                    or not bp.depends_on
-                    or all((str(d) in allocated_full_names) for d in bp.depends_on)
-                ):
-                    batch.append(full_name)
+        if result == ResolveResult.REPLACE:
+            self.engine.intention_cache.add_replace_intention(self.object_type, full_name)
 
-            # Allocate blueprints with unresolved dependencies to the last batch
-            if len(batch) == 0:
-                for full_name in remaining_blueprints:
-                    batch.append(full_name)
+        if result == ResolveResult.DROP:
+            self.engine.intention_cache.add_drop_intention(self.object_type, full_name)
 
-            # Forget blueprints allocated during this iteration
-            for full_name in batch:
-                del remaining_blueprints[full_name]
+        # Snapshot of existing objects is no longer valid for changed database
+        if result in (ResolveResult.CREATE, ResolveResult.ALTER, ResolveResult.REPLACE, ResolveResult.DROP):
+            self._invalidate_snapshot(full_name)
+
+        if result == ResolveResult.NOCHANGE:
+            self.engine.logger.debug(f"Resolved {self.object_type.name} [{full_name}]: {result.value}")
+        else:
+            self.engine.logger.info(f"Resolved {self.object_type.name} [{full_name}]: {result.value}")
+
+        self.resolved_objects[full_name] = result
+
+    def is_excluded_database(self, ident: AbstractIdent):
+        if not self.engine.settings.include_databases or not getattr(ident, "database", None):
+            return False
+
+        return DatabaseIdent(ident.env_prefix, ident.database) not in self.engine.settings.include_databases
+
+    def _invalidate_snapshot(self, full_name):
+        # Snapshot contains database objects only, account-level objects never invalidate it
+        pass
+
+    def _process_task_error(self, full_name, e: Exception):
+        if isinstance(e, SnowDDLUnsupportedError):
+            result = ResolveResult.UNSUPPORTED
+        else:
+            result = ResolveResult.ERROR
+
+        if isinstance(e, SnowDDLExecuteError):
+            error_text = e.verbose_message()
+        else:
+            error_text = "".join(format_exception(type(e), e, e.__traceback__))
+
+        self.engine.logger.warning(f"Resolved {self.object_type.name} [{full_name}]: {result.value}\n{error_text}")
+        self.errors[full_name] = e
+
+        self.resolved_objects[full_name] = result
+
+    def _get_blueprint_dependencies(self):
+        dependencies = {}
+
+        for full_name, bp in self.blueprints.items():
+            if not isinstance(bp, DependsOnMixin) or not bp.depends_on:
+                continue
 
-            all_batches.append(batch)
-            allocated_full_names.update(batch)
+            # Dependencies on objects managed by other resolvers are already resolved
+            dependencies[full_name] = {
+                str(d) for d in bp.depends_on if str(d) in self.blueprints and str(d) != full_name
+            }
 
-        return all_batches
+        return dependencies
 
     def _is_skipped(self):
         if self.engine.context.edition < self.skip_min_edition:
@@ -1,5 +1,7 @@
 from abc import abstractmethod
-from typing import List, Optional, Tuple, Union
+from collections import defaultdict
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from snowddl.blueprint import (
     AccountGrant,
@@ -7,6 +9,7 @@ from snowddl.blueprint import (
     DatabaseBlueprint,
     DatabaseIdent,
     DatabaseRoleIdent,
+    ExternalAccessIntegrationBlueprint,
     FutureGrant,
     Ident,
     IdentPattern,
@@ -18,10 +21,21 @@ from snowddl.blueprint import (
     build_grant_name_ident,
     build_future_grant_name_ident,
 )
+from snowddl.error import SnowDDLExecuteError
 from snowddl.resolver.abc_resolver import AbstractResolver, ResolveResult, ObjectType
 
 
 class AbstractRoleResolver(AbstractResolver):
+    def __init__(self, engine):
+        super().__init__(engine)
+
+        # Future grants are applied to existing objects after all roles were resolved, identical backfills are applied once
+        self.future_grant_backfills: Dict[Tuple, Tuple] = {}
+        self._future_grant_backfills_lock = Lock()
+
+        # Keys of grants implied through inherited roles, such grants are not created with --minimize-role-grants
+        self.redundant_grant_keys: Dict[str, Set[Tuple]] = {}
+
     @abstractmethod
     def get_role_suffix(self) -> str:
         pass
@@ -42,27 +56,12 @@ class AbstractRoleResolver(AbstractResolver):
         return ObjectType.ROLE
 
     def get_existing_objects(self):
-        existing_roles = {}
-
-        cur = self.engine.execute_meta(
-            "SHOW ROLES LIKE {pattern:lse}",
-            {
-                "pattern": self.get_role_pattern(),
-            },
-        )
-
-        for r in cur:
-            if r["owner"] != self.engine.context.current_role:
-                continue
-
-            existing_roles[r["name"]] = {
-                "role_name": r["name"],
-                "comment": r["comment"] if r["comment"] else None,
-            }
+        # Roles and grants are shared by all role resolvers, each resolver takes roles matching its own pattern
+        existing_roles = self.engine.role_cache.get_roles(self.get_role_pattern())
 
         # Retrieve role grants in parallel
         for role_name, grants, account_grants, future_grants in self.engine.executor.map(
-            self.get_existing_role_grants, existing_roles
+            self.get_cached_role_grants, existing_roles
         ):
             existing_roles[role_name]["grants"] = grants
             existing_roles[role_name]["account_grants"] = account_grants
@@ -70,20 +69,16 @@ class AbstractRoleResolver(AbstractResolver):
 
         return existing_roles
 
+    def get_cached_role_grants(self, role_name):
+        return self.engine.role_cache.get_role_grants(role_name, self.get_existing_role_grants)
+
     def get_existing_role_grants(self, role_name):
         grants = []
         account_grants = []
         future_grants = []
 
         # Normal and account grants
-        cur = self.engine.execute_meta(
-            "SHOW GRANTS TO ROLE {role_name:i}",
-            {
-                "role_name": role_name,
-            },
-        )
-
-        for r in sorted(cur, key=self.sort_existing_grants):
+        for r in sorted(self.engine.role_cache.get_grant_rows(role_name), key=self.sort_existing_grants):
             # Skip grants on unknown object types
             try:
                 object_type = ObjectType[r["granted_on"]]
@@ -103,6 +98,12 @@ class AbstractRoleResolver(AbstractResolver):
                     self.engine.intention_cache.add_invalid_name_warning(object_type, r["name"])
                     continue
 
+                # SHOW GRANTS reports EXTERNAL ACCESS INTEGRATION as INTEGRATION, exact object type is restored from config
+                if object_type == ObjectType.INTEGRATION and str(grant_name) in self.config.get_blueprints_by_type(
+                    ExternalAccessIntegrationBlueprint
+                ):
+                    object_type = ObjectType.EXTERNAL_ACCESS_INTEGRATION
+
                 grants.append(
                     Grant(
                         privilege=r["privilege"],
@@ -112,14 +113,7 @@ class AbstractRoleResolver(AbstractResolver):
                 )
 
         # Future grants
-        cur = self.engine.execute_meta(
-            "SHOW FUTURE GRANTS TO ROLE {role_name:i}",
-            {
-                "role_name": role_name,
-            },
-        )
-
-        for r in sorted(cur, key=self.sort_existing_grants):
+        for r in sorted(self.engine.role_cache.get_future_grant_rows(role_name), key=self.sort_existing_grants):
             try:
                 object_type = ObjectType[r["grant_on"]]
             except KeyError:
@@ -172,6 +166,9 @@ class AbstractRoleResolver(AbstractResolver):
 
         self.engine.execute_safe_ddl(query)
 
+        if self.engine.settings.execute_safe_ddl:
+            self.engine.role_cache.add_role(str(bp.full_name), bp.comment)
+
         self.engine.execute_safe_ddl(
             "GRANT ROLE {role_name:i} TO ROLE {current_role:i}",
             {
@@ -180,15 +177,10 @@ class AbstractRoleResolver(AbstractResolver):
             },
         )
 
-        for bp_grant in bp.grants:
-            self.create_grant(bp.full_name, bp_grant)
-
-        for bp_account_grant in bp.account_grants:
-            self.create_account_grant(bp.full_name, bp_account_grant)
-
-        for bp_future_grant in bp.future_grants:
-            self.create_future_grant(bp.full_name, bp_future_grant)
-            self.apply_future_grant_to_existing_objects(bp.full_name, bp_future_grant)
+        self.create_grants(bp.full_name, self.skip_redundant_grants(bp, bp.grants))
+        self.create_account_grants(bp.full_name, bp.account_grants)
+        self.create_future_grants(bp.full_name, bp.future_grants)
+        self.apply_future_grants_to_existing_objects(bp.full_name, bp.future_grants)
 
         return ResolveResult.CREATE
 
@@ -204,44 +196,65 @@ class AbstractRoleResolver(AbstractResolver):
                 },
             )
 
+            if self.engine.settings.execute_safe_ddl:
+                self.engine.role_cache.set_role_comment(row["role_name"], bp.comment)
+
             result = ResolveResult.ALTER
 
-        # Normal grants
-        for existing_grant in row["grants"]:
-            if existing_grant not in bp.grants and self.grant_to_future_grant(existing_grant) not in bp.future_grants:
-                self.drop_grant(bp.full_name, existing_grant)
-                result = ResolveResult.GRANT
+        # Grants are compared using hashable keys, lists of grants might be very large
+        bp_grant_keys = {g.key() for g in bp.grants}
+        bp_account_grant_keys = {g.key() for g in bp.account_grants}
+        bp_future_grant_keys = {g.key() for g in bp.future_grants}
+
+        existing_grant_keys = {g.key() for g in row["grants"]}
+        existing_account_grant_keys = {g.key() for g in row["account_grants"]}
+        existing_future_grant_keys = {g.key() for g in row["future_grants"]}
+
+        # Privileges are collected first, privileges on the same object are applied with one statement
+        # Objects of other databases are not parsed with --include-databases, so their grants are never dropped
+        drop_grants = [
+            g
+            for g in row["grants"]
+            if g.key() not in bp_grant_keys
+            and not self.is_future_grant_in_keys(g, bp_future_grant_keys)
+            and not self.is_excluded_database(g.name)
+        ]
+        create_grants = self.skip_redundant_grants(bp, [g for g in bp.grants if g.key() not in existing_grant_keys])
 
-        for bp_grant in bp.grants:
-            if bp_grant not in row["grants"]:
-                self.create_grant(bp.full_name, bp_grant)
-                result = ResolveResult.GRANT
+        drop_account_grants = [g for g in row["account_grants"] if g.key() not in bp_account_grant_keys]
+        create_account_grants = [g for g in bp.account_grants if g.key() not in existing_account_grant_keys]
 
-        # Account grants
-        for existing_account_grant in row["account_grants"]:
-            if existing_account_grant not in bp.account_grants:
-                self.drop_account_grant(bp.full_name, existing_account_grant)
-                result = ResolveResult.GRANT
+        drop_future_grants = [
+            g for g in row["future_grants"] if g.key() not in bp_future_grant_keys and not self.is_excluded_database(g.name)
+        ]
+        create_future_grants = [g for g in bp.future_grants if g.key() not in existing_future_grant_keys]
 
-        for bp_account_grant in bp.account_grants:
-            if bp_account_grant not in row["account_grants"]:
-                self.create_account_grant(bp.full_name, bp_account_grant)
-                result = ResolveResult.GRANT
+        if self.engine.settings.refresh_future_grants:
+            apply_future_grants = bp.future_grants
+        else:
+            apply_future_grants = create_future_grants
+
+        # Normal grants
+        self.drop_grants(bp.full_name, drop_grants)
+        self.create_grants(bp.full_name, create_grants)
+
+        # Account grants
+        self.drop_account_grants(bp.full_name, drop_account_grants)
+        self.create_account_grants(bp.full_name, create_account_grants)
 
         # Future grants
-        for existing_future_grant in row["future_grants"]:
-            if existing_future_grant not in bp.future_grants:
-                self.drop_future_grant(bp.full_name, existing_future_grant)
-                result = ResolveResult.GRANT
-
-        for bp_future_grant in bp.future_grants:
-            if bp_future_grant not in row["future_grants"]:
-                self.create_future_grant(bp.full_name, bp_future_grant)
-                self.apply_future_grant_to_existing_objects(bp.full_name, bp_future_grant)
-                result = ResolveResult.GRANT
-            elif self.engine.settings.refresh_future_grants:
-                self.apply_future_grant_to_existing_objects(bp.full_name, bp_future_grant)
-                result = ResolveResult.GRANT
+        self.drop_future_grants(bp.full_name, drop_future_grants)
+        self.create_future_grants(bp.full_name, create_future_grants)
+        self.apply_future_grants_to_existing_objects(bp.full_name, apply_future_grants)
+
+        if drop_grants or create_grants or drop_account_grants or create_account_grants:
+            result = ResolveResult.GRANT
+
+        if drop_future_grants or apply_future_grants:
+            result = ResolveResult.GRANT
+
+        if result == ResolveResult.GRANT:
+            self.engine.role_cache.invalidate_role_grants(row["role_name"])
 
         return result
 
@@ -254,8 +267,272 @@ class AbstractRoleResolver(AbstractResolver):
             },
         )
 
+        if self.engine.settings.execute_unsafe_ddl:
+            self.engine.role_cache.remove_role(row["role_name"])
+
         return ResolveResult.DROP
 
+    def create_grants(self, role_name, grants: List[Grant]):
+        for group in self.coalesce_grants(grants, self.get_coalesced_grant_key):
+            if len(group) == 1:
+                self.create_grant(role_name, group[0])
+                continue
+
+            params = {
+                "on": group[0].on.singular_for_grant,
+                "name": group[0].name,
+                "role_name": role_name,
+            }
+
+            self.engine.execute_safe_ddl(
+                "GRANT {privileges:r} ON {on:r} {name:i} TO ROLE {role_name:i}",
+                {**params, "privileges": ", ".join(g.privilege for g in group)},
+                is_independent=True,
+                fallback_params=[{**params, "privileges": g.privilege} for g in group],
+            )
+
+    def drop_grants(self, role_name, grants: List[Grant]):
+        for group in self.coalesce_grants(grants, self.get_coalesced_grant_key):
+            if len(group) == 1:
+                self.drop_grant(role_name, group[0])
+                continue
+
+            params = {
+                "on": group[0].on.singular_for_grant,
+                "name": group[0].name,
+                "role_name": role_name,
+            }
+
+            self.engine.execute_safe_ddl(
+                "REVOKE {privileges:r} ON {on:r} {name:i} FROM ROLE {role_name:i}",
+                {**params, "privileges": ", ".join(g.privilege for g in group)},
+                is_independent=True,
+                fallback_params=[{**params, "privileges": g.privilege} for g in group],
+            )
+
+    def create_account_grants(self, role_name, account_grants: List[AccountGrant]):
+        if len(account_grants) == 1:
+            self.create_account_grant(role_name, account_grants[0])
+        elif account_grants:
+            self.engine.execute_safe_ddl(
+                "GRANT {privileges:r} ON ACCOUNT TO ROLE {role_name:i}",
+                {
+                    "privileges": ", ".join(g.privilege for g in account_grants),
+                    "role_name": role_name,
+                },
+                is_independent=True,
+                fallback_params=[{"privileges": g.privilege, "role_name": role_name} for g in account_grants],
+            )
+
+    def drop_account_grants(self, role_name, account_grants: List[AccountGrant]):
+        if len(account_grants) == 1:
+            self.drop_account_grant(role_name, account_grants[0])
+        elif account_grants:
+            self.engine.execute_safe_ddl(
+                "REVOKE {privileges:r} ON ACCOUNT FROM ROLE {role_name:i}",
+                {
+                    "privileges": ", ".join(g.privilege for g in account_grants),
+                    "role_name": role_name,
+                },
+                is_independent=True,
+                fallback_params=[{"privileges": g.privilege, "role_name": role_name} for g in account_grants],
+            )
+
+    def create_future_grants(self, role_name, grants: List[FutureGrant]):
+        for group in self.coalesce_grants(grants, self.get_coalesced_future_grant_key):
+            if len(group) == 1:
+                self.create_future_grant(role_name, group[0])
+                continue
+
+            params = {
+                "on_future_plural": group[0].on_future.plural,
+                "in_parent_singular": group[0].in_parent.singular,
+                "name": group[0].name,
+                "role_name": role_name,
+            }
+
+            self.engine.execute_safe_ddl(
+                "GRANT {privileges:r} ON FUTURE {on_future_plural:r} IN {in_parent_singular:r} {name:i} TO ROLE {role_name:i}",
+                {**params, "privileges": ", ".join(g.privilege for g in group)},
+                is_independent=True,
+                fallback_params=[{**params, "privileges": g.privilege} for g in group],
+            )
+
+    def drop_future_grants(self, role_name, grants: List[FutureGrant]):
+        for group in self.coalesce_grants(grants, self.get_coalesced_future_grant_key):
+            if len(group) == 1:
+                self.drop_future_grant(role_name, group[0])
+                continue
+
+            params = {
+                "on_future_plural": group[0].on_future.plural,
+                "in_parent_singular": group[0].in_parent.singular,
+                "name": group[0].name,
+                "role_name": role_name,
+            }
+
+            self.engine.execute_safe_ddl(
+                "REVOKE {privileges:r} ON FUTURE {on_future_plural:r} IN {in_parent_singular:r} {name:i} FROM ROLE {role_name:i}",
+                {**params, "privileges": ", ".join(g.privilege for g in group)},
+                is_independent=True,
+                fallback_params=[{**params, "privileges": g.privilege} for g in group],
+            )
+
+    def apply_future_grants_to_existing_objects(self, role_name, grants: List[FutureGrant]):
+        # Bulk grant on objects of type PIPE to ROLE is restricted (by Snowflake)
+        grants = [g for g in grants if g.on_future != ObjectType.PIPE]
+
+        with self._future_grant_backfills_lock:
+            for group in self.coalesce_grants(grants, self.get_coalesced_future_grant_key):
+                privileges = tuple(g.privilege for g in group)
+                key = (str(role_name), privileges, group[0].on_future, group[0].in_parent, str(group[0].name))
+
+                self.future_grant_backfills.setdefault(key, (role_name, group))
+
+    def apply_future_grant_backfill(self, role_name, group: List[FutureGrant]):
+        if len(group) == 1:
+            self.apply_future_grant_to_existing_objects(role_name, group[0])
+            return
+
+        try:
+            self.engine.execute_safe_ddl(
+                "GRANT {privileges:r} ON ALL {on_future_plural:r} IN {in_parent_singular:r} {name:i} TO ROLE {role_name:i}",
+                {
+                    "privileges": ", ".join(g.privilege for g in group),
+                    "on_future_plural": group[0].on_future.plural,
+                    "in_parent_singular": group[0].in_parent.singular,
+                    "name": group[0].name,
+                    "role_name": role_name,
+                },
+            )
+        except SnowDDLExecuteError:
+            # Privileges are applied one by one to pinpoint exact error, the first error is reported
+            first_error = None
+
+            for grant in group:
+                try:
+                    self.apply_future_grant_to_existing_objects(role_name, grant)
+                except SnowDDLExecuteError as e:
+                    first_error = first_error or e
+
+            if first_error:
+                raise first_error
+
+    def _pre_process(self):
+        if not self.engine.settings.analyze_role_graph:
+            return
+
+        redundant_grants = {}
+
+        for full_name, bp in self.blueprints.items():
+            _, role_redundant_grants = self.engine.role_graph_cache.split_redundant_grants(bp)
+
+            if not role_redundant_grants:
+                continue
+
+            for grant, implied_by in role_redundant_grants:
+                self.engine.logger.info(
+                    f"Grant of {grant.privilege} on {grant.on.singular_for_grant} [{grant.name}] "
+                    f"to {self.object_type.name} [{full_name}] is already implied by role [{implied_by}]"
+                )
+
+            # Blueprints are not changed, so existing redundant grants are never revoked, only new grants are skipped
+            if self.engine.settings.minimize_role_grants:
+                self.redundant_grant_keys[full_name] = {grant.key() for grant, _ in role_redundant_grants}
+
+            redundant_grants[full_name] = role_redundant_grants
+
+        self.engine.role_graph_cache.add_roles(self.blueprints, redundant_grants)
+
+    def _post_process(self):
+        # Backfills of roles with errors are skipped
+        backfills = [b for b in self.future_grant_backfills.values() if str(b[0]) not in self.errors]
+        self.future_grant_backfills = {}
+
+        if not backfills:
+            return
+
+        pending_counters = defaultdict(int)
+
+        for role_name, _ in backfills:
+            pending_counters[str(role_name)] += 1
+
+        total_counters = dict(pending_counters)
+
+        # OWNERSHIP is transferred before other privileges are granted, other backfills are independent
+        ownership_backfills = [b for b in backfills if b[1][0].privilege == "OWNERSHIP"]
+        other_backfills = [b for b in backfills if b[1][0].privilege != "OWNERSHIP"]
+
+        for wave in (ownership_backfills, other_backfills):
+            for role_name, error in self.engine.executor.map(self._run_future_grant_backfill, wave):
+                if str(role_name) in self.errors:
+                    continue
+
+                if error:
+                    self._process_task_error(str(role_name), error)
+                    continue
+
+                pending_counters[str(role_name)] -= 1
+
+                if pending_counters[str(role_name)] == 0:
+                    # Backfills are only suggested in plan mode
+                    action = "Applied" if self.engine.settings.execute_safe_ddl else "Planned"
+
+                    self.engine.logger.info(
+                        f"{action} {total_counters[str(role_name)]} future grant backfill(s) "
+                        f"to existing objects for {self.object_type.name} [{role_name}]"
+                    )
+
+        self.engine.flush_thread_buffers()
+
+    def _run_future_grant_backfill(self, backfill):
+        role_name, group = backfill
+
+        try:
+            self.apply_future_grant_backfill(role_name, group)
+        except Exception as e:
+            return role_name, e
+
+        return role_name, None
+
+    def skip_redundant_grants(self, bp: RoleBlueprint, grants: List[Grant]) -> List[Grant]:
+        redundant_grant_keys = self.redundant_grant_keys.get(str(bp.full_name))
+
+        if not redundant_grant_keys:
+            return grants
+
+        remaining_grants = [g for g in grants if g.key() not in redundant_grant_keys]
+        self.engine.role_graph_cache.add_skipped_grants(len(grants) - len(remaining_grants))
+
+        return remaining_grants
+
+    def coalesce_grants(self, grants: List[Union[Grant, FutureGrant]], get_key) -> List[List[Union[Grant, FutureGrant]]]:
+        # Grants with the same key are grouped in order of first appearance, grants without key are never grouped
+        groups = {}
+
+        for grant in grants:
+            key = get_key(grant)
+            groups.setdefault(key if key is not None else id(grant), []).append(grant)
+
+        return list(groups.values())
+
+    def get_coalesced_grant_key(self, grant: Grant):
+        # Grants of roles have special syntax, OWNERSHIP and STAGE privileges must be applied in exact order
+        if not self.is_independent_grant(grant):
+            return None
+
+        if grant.privilege == "USAGE" and grant.on in (ObjectType.ROLE, ObjectType.DATABASE_ROLE):
+            return None
+
+        return grant.on, str(grant.name)
+
+    def get_coalesced_future_grant_key(self, grant: FutureGrant):
+        # OWNERSHIP cannot be granted together with other privileges
+        if grant.privilege == "OWNERSHIP":
+            return None
+
+        return grant.on_future, grant.in_parent, str(grant.name)
+
     def create_grant(self, role_name, grant: Grant):
         if grant.privilege == "USAGE" and grant.on in (ObjectType.ROLE, ObjectType.DATABASE_ROLE):
             self.engine.execute_safe_ddl(
@@ -265,6 +542,7 @@ class AbstractRoleResolver(AbstractResolver):
                     "name": grant.name,
                     "role_name": role_name,
                 },
+                is_independent=True,
             )
         else:
             self.engine.execute_safe_ddl(
@@ -275,6 +553,7 @@ class AbstractRoleResolver(AbstractResolver):
                     "name": grant.name,
                     "role_name": role_name,
                 },
+                is_independent=self.is_independent_grant(grant),
             )
 
     def drop_grant(self, role_name, grant: Grant):
@@ -303,6 +582,7 @@ class AbstractRoleResolver(AbstractResolver):
                     "name": grant.name,
                     "role_name": role_name,
                 },
+                is_independent=True,
             )
         else:
             self.engine.execute_safe_ddl(
@@ -313,6 +593,7 @@ class AbstractRoleResolver(AbstractResolver):
                     "name": grant.name,
                     "role_name": role_name,
                 },
+                is_independent=self.is_independent_grant(grant),
             )
 
     def create_account_grant(self, role_name, account_grant: AccountGrant):
@@ -322,6 +603,7 @@ class AbstractRoleResolver(AbstractResolver):
                 "privilege": account_grant.privilege,
                 "role_name": role_name,
             },
+            is_independent=True,
         )
 
     def drop_account_grant(self, role_name, account_grant: AccountGrant):
@@ -331,6 +613,7 @@ class AbstractRoleResolver(AbstractResolver):
                 "privilege": account_grant.privilege,
                 "role_name": role_name,
             },
+            is_independent=True,
         )
 
     def create_future_grant(self, role_name, grant: FutureGrant):
@@ -343,6 +626,7 @@ class AbstractRoleResolver(AbstractResolver):
                 "name": grant.name,
                 "role_name": role_name,
             },
+            is_independent=True,
         )
 
     def drop_future_grant(self, role_name, grant: FutureGrant):
@@ -355,6 +639,7 @@ class AbstractRoleResolver(AbstractResolver):
                 "name": grant.name,
                 "role_name": role_name,
             },
+            is_independent=True,
         )
 
     def apply_future_grant_to_existing_objects(self, role_name, grant: FutureGrant):
@@ -374,11 +659,20 @@ class AbstractRoleResolver(AbstractResolver):
             },
         )
 
+    def is_independent_grant(self, grant: Grant):
+        # OWNERSHIP and STAGE privileges depend on each other (e.g. READ and WRITE), order of execution must be preserved
+        return grant.privilege != "OWNERSHIP" and grant.on != ObjectType.STAGE
+
     def grant_to_future_grant(self, grant: Grant):
         # Overloaded in Database and Schema role resolvers
         # Other role types are not expected to utilize furue grants
         return None
 
+    def is_future_grant_in_keys(self, grant: Grant, future_grant_keys: set):
+        future_grant = self.grant_to_future_grant(grant)
+
+        return future_grant is not None and future_grant.key() in future_grant_keys
+
     def build_database_role_grants(self, database_name_pattern: IdentPattern, role_type: str) -> List[Grant]:
         grants = []
 
@@ -10,16 +10,40 @@ class AbstractSchemaObjectResolver(AbstractResolver):
 
         # Process schemas in parallel
         for schema_objects in self.engine.executor.map(
-            self.get_existing_objects_in_schema, self.engine.schema_cache.schemas.values()
+            self._get_existing_objects_in_schema_from_snapshot, self.engine.schema_cache.schemas.values()
         ):
             existing_objects.update(schema_objects)
 
         return existing_objects
 
+    def _get_existing_objects_in_schema_from_snapshot(self, schema: dict):
+        if self.object_type not in self.engine.snapshot_cache.probe_object_types:
+            return self.get_existing_objects_in_schema(schema)
+
+        return self.engine.snapshot_cache.get_or_load(
+            self.__class__.__name__, schema["database"], schema["schema"], self.get_existing_objects_in_schema, schema
+        )
+
     @abstractmethod
     def get_existing_objects_in_schema(self, schema: dict):
         pass
 
+    def show_objects_in_schema(self, object_type_plural: str, schema: dict, schema_column: str = "schema_name"):
+        return self.engine.metadata_cache.show_objects_in_schema(
+            object_type_plural, schema["database"], schema["schema"], schema_column
+        )
+
+    def _process_task_result(self, full_name, result):
+        super()._process_task_result(full_name, result)
+
+        # Listings of objects in schema are no longer accurate after changes
+        if result in (ResolveResult.CREATE, ResolveResult.REPLACE, ResolveResult.DROP):
+            database, schema = full_name.split(".")[:2]
+            self.engine.metadata_cache.invalidate(self.object_type, database, schema)
+
+    def _invalidate_snapshot(self, full_name):
+        self.engine.snapshot_cache.invalidate(full_name.split(".")[0])
+
     def _resolve_drop(self):
         tasks = {}
 
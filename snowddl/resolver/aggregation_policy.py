@@ -14,13 +14,7 @@ class AggregationPolicyResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW AGGREGATION POLICIES IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("AGGREGATION POLICIES", schema)
 
         for r in cur:
             full_name = f"{r['database_name']}.{r['schema_name']}.{r['name']}"
@@ -11,13 +11,7 @@ class AlertResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW ALERTS IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("ALERTS", schema)
 
         for r in cur:
             existing_objects[f"{r['database_name']}.{r['schema_name']}.{r['name']}"] = {
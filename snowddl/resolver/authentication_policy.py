@@ -12,13 +12,7 @@ class AuthenticationPolicyResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW AUTHENTICATION POLICIES IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("AUTHENTICATION POLICIES", schema)
 
         for r in cur:
             full_name = f"{r['database_name']}.{r['schema_name']}.{r['name']}"
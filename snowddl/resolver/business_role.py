@@ -54,7 +54,7 @@ class BusinessRoleResolver(AbstractRoleResolver):
         for global_role_name in business_role_bp.global_roles:
             grants.append(self.build_global_role_grant(global_role_name))
 
-        return RoleBlueprint(
+        return RoleBlueprint.model_construct_trusted(
             full_name=business_role_bp.full_name,
             grants=grants,
             comment=business_role_bp.comment,
@@ -73,13 +73,7 @@ class CloneTableResolver(AbstractResolver):
     def get_tables_for_clone(self, schema):
         tables_for_clone = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW TABLES IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.engine.metadata_cache.show_objects_in_schema("TABLES", schema["database"], schema["schema"])
 
         for r in cur:
             # Skip other table types
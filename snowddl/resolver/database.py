@@ -12,6 +12,9 @@ class DatabaseResolver(AbstractResolver):
     def get_blueprints(self):
         return self.config.get_blueprints_by_type(DatabaseBlueprint)
 
+    def _invalidate_snapshot(self, full_name):
+        self.engine.snapshot_cache.invalidate(full_name.split(".")[0])
+
     def create_object(self, bp: DatabaseBlueprint):
         query = self.engine.query_builder()
         query.append("CREATE")
@@ -128,7 +128,7 @@ class DatabaseOwnerRoleResolver(AbstractRoleResolver):
                     )
                 )
 
-        bp = RoleBlueprint(
+        bp = RoleBlueprint.model_construct_trusted(
             full_name=build_role_ident(
                 self.config.env_prefix, database_bp.full_name.database, self.config.OWNER_ROLE_TYPE, self.get_role_suffix()
             ),
@@ -80,7 +80,7 @@ class DatabaseReadRoleResolver(AbstractRoleResolver):
                     )
                 )
 
-        bp = RoleBlueprint(
+        bp = RoleBlueprint.model_construct_trusted(
             full_name=build_role_ident(
                 self.config.env_prefix, database_bp.full_name.database, self.config.READ_ROLE_TYPE, self.get_role_suffix()
             ),
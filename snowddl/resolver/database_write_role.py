@@ -80,7 +80,7 @@ class DatabaseWriteRoleResolver(AbstractRoleResolver):
                     )
                 )
 
-        bp = RoleBlueprint(
+        bp = RoleBlueprint.model_construct_trusted(
             full_name=build_role_ident(
                 self.config.env_prefix, database_bp.full_name.database, self.config.WRITE_ROLE_TYPE, self.get_role_suffix()
             ),
@@ -67,6 +67,7 @@ class ExternalAccessIntegrationResolver(AbstractResolver):
                 "name": bp.full_name,
                 "comment": common_query.add_short_hash(bp.comment),
             },
+            is_independent=True,
         )
 
         return ResolveResult.CREATE
@@ -93,6 +94,7 @@ class ExternalAccessIntegrationResolver(AbstractResolver):
                     "name": bp.full_name,
                     "comment": common_query.add_short_hash(bp.comment),
                 },
+                is_independent=True,
             )
 
             return ResolveResult.ALTER
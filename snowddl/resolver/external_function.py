@@ -10,13 +10,7 @@ class ExternalFunctionResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW EXTERNAL FUNCTIONS IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("EXTERNAL FUNCTIONS", schema)
 
         for r in cur:
             full_name = f"{r['catalog_name']}.{r['schema_name']}.{r['name']}({dtypes_from_arguments(r['arguments'])})"
@@ -46,6 +40,7 @@ class ExternalFunctionResolver(AbstractSchemaObjectResolver):
                 "full_name": bp.full_name,
                 "comment": query.add_short_hash(bp.comment),
             },
+            is_independent=True,
         )
 
         return ResolveResult.CREATE
@@ -62,6 +57,7 @@ class ExternalFunctionResolver(AbstractSchemaObjectResolver):
                     "full_name": bp.full_name,
                     "comment": query.add_short_hash(bp.comment),
                 },
+                is_independent=True,
             )
 
             return ResolveResult.REPLACE
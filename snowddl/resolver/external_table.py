@@ -10,13 +10,7 @@ class ExternalTableResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW EXTERNAL TABLES IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("EXTERNAL TABLES", schema)
 
         for r in cur:
             full_name = f"{r['database_name']}.{r['schema_name']}.{r['name']}"
@@ -51,6 +45,7 @@ class ExternalTableResolver(AbstractSchemaObjectResolver):
                 "full_name": bp.full_name,
                 "comment": query.add_short_hash(bp.comment),
             },
+            is_independent=True,
         )
 
         return ResolveResult.CREATE
@@ -67,6 +62,7 @@ class ExternalTableResolver(AbstractSchemaObjectResolver):
                     "full_name": bp.full_name,
                     "comment": query.add_short_hash(bp.comment),
                 },
+                is_independent=True,
             )
 
             return ResolveResult.REPLACE
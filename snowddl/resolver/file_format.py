@@ -9,13 +9,7 @@ class FileFormatResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW FILE FORMATS IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("FILE FORMATS", schema)
 
         for r in cur:
             existing_objects[f"{r['database_name']}.{r['schema_name']}.{r['name']}"] = {
@@ -54,6 +48,7 @@ class FileFormatResolver(AbstractSchemaObjectResolver):
                 "full_name": bp.full_name,
                 "comment": common_query.add_short_hash(bp.comment),
             },
+            is_independent=True,
         )
 
         return ResolveResult.CREATE
@@ -95,6 +90,7 @@ class FileFormatResolver(AbstractSchemaObjectResolver):
                     "full_name": bp.full_name,
                     "comment": common_query.add_short_hash(bp.comment),
                 },
+                is_independent=True,
             )
 
             return result
@@ -10,13 +10,7 @@ class FunctionResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW USER FUNCTIONS IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("USER FUNCTIONS", schema)
 
         for r in cur:
             if r["is_external_function"] == "Y" or r["is_data_metric"] == "Y":
@@ -21,13 +21,7 @@ class HybridTableResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW HYBRID TABLES IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("HYBRID TABLES", schema)
 
         for r in cur:
             full_name = f"{r['database_name']}.{r['schema_name']}.{r['name']}"
@@ -64,6 +58,7 @@ class HybridTableResolver(AbstractSchemaObjectResolver):
                 "full_name": bp.full_name,
                 "comment": common_query.add_short_hash(bp.comment),
             },
+            is_independent=True,
         )
 
         return ResolveResult.CREATE
@@ -93,6 +88,7 @@ class HybridTableResolver(AbstractSchemaObjectResolver):
                     "comment": common_query.add_short_hash(bp.comment),
                 },
                 condition=self.engine.settings.execute_replace_table,
+                is_independent=True,
             )
 
             return ResolveResult.REPLACE
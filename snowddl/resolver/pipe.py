@@ -10,13 +10,7 @@ class PipeResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW PIPES IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("PIPES", schema)
 
         for r in cur:
             existing_objects[f"{r['database_name']}.{r['schema_name']}.{r['name']}"] = {
@@ -55,6 +49,7 @@ class PipeResolver(AbstractSchemaObjectResolver):
                 "full_name": bp.full_name,
                 "comment": common_query.add_short_hash(bp.comment),
             },
+            is_independent=True,
         )
 
         return ResolveResult.CREATE
@@ -82,6 +77,7 @@ class PipeResolver(AbstractSchemaObjectResolver):
                     "full_name": bp.full_name,
                     "comment": common_query.add_short_hash(bp.comment),
                 },
+                is_independent=True,
             )
 
             return ResolveResult.REPLACE
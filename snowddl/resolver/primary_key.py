@@ -10,13 +10,7 @@ class PrimaryKeyResolver(AbstractSchemaObjectResolver):
         existing_objects = {}
         constraints_by_name = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW PRIMARY KEYS IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("PRIMARY KEYS", schema)
 
         for r in cur:
             # Constraint for Hybrid tables are handled separately
@@ -10,13 +10,7 @@ class ProcedureResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW USER PROCEDURES IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("USER PROCEDURES", schema)
 
         for r in cur:
             full_name = f"{r['catalog_name']}.{r['schema_name']}.{r['name']}({dtypes_from_arguments(r['arguments'])})"
@@ -45,6 +39,7 @@ class ProcedureResolver(AbstractSchemaObjectResolver):
                 "full_name": bp.full_name,
                 "comment": query.add_short_hash(bp.comment),
             },
+            is_independent=True,
         )
 
         return ResolveResult.CREATE
@@ -61,6 +56,7 @@ class ProcedureResolver(AbstractSchemaObjectResolver):
                     "full_name": bp.full_name,
                     "comment": query.add_short_hash(bp.comment),
                 },
+                is_independent=True,
             )
 
             return ResolveResult.REPLACE
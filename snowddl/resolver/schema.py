@@ -12,6 +12,9 @@ class SchemaResolver(AbstractResolver):
     def get_blueprints(self):
         return self.config.get_blueprints_by_type(SchemaBlueprint)
 
+    def _invalidate_snapshot(self, full_name):
+        self.engine.snapshot_cache.invalidate(full_name.split(".")[0])
+
     def create_object(self, bp: SchemaBlueprint):
         query = self.engine.query_builder()
         query.append("CREATE")
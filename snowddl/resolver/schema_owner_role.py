@@ -32,12 +32,12 @@ class SchemaOwnerRoleResolver(AbstractRoleResolver):
                 # don't generate any roles for this schema
                 continue
 
-            schema_bp.schema_roles = [role.lower() for role in schema_bp.schema_roles]
+            schema_roles = [role.lower() for role in schema_bp.schema_roles]
             # generate some or all schema roles using permission model
             # if schema_roles[list[str]] is non-empty, generate just those roles
             # if schema roles is an empty list, generate all roles
             if schema_permission_model.ruleset.create_schema_owner_role and (
-                "owner" in schema_bp.schema_roles or schema_bp.schema_roles == []
+                "owner" in schema_roles or schema_roles == []
             ):
                 blueprints.append(self.get_blueprint_owner_role(schema_bp))
 
@@ -149,7 +149,7 @@ class SchemaOwnerRoleResolver(AbstractRoleResolver):
                 )
             )
 
-        bp = RoleBlueprint(
+        bp = RoleBlueprint.model_construct_trusted(
             full_name=build_role_ident(
                 self.config.env_prefix,
                 schema_bp.full_name.database,
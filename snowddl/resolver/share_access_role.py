@@ -47,7 +47,7 @@ class ShareAccessRoleResolver(AbstractRoleResolver):
             ),
         ]
 
-        return RoleBlueprint(
+        return RoleBlueprint.model_construct_trusted(
             full_name=build_role_ident(self.config.env_prefix, share_name, self.config.SHARE_ACCESS_ROLE_SUFFIX),
             grants=grants,
         )
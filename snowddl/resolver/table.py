@@ -1,5 +1,6 @@
 from itertools import islice
 from re import compile
+from typing import Dict
 
 from snowddl.blueprint import (
     Ident,
@@ -23,13 +24,7 @@ class TableResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW TABLES IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("TABLES", schema)
 
         for r in cur:
             # Skip other table types
@@ -367,6 +362,23 @@ class TableResolver(AbstractSchemaObjectResolver):
         return ResolveResult.DROP
 
     def _get_existing_columns(self, bp: TableBlueprint):
+        return self.engine.snapshot_cache.get_or_load(
+            f"{self.__class__.__name__}.columns",
+            str(bp.full_name.database_full_name),
+            str(bp.full_name),
+            self._get_existing_columns_from_snowflake,
+            bp,
+        )
+
+    def _get_existing_columns_from_snowflake(self, bp: TableBlueprint):
+        # Columns of all tables in database are loaded in bulk, DESC TABLE is used only if it is not possible
+        if self.engine.settings.bulk_metadata and self.engine.context.current_warehouse:
+            existing_columns = self._get_existing_columns_from_bulk(bp)
+
+            # Bulk result is used only if it matches blueprint, all differences are confirmed by DESC TABLE
+            if existing_columns is not None and self._is_bulk_columns_match(bp, existing_columns):
+                return existing_columns
+
         existing_columns = {}
 
         cur = self.engine.execute_meta(
@@ -398,6 +410,73 @@ class TableResolver(AbstractSchemaObjectResolver):
 
         return existing_columns
 
+    def _get_existing_columns_from_bulk(self, bp: TableBlueprint):
+        # INFORMATION_SCHEMA does not expose expressions of virtual columns
+        if any(c.expression for c in bp.columns):
+            return None
+
+        column_rows = self.engine.metadata_cache.get_columns_in_database(str(bp.full_name.database_full_name))
+        existing_columns = {}
+
+        if column_rows is None or str(bp.full_name) not in column_rows:
+            return None
+
+        for r in column_rows[str(bp.full_name)]:
+            dtype = self._get_bulk_column_type(r)
+
+            # Data type cannot be restored reliably, identity and default values are formatted differently
+            if dtype is None or r["IS_IDENTITY"] == "YES" or r["COLUMN_DEFAULT"] is not None:
+                return None
+
+            existing_columns[r["COLUMN_NAME"]] = TableColumn(
+                name=Ident(r["COLUMN_NAME"]),
+                type=DataType(dtype),
+                not_null=bool(r["IS_NULLABLE"] == "NO"),
+                default=None,
+                expression=None,
+                collate=r["COLLATION_NAME"] if r["COLLATION_NAME"] else None,
+                comment=r["COMMENT"] if r["COMMENT"] else None,
+            )
+
+        return existing_columns
+
+    def _get_bulk_column_type(self, r: dict):
+        data_type = r["DATA_TYPE"]
+
+        if data_type == "NUMBER":
+            return f"NUMBER({r['NUMERIC_PRECISION']},{r['NUMERIC_SCALE']})"
+
+        if data_type == "TEXT":
+            return f"VARCHAR({r['CHARACTER_MAXIMUM_LENGTH']})"
+
+        if data_type in ("TIME", "TIMESTAMP_LTZ", "TIMESTAMP_NTZ", "TIMESTAMP_TZ"):
+            return f"{data_type}({r['DATETIME_PRECISION']})"
+
+        # OBJECT and ARRAY are not included, since structured types are reported without element types
+        if data_type in ("FLOAT", "BOOLEAN", "DATE", "VARIANT", "GEOGRAPHY", "GEOMETRY"):
+            return data_type
+
+        return None
+
+    def _is_bulk_columns_match(self, bp: TableBlueprint, existing_columns: Dict[str, TableColumn]):
+        # INFORMATION_SCHEMA does not expose virtual columns, so columns are trusted only if nothing has to be changed
+        if list(existing_columns) != [str(c.name) for c in bp.columns]:
+            return False
+
+        for bp_c in bp.columns:
+            snow_c = existing_columns[str(bp_c.name)]
+
+            if bp_c.default is not None or bp_c.expression is not None:
+                return False
+
+            if snow_c.type != bp_c.type or snow_c.not_null != bp_c.not_null:
+                return False
+
+            if snow_c.collate != bp_c.collate or snow_c.comment != bp_c.comment:
+                return False
+
+        return True
+
     def _build_create_table(self, bp: TableBlueprint, snow_cols=None):
         query = self.engine.query_builder()
         query.append("CREATE")
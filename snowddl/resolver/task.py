@@ -9,13 +9,7 @@ class TaskResolver(AbstractSchemaObjectResolver):
     def get_existing_objects_in_schema(self, schema: dict):
         existing_objects = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW TASKS IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("TASKS", schema)
 
         for r in cur:
             existing_objects[f"{r['database_name']}.{r['schema_name']}.{r['name']}"] = {
@@ -43,6 +37,7 @@ class TaskResolver(AbstractSchemaObjectResolver):
                 "full_name": bp.full_name,
                 "comment": query.add_short_hash(bp.comment),
             },
+            is_independent=True,
         )
 
         return ResolveResult.CREATE
@@ -59,6 +54,7 @@ class TaskResolver(AbstractSchemaObjectResolver):
                     "full_name": bp.full_name,
                     "comment": query.add_short_hash(bp.comment),
                 },
+                is_independent=True,
             )
 
             return ResolveResult.REPLACE
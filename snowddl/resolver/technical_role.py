@@ -20,16 +20,16 @@ class TechnicalRoleResolver(AbstractRoleResolver):
                 grant_pattern.on.blueprint_cls, grant_pattern.pattern
             ).values():
                 grants.append(
-                    Grant(
+                    Grant.model_construct_trusted(
                         privilege=grant_pattern.privilege,
                         on=grant_pattern.on,
                         name=obj_bp.full_name,
                     ),
                 )
 
-        return RoleBlueprint(
+        return RoleBlueprint.model_construct_trusted(
             full_name=technical_role_bp.full_name,
             grants=grants,
-            account_grants=technical_role_bp.account_grants,
+            account_grants=list(technical_role_bp.account_grants),
             comment=technical_role_bp.comment,
         )
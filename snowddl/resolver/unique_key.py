@@ -10,13 +10,7 @@ class UniqueKeyResolver(AbstractSchemaObjectResolver):
         existing_objects = {}
         constraints_by_name = {}
 
-        cur = self.engine.execute_meta(
-            "SHOW UNIQUE KEYS IN SCHEMA {database:i}.{schema:i}",
-            {
-                "database": schema["database"],
-                "schema": schema["schema"],
-            },
-        )
+        cur = self.show_objects_in_schema("UNIQUE KEYS", schema)
 
         for r in cur:
             # Constraint for Hybrid tables are handled separately
@@ -9,14 +9,7 @@ class UserRoleResolver(AbstractRoleResolver):
     def get_existing_role_grants(self, role_name):
         grants = []
 
-        cur = self.engine.execute_meta(
-            "SHOW GRANTS TO ROLE {role_name:i}",
-            {
-                "role_name": role_name,
-            },
-        )
-
-        for r in cur:
+        for r in self.engine.role_cache.get_grant_rows(role_name):
             # Check ROLE grants only, ignore everything else
             # User roles may accumulate random grants from temporary tables and stages
             # as well as ownership of manually created objects
@@ -61,7 +54,7 @@ class UserRoleResolver(AbstractRoleResolver):
                 )
             )
 
-        bp = RoleBlueprint(
+        bp = RoleBlueprint.model_construct_trusted(
             full_name=build_role_ident(self.config.env_prefix, user.full_name.name, self.get_role_suffix()),
             grants=grants,
         )
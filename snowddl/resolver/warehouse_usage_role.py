@@ -36,7 +36,7 @@ class WarehouseUsageRoleResolver(AbstractRoleResolver):
             )
         )
 
-        bp = RoleBlueprint(
+        bp = RoleBlueprint.model_construct_trusted(
             full_name=build_role_ident(
                 self.config.env_prefix, warehouse.full_name.name, self.config.USAGE_ROLE_TYPE, self.get_role_suffix()
             ),
@@ -23,12 +23,22 @@ class SnowDDLSettings(BaseModelWithConfig):
     refresh_future_grants: bool = False
     refresh_stage_encryption: bool = False
     refresh_secrets: bool = False
+    analyze_role_graph: bool = False
+    minimize_role_grants: bool = False
     clone_table: bool = False
     exclude_object_types: List[ObjectType] = []
     include_object_types: List[ObjectType] = []
     include_databases: List[DatabaseIdent] = []
     ignore_ownership: bool = False
+    bulk_metadata: bool = False
+    bulk_grants: bool = False
+    snapshot_path: Optional[str] = None
+    snapshot_ttl: int = 3600
     max_workers: int = 32
+    max_connections: int = 1
+    max_async_queries: int = 0
+    max_statements_per_request: int = 1
+    max_concurrent_resolvers: int = 1
 
     # Options specific for snowddl-convert
     convert_function_body_to_file: bool = False
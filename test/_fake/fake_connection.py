@@ -0,0 +1,868 @@
+from collections import defaultdict
+from itertools import count
+from json import dumps
+from pathlib import Path
+from pickle import dump, load, HIGHEST_PROTOCOL
+from re import compile, escape, IGNORECASE, DOTALL
+from threading import RLock
+from time import sleep
+from typing import Callable, Dict, List, Optional, Union
+
+from snowflake.connector.errors import ProgrammingError
+
+from snowddl.blueprint import ObjectType
+
+
+ident_pattern = r'(?:"(?:[^"]|"")*"|[A-Za-z_][A-Za-z0-9_$]*)'
+name_pattern = rf"{ident_pattern}(?:\.{ident_pattern})*"
+string_pattern = r"'(?:[^'\\]|''|\\.)*'"
+
+# Multi-word object types are matched explicitly, longest types first
+object_types = {t.singular for t in ObjectType if t.singular} | {"SHARE", "API INTEGRATION", "STORAGE INTEGRATION"}
+type_pattern = "(?:" + "|".join(t.replace(" ", r"\s+") for t in sorted(object_types, key=len, reverse=True)) + ")"
+
+ident_re = compile(ident_pattern)
+use_re = compile(r"^USE\s+(ROLE|WAREHOUSE|DATABASE|SCHEMA)\s+(?P<name>.+)$", IGNORECASE | DOTALL)
+show_re = compile(
+    rf"^SHOW\s+(?P<future>FUTURE\s+)?(?P<plural>[A-Z ]+?)(\s+LIKE\s+(?P<like>{string_pattern}))?"
+    rf"(\s+(?P<preposition>IN|TO|ON|OF|FOR)\s+(?P<scope>[A-Z ]+?)(\s+(?P<scope_name>{name_pattern}))?)?$",
+    IGNORECASE | DOTALL,
+)
+desc_re = compile(rf"^DESC(RIBE)?\s+(?P<type>{type_pattern})\s+(?P<name>{name_pattern})", IGNORECASE | DOTALL)
+create_re = compile(
+    rf"^CREATE\s+(?P<replace>OR\s+REPLACE\s+)?(?P<modifiers>(?:(?:TRANSIENT|SECURE|RECURSIVE)\s+)*)(?P<type>{type_pattern})\s+(IF\s+NOT\s+EXISTS\s+)?"
+    rf"(?P<name>{name_pattern})(?P<rest>.*)$",
+    IGNORECASE | DOTALL,
+)
+alter_re = compile(
+    rf"^ALTER\s+(?P<type>{type_pattern})\s+(IF\s+EXISTS\s+)?(?P<name>{name_pattern})\s+(?P<rest>.*)$", IGNORECASE | DOTALL
+)
+drop_re = compile(rf"^DROP\s+(?P<type>{type_pattern})\s+(?P<if_exists>IF\s+EXISTS\s+)?(?P<name>{name_pattern})", IGNORECASE | DOTALL)
+comment_re = compile(
+    rf"^COMMENT\s+(IF\s+EXISTS\s+)?ON\s+(?P<type>{type_pattern})\s+(?P<name>{name_pattern})\s+IS\s+(?P<comment>{string_pattern})",
+    IGNORECASE | DOTALL,
+)
+grant_role_re = compile(
+    rf"^(?P<action>GRANT|REVOKE)\s+(DATABASE\s+)?ROLE\s+(?P<name>{name_pattern})\s+(TO|FROM)\s+(?P<grantee_type>ROLE|USER|SHARE)\s+(?P<grantee>{name_pattern})",
+    IGNORECASE | DOTALL,
+)
+grant_future_re = compile(
+    rf"^(?P<action>GRANT|REVOKE)\s+(?P<privileges>.+?)\s+ON\s+FUTURE\s+(?P<plural>[A-Z ]+?)\s+IN\s+(?P<parent_type>SCHEMA|DATABASE)\s+"
+    rf"(?P<parent>{name_pattern})\s+(TO|FROM)\s+ROLE\s+(?P<grantee>{name_pattern})",
+    IGNORECASE | DOTALL,
+)
+grant_all_re = compile(r"^(GRANT|REVOKE)\s+.+?\s+ON\s+ALL\s+", IGNORECASE | DOTALL)
+grant_account_re = compile(
+    rf"^(?P<action>GRANT|REVOKE)\s+(?P<privileges>.+?)\s+ON\s+ACCOUNT\s+(TO|FROM)\s+ROLE\s+(?P<grantee>{name_pattern})",
+    IGNORECASE | DOTALL,
+)
+grant_object_re = compile(
+    rf"^(?P<action>GRANT|REVOKE)\s+(?P<privileges>.+?)\s+ON\s+(?P<type>{type_pattern})\s+(?P<name>{name_pattern}(\([^)]*\))?)"
+    rf"\s+(TO|FROM)\s+(?P<grantee_type>ROLE|SHARE)\s+(?P<grantee>{name_pattern})",
+    IGNORECASE | DOTALL,
+)
+select_grants_to_roles_re = compile(r"^SELECT\s+.+?\s+FROM\s+SNOWFLAKE\.ACCOUNT_USAGE\.GRANTS_TO_ROLES\b", IGNORECASE | DOTALL)
+set_comment_re = compile(rf"\bCOMMENT\s*=\s*(?P<comment>{string_pattern})", IGNORECASE | DOTALL)
+set_retention_re = compile(r"\bDATA_RETENTION_TIME_IN_DAYS\s*=\s*(?P<retention_time>\d+)", IGNORECASE)
+# Only these object types are tracked, objects of other types are accepted by DDL, but never listed by SHOW
+modelled_object_types = {"DATABASE", "SCHEMA", "TABLE", "ROLE"}
+modelled_plurals = {"DATABASES", "SCHEMAS", "TABLES", "ROLES"}
+
+column_modifier_re = compile(r"\s+(COLLATE|DEFAULT|NOT\s+NULL|NULL|AS|COMMENT|PRIMARY|UNIQUE|IDENTITY|AUTOINCREMENT)\b", IGNORECASE)
+
+
+class FakeSnowflakeCatalog:
+    """
+    In-memory catalog of Snowflake objects, which is sufficient to run SnowDDL without account
+    Databases, schemas, tables and roles are tracked with attributes used by SnowDDL
+    All other attributes have constant default values
+    Objects of other types are not tracked, SHOW commands return no rows for them
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else None
+
+        self.databases: Dict[str, Dict] = {}
+        self.schemas: Dict[tuple, Dict] = {}
+        self.schema_objects: Dict[str, Dict[tuple, Dict]] = defaultdict(dict)
+        self.account_objects: Dict[str, Dict[str, Dict]] = defaultdict(dict)
+        self.columns: Dict[tuple, List[Dict]] = {}
+
+        self.grants: Dict[str, Dict[tuple, Dict]] = defaultdict(dict)
+        self.future_grants: Dict[str, Dict[tuple, Dict]] = defaultdict(dict)
+
+        self.lock = RLock()
+        self.query_results: Dict[str, Union[List[Dict], Exception]] = {}
+        self.sfqid_counter = count(1)
+
+    @staticmethod
+    def load(path: Union[str, Path]):
+        if Path(path).is_file():
+            with open(path, "rb") as f:
+                catalog = load(f)
+
+            catalog.path = Path(path)
+            catalog.lock = RLock()
+            catalog.query_results = {}
+            catalog.sfqid_counter = count(1)
+
+            return catalog
+
+        return FakeSnowflakeCatalog(path)
+
+    def save(self):
+        if not self.path:
+            return
+
+        with self.lock, open(self.path, "wb") as f:
+            dump(self, f, protocol=HIGHEST_PROTOCOL)
+
+    def __getstate__(self):
+        # Lock and results of async queries are not persisted
+        state = self.__dict__.copy()
+        del state["lock"]
+        del state["query_results"]
+        del state["sfqid_counter"]
+
+        return state
+
+
+class FakeSnowflakeConnection:
+    """
+    Stand-in for SnowflakeConnection backed by in-memory catalog, intended for offline tests and benchmarks
+
+    Latency may be defined as number of seconds for every query, as dict with number of seconds by first keyword
+    of query (e.g. "SHOW", "DESC", "CREATE", "*" for all other queries) or as callable accepting SQL text
+    """
+
+    def __init__(
+        self,
+        catalog: Optional[FakeSnowflakeCatalog] = None,
+        latency: Union[float, Dict[str, float], Callable[[str], float]] = 0.0,
+        account: str = "FAKE_ACCOUNT",
+        user: str = "FAKE_USER",
+        role: str = "SYSADMIN",
+        warehouse: Optional[str] = "FAKE_WH",
+        edition: str = "ENTERPRISE",
+        save_on_close: bool = False,
+    ):
+        self.catalog = catalog if catalog is not None else FakeSnowflakeCatalog()
+        self.latency = latency
+
+        self.account = account
+        self.user = user
+        self.role = role
+        self.warehouse = warehouse
+        self.edition = edition
+        self.save_on_close = save_on_close
+
+        self.executed_queries: List[str] = []
+
+        self._is_closed = False
+
+    def cursor(self, cursor_class=None):
+        return FakeSnowflakeCursor(self)
+
+    def close(self):
+        if self.save_on_close and not self._is_closed:
+            self.catalog.save()
+
+        self._is_closed = True
+
+    def is_closed(self):
+        return self._is_closed
+
+    def is_valid(self):
+        return not self._is_closed
+
+    def get_query_status_throw_if_error(self, sfqid):
+        # Async queries are completed immediately, results are shared by all connections using the same catalog
+        with self.catalog.lock:
+            result = self.catalog.query_results.pop(sfqid, None)
+
+        if isinstance(result, Exception):
+            raise result
+
+        return "SUCCESS"
+
+    def is_still_running(self, status):
+        return False
+
+    def next_sfqid(self):
+        with self.catalog.lock:
+            return f"fake-{next(self.catalog.sfqid_counter)}"
+
+    def get_latency(self, sql):
+        if callable(self.latency):
+            return self.latency(sql)
+
+        if isinstance(self.latency, dict):
+            keyword = sql.split(None, 1)[0].upper() if sql.strip() else ""
+            return self.latency.get(keyword, self.latency.get("*", 0.0))
+
+        return self.latency
+
+
+class FakeSnowflakeCursor:
+    def __init__(self, connection: FakeSnowflakeConnection):
+        self.connection = connection
+        self.catalog = connection.catalog
+
+        self.rows: List[Dict] = []
+        self.sfqid: Optional[str] = None
+
+    def execute(self, sql, file_stream=None, num_statements=None, **kwargs):
+        statements = split_statements(sql) if num_statements else [sql]
+        self.rows = []
+
+        for statement in statements:
+            delay = self.connection.get_latency(statement)
+
+            if delay:
+                sleep(delay)
+
+            self.sfqid = self.connection.next_sfqid()
+            self.connection.executed_queries.append(statement)
+
+            with self.catalog.lock:
+                self.rows = self._execute_statement(statement.strip())
+
+        return self
+
+    def execute_async(self, sql, **kwargs):
+        try:
+            self.execute(sql)
+            result = self.rows
+        except ProgrammingError as e:
+            result = e
+
+        with self.catalog.lock:
+            self.catalog.query_results[self.sfqid] = result
+
+        return {"queryId": self.sfqid}
+
+    def describe(self, sql, **kwargs):
+        return []
+
+    @property
+    def rowcount(self):
+        return len(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def _execute_statement(self, sql):
+        if sql.upper().startswith("SELECT CURRENT_ACCOUNT()"):
+            return [self._context_row()]
+
+        for regexp, handler in (
+            (use_re, self._use),
+            (show_re, self._show),
+            (desc_re, self._desc),
+            (create_re, self._create),
+            (alter_re, self._alter),
+            (drop_re, self._drop),
+            (comment_re, self._comment),
+            (grant_role_re, self._grant_role),
+            (grant_future_re, self._grant_future),
+            (grant_all_re, lambda m: []),
+            (grant_account_re, self._grant_account),
+            (grant_object_re, self._grant_object),
+            (select_grants_to_roles_re, self._select_grants_to_roles),
+        ):
+            m = regexp.match(sql)
+
+            if m:
+                return handler(m)
+
+        # All other statements are accepted, but have no effect on catalog
+        return []
+
+    def _context_row(self):
+        return {
+            "CURRENT_ACCOUNT": self.connection.account,
+            "CURRENT_REGION": "FAKE_REGION",
+            "CURRENT_SESSION": "1",
+            "CURRENT_USER": self.connection.user,
+            "CURRENT_ROLE": self.connection.role,
+            "CURRENT_WAREHOUSE": self.connection.warehouse,
+            "IS_ACCOUNT_ADMIN": True,
+            "IS_SYS_ADMIN": True,
+            "IS_SECURITY_ADMIN": True,
+            "BOOTSTRAP_ACCOUNT": dumps(
+                {"serverVersion": "0.0.0", "accountInfo": {"serviceLevelName": self.connection.edition}}
+            ),
+        }
+
+    def _use(self, m):
+        if m.group(1).upper() == "ROLE":
+            self.connection.role = split_name(m["name"])[0]
+        elif m.group(1).upper() == "WAREHOUSE":
+            self.connection.warehouse = split_name(m["name"])[0]
+
+        return []
+
+    def _show(self, m):
+        plural = normalize_type(m["plural"])
+        scope = normalize_type(m["scope"]) if m["scope"] else None
+        scope_name = split_name(m["scope_name"]) if m["scope_name"] else None
+        like = like_to_regexp(unquote_string(m["like"])) if m["like"] else None
+
+        if m["future"]:
+            if plural == "GRANTS" and m["preposition"].upper() == "TO" and scope == "ROLE":
+                return list(self.catalog.future_grants[scope_name[0]].values())
+
+            if plural == "GRANTS" and m["preposition"].upper() == "IN" and scope in ("DATABASE", "SCHEMA"):
+                parent = ".".join(scope_name)
+
+                return [r for grants in self.catalog.future_grants.values() for key, r in grants.items() if key[2] == parent]
+
+            return []
+
+        if plural == "GRANTS":
+            if m["preposition"] and m["preposition"].upper() == "TO" and scope == "ROLE":
+                return list(self.catalog.grants[scope_name[0]].values())
+
+            return []
+
+        if plural == "DATABASES":
+            rows = list(self.catalog.databases.values())
+        elif plural == "SCHEMAS":
+            rows = [r for (database, _), r in self.catalog.schemas.items() if scope_name is None or database == scope_name[0]]
+        elif plural not in modelled_plurals:
+            rows = []
+        elif scope in ("SCHEMA", "DATABASE"):
+            rows = []
+
+            for (database, schema, _), r in self.catalog.schema_objects[plural].items():
+                if database == scope_name[0] and (scope == "DATABASE" or schema == scope_name[1]):
+                    rows.append(r)
+        else:
+            rows = list(self.catalog.account_objects[plural].values())
+
+        if like:
+            rows = [r for r in rows if like.match(r["name"])]
+
+        return rows
+
+    def _desc(self, m):
+        object_type = normalize_type(m["type"])
+        name = split_name(m["name"])
+
+        if object_type == "TABLE":
+            if tuple(name) not in self.catalog.columns:
+                raise object_does_not_exist(object_type, name)
+
+            return list(self.catalog.columns[tuple(name)])
+
+        return []
+
+    def _create(self, m):
+        object_type = normalize_type(m["type"])
+        name = split_name(m["name"])
+        rest = m["rest"]
+        is_transient = "TRANSIENT" in (m["modifiers"] or "").upper()
+
+        comment = set_comment_re.search(rest)
+        retention_time = set_retention_re.search(rest)
+
+        row = {
+            "created_on": "1970-01-01 00:00:00.000 -0000",
+            "name": name[-1],
+            "owner": self.connection.role,
+            "comment": unquote_string(comment["comment"]) if comment else "",
+            "retention_time": retention_time["retention_time"] if retention_time else "1",
+            "origin": "",
+        }
+
+        if object_type == "DATABASE":
+            row["options"] = "TRANSIENT" if is_transient else ""
+            row["kind"] = "STANDARD"
+
+            self._drop_database(name[0])
+            self.catalog.databases[name[0]] = row
+
+            self._create_schema(name[0], "PUBLIC", {**row, "options": ""})
+            return []
+
+        if object_type == "SCHEMA":
+            options = ["TRANSIENT"] if is_transient else []
+
+            if "MANAGED ACCESS" in rest.upper():
+                options.append("MANAGED ACCESS")
+
+            self._drop_schema(name[0], name[1])
+            self._create_schema(name[0], name[1], {**row, "options": ", ".join(options)})
+            return []
+
+        if object_type not in modelled_object_types:
+            return []
+
+        plural = plural_for_type(object_type)
+
+        if len(name) == 3:
+            if (name[0], name[1]) not in self.catalog.schemas:
+                raise object_does_not_exist("SCHEMA", name[:2])
+
+            if not m["replace"] and (name[0], name[1], name[2]) in self.catalog.schema_objects[plural]:
+                if "IF NOT EXISTS" in m.group(0).upper():
+                    return []
+
+                raise object_already_exists(object_type, name)
+
+            row["database_name"] = name[0]
+            row["schema_name"] = name[1]
+
+            if object_type == "TABLE":
+                row.update(
+                    {
+                        "kind": "TRANSIENT" if is_transient else "TABLE",
+                        "cluster_by": "",
+                        "rows": 0,
+                        "bytes": 0,
+                        "automatic_clustering": "OFF",
+                        "change_tracking": "ON" if "CHANGE_TRACKING = TRUE" in rest.upper() else "OFF",
+                        "search_optimization": "OFF",
+                        "is_external": "N",
+                        "is_event": "N",
+                        "is_hybrid": "N",
+                        "is_iceberg": "N",
+                        "is_dynamic": "N",
+                    }
+                )
+
+                self.catalog.columns[tuple(name)] = self._parse_columns(rest)
+
+            self.catalog.schema_objects[plural][tuple(name)] = row
+            return []
+
+        if not m["replace"] and name[0] in self.catalog.account_objects[plural]:
+            raise object_already_exists(object_type, name)
+
+        self.catalog.account_objects[plural][name[0]] = row
+        return []
+
+    def _create_schema(self, database, schema, row):
+        self.catalog.schemas[(database, schema)] = {**row, "name": schema, "database_name": database}
+
+    def _alter(self, m):
+        object_type = normalize_type(m["type"])
+        name = split_name(m["name"])
+        rest = m["rest"]
+
+        if object_type not in modelled_object_types:
+            return []
+
+        row = self._get_object_row(object_type, name)
+
+        if row is None:
+            if "IF EXISTS" in m.group(0).upper():
+                return []
+
+            raise object_does_not_exist(object_type, name)
+
+        if object_type == "TABLE":
+            self._alter_table_columns(name, rest)
+
+        if rest.upper().startswith("SET"):
+            comment = set_comment_re.search(rest)
+            retention_time = set_retention_re.search(rest)
+
+            if comment:
+                row["comment"] = unquote_string(comment["comment"])
+
+            if retention_time:
+                row["retention_time"] = retention_time["retention_time"]
+
+        if rest.upper().startswith("UNSET") and "COMMENT" in rest.upper():
+            row["comment"] = ""
+
+        return []
+
+    def _alter_table_columns(self, name, rest):
+        columns = self.catalog.columns.setdefault(tuple(name), [])
+        rest_upper = rest.upper()
+
+        if rest_upper.startswith("ADD COLUMN"):
+            columns.extend(self._parse_columns(f"({rest[len('ADD COLUMN'):]})"))
+        elif rest_upper.startswith("DROP COLUMN"):
+            drop_names = [split_name(n.strip())[0] for n in rest[len("DROP COLUMN") :].split(",")]
+            columns[:] = [c for c in columns if c["name"] not in drop_names]
+        elif rest_upper.startswith("MODIFY COLUMN") or rest_upper.startswith("ALTER COLUMN"):
+            for part in split_top_level(rest[len("MODIFY COLUMN") :], ","):
+                part = part.strip()
+
+                if part.upper().startswith("COLUMN"):
+                    part = part[len("COLUMN") :].strip()
+
+                m = ident_re.match(part)
+                column = next((c for c in columns if c["name"] == split_name(m.group(0))[0]), None)
+                action = part[m.end() :].strip().upper()
+
+                if column is None:
+                    continue
+
+                if action.startswith("SET NOT NULL"):
+                    column["null?"] = "N"
+                elif action.startswith("DROP NOT NULL"):
+                    column["null?"] = "Y"
+                elif action.startswith("DROP DEFAULT"):
+                    column["default"] = None
+                elif action.startswith("COMMENT"):
+                    column["comment"] = unquote_string(part[m.end() :].strip()[len("COMMENT") :].strip()) or None
+                elif action.startswith("TYPE") or action.startswith("SET DATA TYPE"):
+                    column["type"] = part[m.end() :].strip().split(None, 1)[-1].strip()
+
+    def _drop(self, m):
+        object_type = normalize_type(m["type"])
+        name = split_name(m["name"])
+
+        if object_type not in modelled_object_types:
+            return []
+
+        if self._get_object_row(object_type, name) is None:
+            if m["if_exists"]:
+                return []
+
+            raise object_does_not_exist(object_type, name)
+
+        if object_type == "DATABASE":
+            self._drop_database(name[0])
+        elif object_type == "SCHEMA":
+            self._drop_schema(name[0], name[1])
+        elif len(name) == 3:
+            del self.catalog.schema_objects[plural_for_type(object_type)][tuple(name)]
+            self.catalog.columns.pop(tuple(name), None)
+        else:
+            del self.catalog.account_objects[plural_for_type(object_type)][name[0]]
+
+            if object_type == "ROLE":
+                self.catalog.grants.pop(name[0], None)
+                self.catalog.future_grants.pop(name[0], None)
+
+        return []
+
+    def _drop_database(self, database):
+        for database_name, schema_name in list(self.catalog.schemas):
+            if database_name == database:
+                self._drop_schema(database_name, schema_name)
+
+        self.catalog.databases.pop(database, None)
+
+    def _drop_schema(self, database, schema):
+        for objects in self.catalog.schema_objects.values():
+            for key in [k for k in objects if k[0] == database and k[1] == schema]:
+                del objects[key]
+                self.catalog.columns.pop(key, None)
+
+        self.catalog.schemas.pop((database, schema), None)
+
+    def _comment(self, m):
+        row = self._get_object_row(normalize_type(m["type"]), split_name(m["name"]))
+
+        if row is not None:
+            row["comment"] = unquote_string(m["comment"])
+
+        return []
+
+    def _grant_role(self, m):
+        if m["grantee_type"].upper() != "ROLE":
+            return []
+
+        name = ".".join(split_name(m["name"]))
+        grantee = split_name(m["grantee"])[0]
+
+        self._apply_grant(m["action"], self.catalog.grants[grantee], "USAGE", "ROLE", name, grantee)
+        return []
+
+    def _grant_future(self, m):
+        object_type = normalize_type(m["plural"])[:-1]
+        parent = split_name(m["parent"])
+        grantee = split_name(m["grantee"])[0]
+        grant_on = object_type.replace(" ", "_")
+
+        for privilege in split_privileges(m["privileges"]):
+            key = (privilege, grant_on, ".".join(parent))
+
+            if m["action"].upper() == "GRANT":
+                self.catalog.future_grants[grantee][key] = {
+                    "created_on": "1970-01-01 00:00:00.000 -0000",
+                    "privilege": privilege,
+                    "grant_on": grant_on,
+                    "name": f"{'.'.join(parent)}.<{grant_on}>",
+                    "grant_to": "ROLE",
+                    "grantee_name": grantee,
+                    "grant_option": "false",
+                }
+            else:
+                self.catalog.future_grants[grantee].pop(key, None)
+
+        return []
+
+    def _grant_account(self, m):
+        grantee = split_name(m["grantee"])[0]
+
+        for privilege in split_privileges(m["privileges"]):
+            self._apply_grant(m["action"], self.catalog.grants[grantee], privilege, "ACCOUNT", self.connection.account, grantee)
+
+        return []
+
+    def _grant_object(self, m):
+        if m["grantee_type"].upper() != "ROLE":
+            return []
+
+        object_type = normalize_type(m["type"])
+        name = m["name"]
+
+        # Arguments of functions and procedures are preserved as is
+        args_start = name.find("(")
+        name_parts = split_name(name[:args_start] if args_start >= 0 else name)
+        full_name = ".".join(name_parts) + (name[args_start:] if args_start >= 0 else "")
+
+        grantee = split_name(m["grantee"])[0]
+
+        for privilege in split_privileges(m["privileges"]):
+            if privilege == "OWNERSHIP" and m["action"].upper() == "GRANT":
+                row = self._get_object_row(object_type, name_parts)
+
+                if row is not None:
+                    for role_grants in self.catalog.grants.values():
+                        role_grants.pop(("OWNERSHIP", object_type.replace(" ", "_"), full_name), None)
+
+                    row["owner"] = grantee
+
+            self._apply_grant(m["action"], self.catalog.grants[grantee], privilege, object_type, full_name, grantee)
+
+        return []
+
+    def _select_grants_to_roles(self, m):
+        # Conditions are not evaluated, ACCOUNT_USAGE is always up to date and returns all grants to roles
+        rows = []
+
+        for grantee, role_grants in self.catalog.grants.items():
+            for r in role_grants.values():
+                if r["granted_on"] == "ACCOUNT":
+                    name_parts = [r["name"]]
+                else:
+                    name_parts = r["name"].split(".", 2)
+
+                rows.append(
+                    {
+                        "CREATED_ON": r["created_on"],
+                        "MODIFIED_ON": r["created_on"],
+                        "PRIVILEGE": r["privilege"],
+                        "GRANTED_ON": r["granted_on"],
+                        "NAME": name_parts[-1],
+                        "TABLE_CATALOG": name_parts[0] if len(name_parts) > 1 or r["granted_on"] == "DATABASE" else None,
+                        "TABLE_SCHEMA": name_parts[1] if len(name_parts) > 2 else None,
+                        "GRANTED_TO": "ROLE",
+                        "GRANTEE_NAME": grantee,
+                        "GRANT_OPTION": r["grant_option"],
+                        "GRANTED_BY": r["granted_by"],
+                        "DELETED_ON": None,
+                    }
+                )
+
+        return rows
+
+    def _apply_grant(self, action, role_grants, privilege, object_type, name, grantee):
+        granted_on = object_type.replace(" ", "_")
+        key = (privilege, granted_on, name)
+
+        if action.upper() == "GRANT":
+            role_grants[key] = {
+                "created_on": "1970-01-01 00:00:00.000 -0000",
+                "privilege": privilege,
+                "granted_on": granted_on,
+                "name": name,
+                "granted_to": "ROLE",
+                "grantee_name": grantee,
+                "grant_option": "false",
+                "granted_by": self.connection.role,
+            }
+        else:
+            role_grants.pop(key, None)
+
+    def _get_object_row(self, object_type, name):
+        if object_type == "DATABASE":
+            return self.catalog.databases.get(name[0])
+
+        if object_type == "SCHEMA":
+            return self.catalog.schemas.get(tuple(name[:2]))
+
+        plural = plural_for_type(object_type)
+
+        if len(name) == 3:
+            return self.catalog.schema_objects[plural].get(tuple(name))
+
+        return self.catalog.account_objects[plural].get(name[0])
+
+    def _parse_columns(self, rest):
+        columns = []
+        start = rest.find("(")
+
+        if start < 0:
+            return columns
+
+        depth = 0
+        end = start
+
+        # Find closing parenthesis of column list
+        for idx, char in enumerate(rest[start:], start):
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+
+                if depth == 0:
+                    end = idx
+                    break
+
+        for column_def in split_top_level(rest[start + 1 : end], ","):
+            column_def = column_def.strip()
+            m = ident_re.match(column_def)
+
+            if not m:
+                continue
+
+            column_rest = column_def[m.end() :].strip()
+            modifier = column_modifier_re.search(column_rest)
+            column_type = column_rest[: modifier.start()] if modifier else column_rest
+
+            comment = compile(rf"\bCOMMENT\s+(?P<comment>{string_pattern})", IGNORECASE).search(column_rest)
+
+            columns.append(
+                {
+                    "name": split_name(m.group(0))[0],
+                    "type": normalize_data_type(column_type.strip()),
+                    "kind": "COLUMN",
+                    "null?": "N" if compile(r"\bNOT\s+NULL\b", IGNORECASE).search(column_rest) else "Y",
+                    "default": None,
+                    "primary key": "N",
+                    "unique key": "N",
+                    "check": None,
+                    "expression": None,
+                    "comment": unquote_string(comment["comment"]) if comment else None,
+                    "policy name": None,
+                }
+            )
+
+        return columns
+
+
+def split_name(name: str) -> List[str]:
+    parts = []
+
+    for m in ident_re.finditer(name):
+        part = m.group(0)
+
+        if part.startswith('"'):
+            parts.append(part[1:-1].replace('""', '"'))
+        else:
+            parts.append(part.upper())
+
+    return parts
+
+
+def split_top_level(value: str, separator: str) -> List[str]:
+    parts = []
+    depth = 0
+    quote = None
+    current = ""
+
+    for char in value:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ("'", '"'):
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(current)
+            current = ""
+            continue
+
+        current += char
+
+    if current.strip():
+        parts.append(current)
+
+    return parts
+
+
+def split_statements(sql: str) -> List[str]:
+    return [s for s in split_top_level(sql, ";") if s.strip()]
+
+
+def split_privileges(privileges: str) -> List[str]:
+    return [" ".join(p.split()).upper() for p in privileges.split(",")]
+
+
+def unquote_string(value: str) -> str:
+    if value and value.startswith("'") and value.endswith("'"):
+        return value[1:-1].replace("''", "'").replace("\\\\", "\\")
+
+    return value
+
+
+def like_to_regexp(pattern: str):
+    regexp = ""
+    is_escaped = False
+
+    for char in pattern:
+        if is_escaped:
+            regexp += escape(char)
+            is_escaped = False
+        elif char == "\\":
+            is_escaped = True
+        elif char == "%":
+            regexp += ".*"
+        elif char == "_":
+            regexp += "."
+        else:
+            regexp += escape(char)
+
+    return compile(f"^{regexp}$", IGNORECASE | DOTALL)
+
+
+def normalize_type(value: str) -> str:
+    return " ".join(value.split()).upper()
+
+
+def normalize_data_type(value: str) -> str:
+    value = " ".join(value.split()).upper().replace(", ", ",")
+
+    if value in ("TEXT", "STRING", "VARCHAR"):
+        return "VARCHAR(16777216)"
+
+    if value in ("NUMBER", "INT", "INTEGER", "BIGINT"):
+        return "NUMBER(38,0)"
+
+    return value
+
+
+def plural_for_type(object_type: str) -> str:
+    for t in ObjectType:
+        if t.singular == object_type:
+            return t.plural
+
+    return f"{object_type}S"
+
+
+def object_does_not_exist(object_type, name):
+    return ProgrammingError(
+        msg=f"{object_type.capitalize()} '{'.'.join(name)}' does not exist or not authorized.", errno=2003, sqlstate="02000"
+    )
+
+
+def object_already_exists(object_type, name):
+    return ProgrammingError(msg=f"Object '{'.'.join(name)}' already exists.", errno=2002, sqlstate="42710")
@@ -0,0 +1,58 @@
+from snowddl.app.base import BaseApp
+
+from fake_connection import FakeSnowflakeCatalog, FakeSnowflakeConnection
+
+
+class FakeApp(BaseApp):
+    """
+    SnowDDL app running against offline in-memory Snowflake stand-in instead of real account, for tests and benchmarks only
+    Accepts the same arguments as "snowddl" command with additional --fake-catalog and --fake-latency
+    """
+
+    def __init__(self):
+        self.fake_catalog = None
+
+        super().__init__()
+
+    def init_arguments_parser(self):
+        parser = super().init_arguments_parser()
+        parser.prog = "snowddl_fake"
+
+        parser.add_argument(
+            "--fake-catalog",
+            help="Path to file with persisted in-memory catalog, created on first run",
+            required=True,
+        )
+        parser.add_argument(
+            "--fake-latency",
+            help="Simulated latency of each query in seconds (default: 0)",
+            default=0.0,
+            type=float,
+        )
+
+        return parser
+
+    def validate_auth_args(self, args):
+        # Offline stand-in does not require credentials
+        return True
+
+    def get_connection(self):
+        # All connections share the same catalog, only the first (main) connection saves it on close
+        is_main_connection = self.fake_catalog is None
+
+        if is_main_connection:
+            self.fake_catalog = FakeSnowflakeCatalog.load(self.args.get("fake_catalog"))
+
+        return FakeSnowflakeConnection(
+            catalog=self.fake_catalog,
+            latency=self.args.get("fake_latency") or 0.0,
+            user=self.args.get("u") or "FAKE_USER",
+            role=self.args.get("r") or "SYSADMIN",
+            warehouse=self.args.get("w") or "FAKE_WH",
+            save_on_close=is_main_connection,
+        )
+
+
+if __name__ == "__main__":
+    app = FakeApp()
+    app.execute()
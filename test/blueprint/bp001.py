@@ -0,0 +1,58 @@
+from copy import copy, deepcopy
+from pickle import dumps, loads
+from pytest import raises
+
+from snowddl.blueprint import DatabaseBlueprint, DatabaseIdent
+
+
+def build_database_bp():
+    return DatabaseBlueprint(full_name=DatabaseIdent("", "DB1"), comment="abc")
+
+
+def test_frozen_blueprint_rejects_assignment():
+    bp = build_database_bp()
+    bp.freeze()
+
+    with raises(ValueError, match="is frozen"):
+        bp.comment = "def"
+
+    assert bp.comment == "abc"
+
+
+def test_unfrozen_blueprint_allows_assignment():
+    bp = build_database_bp()
+    bp.comment = "def"
+
+    assert bp.comment == "def"
+    assert not bp.is_frozen()
+
+
+def test_frozen_state_is_preserved_by_copy():
+    bp = build_database_bp()
+    bp.freeze()
+
+    for copied_bp in (copy(bp), deepcopy(bp), bp.model_copy(), bp.model_copy(deep=True)):
+        assert copied_bp.is_frozen()
+
+        with raises(ValueError, match="is frozen"):
+            copied_bp.comment = "def"
+
+    # Updates are applied before copy is frozen
+    updated_bp = bp.model_copy(update={"comment": "def"})
+
+    assert updated_bp.comment == "def"
+    assert updated_bp.is_frozen()
+
+
+def test_frozen_state_is_preserved_by_pickle():
+    bp = build_database_bp()
+    assert not loads(dumps(bp)).is_frozen()
+
+    bp.freeze()
+    unpickled_bp = loads(dumps(bp))
+
+    assert unpickled_bp == bp
+    assert unpickled_bp.is_frozen()
+
+    with raises(ValueError, match="is frozen"):
+        unpickled_bp.comment = "def"
@@ -0,0 +1,120 @@
+from pytest import mark
+
+from snowddl.blueprint import IdentPattern, IdentPatternIndex, SchemaBlueprint, SchemaIdent
+
+
+# Blueprints are intentionally not sorted, index must keep original order
+schema_names = [
+    ("DB2", "SC1"),
+    ("DB1", "SC2"),
+    ("DB10", "SC1"),
+    ("DB1", "SC1"),
+    ("ANALYTICS", "RAW"),
+    ("DB1", "SC10"),
+    ("DB2", "SC2"),
+    ("ANALYTICS", "MART"),
+]
+
+
+def build_blueprints(env_prefix):
+    blueprints = {}
+
+    for database, schema in schema_names:
+        bp = SchemaBlueprint(full_name=SchemaIdent(env_prefix, database, schema))
+        blueprints[str(bp.full_name)] = bp
+
+    return blueprints
+
+
+def scan_blueprints(blueprints, pattern: IdentPattern):
+    # Previous implementation: regex scan of all blueprints
+    return {full_name: bp for full_name, bp in blueprints.items() if pattern.is_match_ident(bp.full_name)}
+
+
+@mark.parametrize("env_prefix", ["", "DEV__"])
+@mark.parametrize(
+    "pattern",
+    [
+        # Simple patterns
+        "DB1.SC1",
+        "DB9.SC1",
+        # Complex patterns
+        "*",
+        "DB1.*",
+        "DB1*",
+        "DB?.SC1",
+        "DB[12].SC*",
+        "*.SC1",
+        "DB1.SC1|DB2.SC2",
+        "ANALYTICS.*|DB2.SC1",
+        # Negated patterns
+        "*|!DB1.*",
+        "DB1*|!DB1.SC1",
+        "!DB2.*|DB*.SC1",
+        "ANALYTICS.*|!*.RAW|DB1.SC?",
+    ],
+)
+def test_index_matches_scan(env_prefix, pattern):
+    blueprints = build_blueprints(env_prefix)
+    ident_pattern = IdentPattern(pattern)
+
+    index_result = IdentPatternIndex(blueprints).get_blueprints_by_pattern(ident_pattern)
+    scan_result = scan_blueprints(blueprints, ident_pattern)
+
+    # Same blueprints in the same order
+    assert list(index_result.items()) == list(scan_result.items())
+
+
+def test_index_exact_lookup():
+    blueprints = build_blueprints("DEV__")
+    index = IdentPatternIndex(blueprints)
+
+    assert list(index.get_blueprints_by_pattern(IdentPattern("db1.sc1"))) == ["DEV__DB1.SC1"]
+    assert list(index.get_blueprints_by_pattern(IdentPattern("DB1.SC"))) == []
+
+    # Identifier with env prefix is not matched, patterns never contain env prefix
+    assert list(index.get_blueprints_by_pattern(IdentPattern("DEV__DB1.SC1"))) == []
+
+
+def test_index_tests_only_names_with_literal_prefix(monkeypatch):
+    blueprints = build_blueprints("")
+    index = IdentPatternIndex(blueprints)
+
+    pattern = IdentPattern("DB1.SC*|ANALYTICS.R?W|!DB1.SC2")
+    assert pattern.include_prefixes == ["DB1.SC", "ANALYTICS.R"]
+
+    tested_names = []
+    original_is_match = pattern.is_match_str_ident_without_prefix
+
+    def is_match(name):
+        tested_names.append(name)
+        return original_is_match(name)
+
+    monkeypatch.setattr(pattern, "is_match_str_ident_without_prefix", is_match)
+
+    assert list(index.get_blueprints_by_pattern(pattern)) == ["DB1.SC1", "ANALYTICS.RAW", "DB1.SC10"]
+    assert sorted(tested_names) == ["ANALYTICS.RAW", "DB1.SC1", "DB1.SC10", "DB1.SC2"]
+
+
+def test_index_returns_blueprints_in_original_order():
+    blueprints = build_blueprints("")
+    index = IdentPatternIndex(blueprints)
+
+    assert list(index.get_blueprints_by_pattern(IdentPattern("*"))) == list(blueprints)
+    assert list(index.get_blueprints_by_pattern(IdentPattern("DB2.*|DB1.*"))) == [
+        "DB2.SC1",
+        "DB1.SC2",
+        "DB1.SC1",
+        "DB1.SC10",
+        "DB2.SC2",
+    ]
+
+
+def test_index_caches_results_by_pattern():
+    blueprints = build_blueprints("")
+    index = IdentPatternIndex(blueprints)
+
+    index.get_blueprints_by_pattern(IdentPattern("DB1.*"))
+    index.get_blueprints_by_pattern(IdentPattern("db1.*"))
+
+    assert list(index.matched_full_names) == ["DB1.*"]
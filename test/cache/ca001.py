@@ -0,0 +1,104 @@
+from pathlib import Path
+from pytest import fixture
+
+from snowddl.app.base import BaseApp
+from snowddl.blueprint import SchemaBlueprint, WarehouseBlueprint
+from snowddl.cache import ConfigCache
+
+
+@fixture
+def config_path(tmp_path):
+    config_path = tmp_path / "config"
+    (config_path / "db1" / "sc1").mkdir(parents=True)
+
+    (config_path / "warehouse.yaml").write_text("wh001_wh1:\n  size: XSMALL\n", encoding="utf-8")
+    (config_path / "db1" / "params.yaml").write_text("comment: abc\n", encoding="utf-8")
+    (config_path / "db1" / "sc1" / "params.yaml").write_text("comment: abc\n", encoding="utf-8")
+
+    return config_path
+
+
+@fixture
+def cache_path(tmp_path):
+    return tmp_path / "cache"
+
+
+@fixture
+def cache_loads(monkeypatch):
+    # Result of each cache load, None means cache miss
+    loads = []
+    original_load = ConfigCache.load
+
+    def load(self):
+        result = original_load(self)
+        loads.append(result)
+
+        return result
+
+    monkeypatch.setattr(ConfigCache, "load", load)
+
+    return loads
+
+
+def init_app(monkeypatch, config_path: Path, cache_path: Path, *args):
+    monkeypatch.setenv("SNOWFLAKE_ACCOUNT", "test")
+    monkeypatch.setenv("SNOWFLAKE_USER", "test")
+    monkeypatch.setenv("SNOWFLAKE_PASSWORD", "test")
+    monkeypatch.setattr(
+        "sys.argv", ["snowddl", "-c", str(config_path), "--config-cache-path", str(cache_path), *args, "validate"]
+    )
+
+    return BaseApp()
+
+
+def test_config_cache_hit(monkeypatch, config_path, cache_path, cache_loads):
+    parsed_app = init_app(monkeypatch, config_path, cache_path)
+    cached_app = init_app(monkeypatch, config_path, cache_path)
+
+    assert cache_loads[0] is None
+    assert cache_loads[1] is not None
+
+    for cls in (WarehouseBlueprint, SchemaBlueprint):
+        assert cached_app.config.get_blueprints_by_type(cls) == parsed_app.config.get_blueprints_by_type(cls)
+
+
+def test_config_cache_miss_on_changed_file(monkeypatch, config_path, cache_path, cache_loads):
+    init_app(monkeypatch, config_path, cache_path)
+
+    (config_path / "warehouse.yaml").write_text("wh001_wh1:\n  size: SMALL\n", encoding="utf-8")
+    app = init_app(monkeypatch, config_path, cache_path)
+
+    assert cache_loads == [None, None]
+    assert app.config.get_blueprints_by_type(WarehouseBlueprint)["WH001_WH1"].size == "SMALL"
+
+
+def test_config_cache_miss_on_changed_args(monkeypatch, config_path, cache_path, cache_loads):
+    init_app(monkeypatch, config_path, cache_path)
+    init_app(monkeypatch, config_path, cache_path, "--env-prefix", "abc")
+    init_app(monkeypatch, config_path, cache_path, "--env-prefix", "abc")
+
+    assert cache_loads[0] is None
+    assert cache_loads[1] is None
+    assert cache_loads[2] is not None
+
+
+def test_config_cache_disabled_for_custom_modules(monkeypatch, config_path, cache_path, cache_loads):
+    (config_path / "__custom").mkdir()
+    (config_path / "__custom" / "01_custom.py").write_text("def handler(config):\n    pass\n", encoding="utf-8")
+
+    init_app(monkeypatch, config_path, cache_path)
+    init_app(monkeypatch, config_path, cache_path)
+
+    assert cache_loads == []
+    assert not cache_path.exists()
+
+
+def test_config_cache_disabled_for_shared_path(monkeypatch, config_path, cache_path, cache_loads):
+    cache_path.mkdir(mode=0o700)
+    init_app(monkeypatch, config_path, cache_path)
+
+    # Cache written to private directory is not loaded after directory becomes writable by other users
+    cache_path.chmod(0o777)
+    init_app(monkeypatch, config_path, cache_path)
+
+    assert cache_loads == [None]
@@ -0,0 +1,79 @@
+from pathlib import Path
+from pytest import fixture
+
+from snowddl.app.base import BaseApp
+from snowddl.blueprint import DatabaseBlueprint, TableBlueprint, ViewBlueprint
+from snowddl.parser import DirectoryScanner
+
+
+@fixture
+def config_path(tmp_path):
+    config_path = tmp_path / "config"
+
+    for database in ("db1", "db2", "db3"):
+        (config_path / database / "sc1" / "table").mkdir(parents=True)
+        (config_path / database / "params.yaml").write_text("comment: abc\n", encoding="utf-8")
+        (config_path / database / "sc1" / "params.yaml").write_text("comment: abc\n", encoding="utf-8")
+        (config_path / database / "sc1" / "table" / "tb1.yaml").write_text("columns:\n  id: NUMBER(38,0)\n", encoding="utf-8")
+
+    return config_path
+
+
+@fixture
+def scanned_paths(monkeypatch):
+    scanned_paths = []
+    original_scan_dir_recursively = DirectoryScanner._scan_dir_recursively
+
+    def scan_dir_recursively(self, dir_path: Path):
+        scanned_paths.append(dir_path.relative_to(self.base_path).as_posix())
+        original_scan_dir_recursively(self, dir_path)
+
+    monkeypatch.setattr(DirectoryScanner, "_scan_dir_recursively", scan_dir_recursively)
+
+    return scanned_paths
+
+
+def init_app(monkeypatch, config_path: Path, *args):
+    monkeypatch.setenv("SNOWFLAKE_ACCOUNT", "test")
+    monkeypatch.setenv("SNOWFLAKE_USER", "test")
+    monkeypatch.setenv("SNOWFLAKE_PASSWORD", "test")
+    monkeypatch.setattr("sys.argv", ["snowddl", "-c", str(config_path), *args, "validate"])
+
+    return BaseApp()
+
+
+def test_include_databases_skips_other_databases(monkeypatch, config_path, scanned_paths):
+    app = init_app(monkeypatch, config_path, "--include-databases", "db1")
+
+    assert "db1/sc1/table" in scanned_paths
+    assert "db2/sc1/table" not in scanned_paths
+    assert "db3/sc1/table" not in scanned_paths
+
+    # Database and schema params are parsed for all databases
+    assert sorted(app.config.get_blueprints_by_type(DatabaseBlueprint)) == ["DB1", "DB2", "DB3"]
+    assert sorted(app.config.get_blueprints_by_type(TableBlueprint)) == ["DB1.SC1.TB1"]
+
+
+def test_include_databases_parses_referenced_databases(monkeypatch, config_path, scanned_paths):
+    (config_path / "db1" / "sc1" / "view").mkdir()
+    (config_path / "db1" / "sc1" / "view" / "vw1.yaml").write_text(
+        "text: SELECT * FROM db3.sc1.vw1\ndepends_on:\n  - db3.sc1.vw1\n", encoding="utf-8"
+    )
+
+    (config_path / "db3" / "sc1" / "view").mkdir()
+    (config_path / "db3" / "sc1" / "view" / "vw1.yaml").write_text("text: SELECT * FROM db3.sc1.tb1\n", encoding="utf-8")
+
+    app = init_app(monkeypatch, config_path, "--include-databases", "db1")
+
+    assert "db2/sc1/table" not in scanned_paths
+    assert "db3/sc1/table" in scanned_paths
+
+    assert sorted(app.config.get_blueprints_by_type(ViewBlueprint)) == ["DB1.SC1.VW1", "DB3.SC1.VW1"]
+    assert sorted(app.config.get_blueprints_by_type(TableBlueprint)) == ["DB1.SC1.TB1", "DB3.SC1.TB1"]
+
+
+def test_all_databases_without_include_databases(monkeypatch, config_path, scanned_paths):
+    app = init_app(monkeypatch, config_path)
+
+    assert {"db1/sc1/table", "db2/sc1/table", "db3/sc1/table"} <= set(scanned_paths)
+    assert sorted(app.config.get_blueprints_by_type(TableBlueprint)) == ["DB1.SC1.TB1", "DB2.SC1.TB1", "DB3.SC1.TB1"]
@@ -0,0 +1,152 @@
+from types import SimpleNamespace
+
+from snowddl.blueprint import (
+    AccountObjectIdent,
+    ExternalAccessIntegrationBlueprint,
+    Grant,
+    ObjectType,
+    RoleBlueprint,
+    SchemaObjectIdent,
+)
+from snowddl.config import SnowDDLConfig
+from snowddl.resolver import BusinessRoleResolver
+from snowddl.settings import SnowDDLSettings
+
+
+class StubRoleCache:
+    def __init__(self, grant_rows=()):
+        self.grant_rows = list(grant_rows)
+
+    def get_grant_rows(self, role_name):
+        return self.grant_rows
+
+    def get_future_grant_rows(self, role_name):
+        return []
+
+    def invalidate_role_grants(self, role_name):
+        pass
+
+
+def init_resolver(config=None, grant_rows=()):
+    engine = SimpleNamespace(
+        config=config or SnowDDLConfig(),
+        settings=SnowDDLSettings(),
+        role_cache=StubRoleCache(grant_rows),
+    )
+
+    resolver = BusinessRoleResolver(engine)
+    resolver.applied_grants = []
+
+    # Grants are recorded instead of being executed
+    for method_name in ("create_grants", "drop_grants", "create_future_grants", "drop_future_grants"):
+        setattr(resolver, method_name, lambda role_name, grants, n=method_name: resolver.applied_grants.append((n, grants)))
+
+    resolver.apply_future_grants_to_existing_objects = lambda role_name, grants: None
+
+    return resolver
+
+
+def table_grant(privilege, name):
+    return Grant(privilege=privilege, on=ObjectType.TABLE, name=SchemaObjectIdent("", "DB1", "SC1", name))
+
+
+def integration_grant(object_type, name):
+    return Grant(privilege="USAGE", on=object_type, name=AccountObjectIdent("", name))
+
+
+def role_row(grants):
+    return {"role_name": "TEST_ROLE", "comment": None, "grants": grants, "account_grants": [], "future_grants": []}
+
+
+def test_grant_key_depends_on_object_type():
+    integration = integration_grant(ObjectType.INTEGRATION, "EAI1")
+    external_access_integration = integration_grant(ObjectType.EXTERNAL_ACCESS_INTEGRATION, "EAI1")
+
+    assert integration.key() != external_access_integration.key()
+    assert integration.key() == integration_grant(ObjectType.INTEGRATION, "EAI1").key()
+
+
+def test_compare_grants_preserves_order():
+    resolver = init_resolver()
+
+    bp = RoleBlueprint(
+        full_name=AccountObjectIdent("", "TEST_ROLE"),
+        grants=[
+            table_grant("SELECT", "TB5"),
+            table_grant("SELECT", "TB1"),
+            table_grant("INSERT", "TB4"),
+            table_grant("SELECT", "TB3"),
+        ],
+    )
+
+    existing_grants = [
+        table_grant("SELECT", "TB6"),
+        table_grant("SELECT", "TB1"),
+        table_grant("INSERT", "TB2"),
+        table_grant("SELECT", "TB3"),
+        table_grant("UPDATE", "TB0"),
+    ]
+
+    resolver.compare_object(bp, role_row(existing_grants))
+    applied_grants = dict(resolver.applied_grants)
+
+    assert applied_grants["create_grants"] == [table_grant("SELECT", "TB5"), table_grant("INSERT", "TB4")]
+    assert applied_grants["drop_grants"] == [
+        table_grant("SELECT", "TB6"),
+        table_grant("INSERT", "TB2"),
+        table_grant("UPDATE", "TB0"),
+    ]
+
+
+def test_compare_grants_on_integration_types():
+    resolver = init_resolver()
+
+    bp = RoleBlueprint(
+        full_name=AccountObjectIdent("", "TEST_ROLE"),
+        grants=[integration_grant(ObjectType.EXTERNAL_ACCESS_INTEGRATION, "EAI1")],
+    )
+
+    # Grant reported as INTEGRATION and not restored from config is not the same grant
+    resolver.compare_object(bp, role_row([integration_grant(ObjectType.INTEGRATION, "EAI1")]))
+    applied_grants = dict(resolver.applied_grants)
+
+    # Grant equality ignores difference between these types, so keys are compared
+    assert [g.key() for g in applied_grants["create_grants"]] == [("USAGE", ObjectType.EXTERNAL_ACCESS_INTEGRATION, "EAI1")]
+    assert [g.key() for g in applied_grants["drop_grants"]] == [("USAGE", ObjectType.INTEGRATION, "EAI1")]
+
+
+def test_existing_integration_grants_are_restored_from_config():
+    config = SnowDDLConfig()
+    config.add_blueprint(
+        ExternalAccessIntegrationBlueprint(full_name=AccountObjectIdent("", "EAI1"), allowed_network_rules=[])
+    )
+
+    resolver = init_resolver(
+        config,
+        [
+            {"privilege": "USAGE", "granted_on": "INTEGRATION", "name": "EAI1"},
+            {"privilege": "USAGE", "granted_on": "INTEGRATION", "name": "API1"},
+        ],
+    )
+
+    _, grants, _, _ = resolver.get_existing_role_grants("TEST_ROLE")
+
+    assert [g.key() for g in grants] == [
+        ("USAGE", ObjectType.INTEGRATION, "API1"),
+        ("USAGE", ObjectType.EXTERNAL_ACCESS_INTEGRATION, "EAI1"),
+    ]
+
+    # Existing grant restored from config matches blueprint grant, nothing is changed
+    bp = RoleBlueprint(
+        full_name=AccountObjectIdent("", "TEST_ROLE"),
+        grants=[
+            integration_grant(ObjectType.EXTERNAL_ACCESS_INTEGRATION, "EAI1"),
+            integration_grant(ObjectType.INTEGRATION, "API1"),
+        ],
+    )
+
+    resolver.compare_object(bp, role_row(grants))
+    applied_grants = dict(resolver.applied_grants)
+
+    assert applied_grants["create_grants"] == []
+    assert applied_grants["drop_grants"] == []
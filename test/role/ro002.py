@@ -0,0 +1,193 @@
+from json import dumps
+from types import SimpleNamespace
+
+from snowflake.connector.errors import ProgrammingError
+
+from snowddl.blueprint import AccountObjectIdent, DatabaseIdent, Grant, ObjectType, SchemaObjectIdent
+from snowddl.config import SnowDDLConfig
+from snowddl.engine import SnowDDLEngine
+from snowddl.error import SnowDDLExecuteError
+from snowddl.resolver import BusinessRoleResolver
+from snowddl.settings import SnowDDLSettings
+
+
+class StubCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.rows = []
+        self.rowcount = 0
+
+    def execute(self, sql, file_stream=None, num_statements=None):
+        self.connection.requests.append(sql)
+
+        if "CURRENT_ACCOUNT()" in sql:
+            self.rows = [self.connection.context_row]
+        elif any(privilege in sql for privilege in self.connection.failing_privileges):
+            raise ProgrammingError(msg=f"Insufficient privileges: {sql}")
+        else:
+            self.rows = []
+
+        self.rowcount = len(self.rows)
+
+        return self
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class StubConnection:
+    def __init__(self, failing_privileges=()):
+        self.failing_privileges = failing_privileges
+        self.requests = []
+
+        self.context_row = {
+            "CURRENT_ACCOUNT": "TEST",
+            "CURRENT_REGION": "TEST",
+            "CURRENT_SESSION": "1",
+            "CURRENT_USER": "TEST_USER",
+            "CURRENT_ROLE": "SYSADMIN",
+            "CURRENT_WAREHOUSE": "TEST_WH",
+            "IS_ACCOUNT_ADMIN": True,
+            "IS_SYS_ADMIN": True,
+            "IS_SECURITY_ADMIN": True,
+            "BOOTSTRAP_ACCOUNT": dumps({"serverVersion": "1.0.0", "accountInfo": {"serviceLevelName": "ENTERPRISE"}}),
+        }
+
+    def cursor(self, cursor_class=None):
+        return StubCursor(self)
+
+    def is_closed(self):
+        return False
+
+    def is_valid(self):
+        return True
+
+
+def init_resolver():
+    engine = SimpleNamespace(config=SnowDDLConfig(), settings=SnowDDLSettings())
+
+    return BusinessRoleResolver(engine)
+
+
+def init_engine(failing_privileges=(), **settings):
+    settings = SnowDDLSettings(execute_safe_ddl=True, **settings)
+    connection = StubConnection(failing_privileges)
+
+    return SnowDDLEngine(connection, SnowDDLConfig(), settings), connection
+
+
+def grant(privilege, on, name):
+    if on in (ObjectType.TABLE, ObjectType.STAGE):
+        return Grant(privilege=privilege, on=on, name=SchemaObjectIdent("", "DB1", "SC1", name))
+
+    if on == ObjectType.DATABASE:
+        return Grant(privilege=privilege, on=on, name=DatabaseIdent("", name))
+
+    return Grant(privilege=privilege, on=on, name=AccountObjectIdent("", name))
+
+
+def describe_groups(groups):
+    return [[(g.privilege, str(g.name)) for g in group] for group in groups]
+
+
+def test_coalesce_grants_keeps_order_of_first_appearance():
+    resolver = init_resolver()
+
+    grants = [
+        grant("SELECT", ObjectType.TABLE, "TB2"),
+        grant("SELECT", ObjectType.TABLE, "TB1"),
+        grant("INSERT", ObjectType.TABLE, "TB2"),
+        grant("USAGE", ObjectType.DATABASE, "DB1"),
+        grant("UPDATE", ObjectType.TABLE, "TB2"),
+        grant("INSERT", ObjectType.TABLE, "TB1"),
+    ]
+
+    groups = resolver.coalesce_grants(grants, resolver.get_coalesced_grant_key)
+
+    assert describe_groups(groups) == [
+        [("SELECT", "DB1.SC1.TB2"), ("INSERT", "DB1.SC1.TB2"), ("UPDATE", "DB1.SC1.TB2")],
+        [("SELECT", "DB1.SC1.TB1"), ("INSERT", "DB1.SC1.TB1")],
+        [("USAGE", "DB1")],
+    ]
+
+
+def test_coalesce_grants_excludes_ownership_stage_and_role():
+    resolver = init_resolver()
+
+    grants = [
+        grant("OWNERSHIP", ObjectType.TABLE, "TB1"),
+        grant("SELECT", ObjectType.TABLE, "TB1"),
+        grant("READ", ObjectType.STAGE, "ST1"),
+        grant("WRITE", ObjectType.STAGE, "ST1"),
+        grant("USAGE", ObjectType.ROLE, "ROLE1"),
+        grant("USAGE", ObjectType.ROLE, "ROLE2"),
+        grant("INSERT", ObjectType.TABLE, "TB1"),
+    ]
+
+    groups = resolver.coalesce_grants(grants, resolver.get_coalesced_grant_key)
+
+    assert describe_groups(groups) == [
+        [("OWNERSHIP", "DB1.SC1.TB1")],
+        [("SELECT", "DB1.SC1.TB1"), ("INSERT", "DB1.SC1.TB1")],
+        [("READ", "DB1.SC1.ST1")],
+        [("WRITE", "DB1.SC1.ST1")],
+        [("USAGE", "ROLE1")],
+        [("USAGE", "ROLE2")],
+    ]
+
+
+def test_failed_coalesced_grant_is_expanded_by_privilege():
+    engine, connection = init_engine(failing_privileges=("TRUNCATE",), max_statements_per_request=10)
+    resolver = BusinessRoleResolver(engine)
+
+    resolver.create_grants(
+        AccountObjectIdent("", "TEST_ROLE"),
+        [
+            grant("SELECT", ObjectType.TABLE, "TB1"),
+            grant("TRUNCATE", ObjectType.TABLE, "TB1"),
+            grant("INSERT", ObjectType.TABLE, "TB1"),
+        ],
+    )
+
+    errors = engine.complete_deferred_queries({"TEST_ROLE": engine.pop_deferred_queries()})
+    engine.flush_thread_buffers()
+
+    assert 'GRANT SELECT, TRUNCATE, INSERT ON TABLE "DB1"."SC1"."TB1" TO ROLE "TEST_ROLE"' in connection.requests
+
+    assert isinstance(errors["TEST_ROLE"], SnowDDLExecuteError)
+    assert "TRUNCATE" in str(errors["TEST_ROLE"])
+
+    assert engine.executed_ddl == [
+        'GRANT SELECT ON TABLE "DB1"."SC1"."TB1" TO ROLE "TEST_ROLE"',
+        'GRANT INSERT ON TABLE "DB1"."SC1"."TB1" TO ROLE "TEST_ROLE"',
+    ]
+
+
+def test_failed_coalesced_grant_is_expanded_by_privilege_synchronously():
+    engine, connection = init_engine(failing_privileges=("TRUNCATE",))
+    resolver = BusinessRoleResolver(engine)
+
+    try:
+        resolver.create_grants(
+            AccountObjectIdent("", "TEST_ROLE"),
+            [
+                grant("SELECT", ObjectType.TABLE, "TB1"),
+                grant("TRUNCATE", ObjectType.TABLE, "TB1"),
+                grant("INSERT", ObjectType.TABLE, "TB1"),
+            ],
+        )
+    except SnowDDLExecuteError as e:
+        assert 'GRANT SELECT, TRUNCATE, INSERT ON TABLE "DB1"."SC1"."TB1" TO ROLE "TEST_ROLE"' in connection.requests
+        assert "TRUNCATE" in str(e)
+    else:
+        assert False, "Expected SnowDDLExecuteError"
+
+    engine.flush_thread_buffers()
+
+    assert engine.executed_ddl == [
+        'GRANT SELECT ON TABLE "DB1"."SC1"."TB1" TO ROLE "TEST_ROLE"',
+        'GRANT INSERT ON TABLE "DB1"."SC1"."TB1" TO ROLE "TEST_ROLE"',
+    ]
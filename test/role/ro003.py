@@ -0,0 +1,135 @@
+from logging import getLogger
+from types import SimpleNamespace
+
+from snowddl.blueprint import AccountObjectIdent, Grant, ObjectType, RoleBlueprint, SchemaObjectIdent
+from snowddl.cache import RoleGraphCache
+from snowddl.config import SnowDDLConfig
+from snowddl.resolver import BusinessRoleResolver
+from snowddl.settings import SnowDDLSettings
+
+
+def table_grant(privilege, name):
+    return Grant(privilege=privilege, on=ObjectType.TABLE, name=SchemaObjectIdent("", "DB1", "SC1", name))
+
+
+def role_grant(name):
+    return Grant(privilege="USAGE", on=ObjectType.ROLE, name=AccountObjectIdent("", name))
+
+
+def role_bp(name, grants):
+    return RoleBlueprint(full_name=AccountObjectIdent("", name), grants=grants)
+
+
+def init_graph(*blueprints):
+    graph = RoleGraphCache(None)
+    graph.add_roles({str(bp.full_name): bp for bp in blueprints}, {})
+
+    return graph
+
+
+def describe_redundant_grants(redundant_grants):
+    return [(g.privilege, str(g.name), implied_by) for g, implied_by in redundant_grants]
+
+
+def test_object_grant_implied_by_inherited_role():
+    graph = init_graph(
+        role_bp("R1", [table_grant("SELECT", "TB1")]),
+        role_bp("R2", [role_grant("R1")]),
+    )
+
+    remaining_grants, redundant_grants = graph.split_redundant_grants(
+        role_bp("R3", [table_grant("SELECT", "TB1"), table_grant("INSERT", "TB1"), role_grant("R2")])
+    )
+
+    assert remaining_grants == [table_grant("INSERT", "TB1"), role_grant("R2")]
+    assert describe_redundant_grants(redundant_grants) == [("SELECT", "DB1.SC1.TB1", "R2")]
+
+
+def test_role_grant_implied_by_inherited_role():
+    graph = init_graph(
+        role_bp("R1", []),
+        role_bp("R2", [role_grant("R1")]),
+    )
+
+    remaining_grants, redundant_grants = graph.split_redundant_grants(role_bp("R3", [role_grant("R1"), role_grant("R2")]))
+
+    assert remaining_grants == [role_grant("R2")]
+    assert describe_redundant_grants(redundant_grants) == [("USAGE", "R1", "R2")]
+
+
+def test_ownership_is_never_redundant():
+    graph = init_graph(role_bp("R1", [table_grant("OWNERSHIP", "TB1")]))
+
+    remaining_grants, redundant_grants = graph.split_redundant_grants(
+        role_bp("R2", [table_grant("OWNERSHIP", "TB1"), role_grant("R1")])
+    )
+
+    assert remaining_grants == [table_grant("OWNERSHIP", "TB1"), role_grant("R1")]
+    assert redundant_grants == []
+
+
+def test_mutually_implied_grants_are_not_dropped_together():
+    # Config may contain cycles, each role of cycle implies another one
+    graph = init_graph(
+        role_bp("R1", [role_grant("R2")]),
+        role_bp("R2", [role_grant("R1")]),
+    )
+
+    remaining_grants, redundant_grants = graph.split_redundant_grants(role_bp("R3", [role_grant("R1"), role_grant("R2")]))
+
+    assert remaining_grants == [role_grant("R2")]
+    assert describe_redundant_grants(redundant_grants) == [("USAGE", "R1", "R2")]
+
+
+def test_grant_implied_through_cycle_back_to_same_role_is_kept():
+    graph = init_graph(role_bp("R1", [role_grant("R2")]))
+
+    remaining_grants, redundant_grants = graph.split_redundant_grants(
+        role_bp("R2", [table_grant("SELECT", "TB1"), role_grant("R1")])
+    )
+
+    assert remaining_grants == [table_grant("SELECT", "TB1"), role_grant("R1")]
+    assert redundant_grants == []
+
+
+def test_minimize_role_grants_skips_new_grants_only():
+    graph = init_graph(role_bp("R1", [table_grant("SELECT", "TB1"), table_grant("SELECT", "TB2")]))
+
+    engine = SimpleNamespace(
+        config=SnowDDLConfig(),
+        settings=SnowDDLSettings(analyze_role_graph=True, minimize_role_grants=True),
+        role_cache=SimpleNamespace(invalidate_role_grants=lambda role_name: None),
+        role_graph_cache=graph,
+        logger=getLogger(__name__),
+    )
+
+    resolver = BusinessRoleResolver(engine)
+    resolver.applied_grants = []
+
+    # Grants are recorded instead of being executed
+    for method_name in ("create_grants", "drop_grants", "create_future_grants", "drop_future_grants"):
+        setattr(resolver, method_name, lambda role_name, grants, n=method_name: resolver.applied_grants.append((n, grants)))
+
+    resolver.apply_future_grants_to_existing_objects = lambda role_name, grants: None
+
+    bp = role_bp("R2", [table_grant("SELECT", "TB1"), table_grant("SELECT", "TB2"), table_grant("INSERT", "TB1"), role_grant("R1")])
+    resolver.blueprints = {str(bp.full_name): bp}
+    resolver._pre_process()
+
+    # Redundant grant on TB1 already exists and is kept, redundant grant on TB2 is not created
+    row = {
+        "role_name": "R2",
+        "comment": None,
+        "grants": [table_grant("SELECT", "TB1"), role_grant("R1")],
+        "account_grants": [],
+        "future_grants": [],
+    }
+
+    resolver.compare_object(resolver.blueprints["R2"], row)
+    applied_grants = dict(resolver.applied_grants)
+
+    assert applied_grants["drop_grants"] == []
+    assert applied_grants["create_grants"] == [table_grant("INSERT", "TB1")]
+
+    assert graph.get_stats()["redundant_grants"] == 2
+    assert graph.get_stats()["skipped_grants"] == 1
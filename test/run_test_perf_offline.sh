@@ -0,0 +1,24 @@
+#!/bin/sh
+
+# Offline version of performance test, does not require Snowflake account
+# Optional environment variables:
+# - SNOWDDL_FAKE_LATENCY (simulated latency of each query in seconds)
+
+cd "${0%/*}"
+
+FAKE_CATALOG="${TMPDIR:-/tmp}/snowddl_perf_fake_catalog.pickle"
+FAKE_OPTIONS="--env-prefix=perf --fake-catalog=${FAKE_CATALOG} --fake-latency=${SNOWDDL_FAKE_LATENCY:-0}"
+
+rm -f "${FAKE_CATALOG}"
+
+# Apply step1
+python _fake/snowddl_fake.py -c _config/perf_step1 ${FAKE_OPTIONS} --apply-unsafe --show-timers apply
+
+# Apply step2
+python _fake/snowddl_fake.py -c _config/perf_step2 ${FAKE_OPTIONS} --apply-unsafe --show-timers apply
+
+# Apply step3
+python _fake/snowddl_fake.py -c _config/perf_step3 ${FAKE_OPTIONS} --apply-unsafe --show-timers apply
+
+# Cleanup after
+rm -f "${FAKE_CATALOG}"
@@ -0,0 +1,48 @@
+from pathlib import Path
+from pytest import mark, raises
+from yaml import load
+
+from snowddl.parser._yaml import SnowDDLCLoader, SnowDDLPythonLoader
+
+
+config_paths = [
+    Path(__file__).parent.parent.parent / "snowddl" / "_config",
+    Path(__file__).parent.parent / "_config",
+]
+
+yaml_paths = sorted(p for config_path in config_paths for p in config_path.rglob("*") if p.suffix in (".yml", ".yaml"))
+
+skip_without_libyaml = mark.skipif(SnowDDLCLoader is None, reason="PyYAML was built without libyaml")
+
+
+def load_file(path: Path, loader_cls):
+    with path.open("r", encoding="utf-8") as f:
+        return load(f, Loader=loader_cls)
+
+
+@skip_without_libyaml
+@mark.parametrize("path", yaml_paths, ids=str)
+def test_loader_parity(path):
+    assert load_file(path, SnowDDLCLoader) == load_file(path, SnowDDLPythonLoader)
+
+
+@skip_without_libyaml
+@mark.parametrize("loader_cls", [SnowDDLCLoader, SnowDDLPythonLoader])
+def test_loader_tags(tmp_path, loader_cls):
+    (tmp_path / "body.sql").write_text("SELECT 1", encoding="utf-8")
+
+    (tmp_path / "include.yaml").write_text("body: !include body.sql\n", encoding="utf-8")
+    (tmp_path / "missing.yaml").write_text("body: !include missing.sql\n", encoding="utf-8")
+    (tmp_path / "encrypt.yaml").write_text("password: !encrypt secret\n", encoding="utf-8")
+
+    assert load_file(tmp_path / "include.yaml", loader_cls) == {"body": "SELECT 1"}
+
+    with raises(ValueError, match="does not exist"):
+        load_file(tmp_path / "missing.yaml", loader_cls)
+
+    with raises(ValueError, match="non-encrypted value"):
+        load_file(tmp_path / "encrypt.yaml", loader_cls)
+
+    # !include is not allowed in non-file streams
+    with raises(ValueError, match="non-file stream"):
+        load("body: !include body.sql\n", Loader=loader_cls)